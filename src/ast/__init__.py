@@ -32,6 +32,8 @@ from .visitor import (
 from .hashing import (
     NodeHasher,
     hash_tree,
+    rehash_node,
+    invalidate_hash,
 )
 
 __all__ = [
@@ -56,4 +58,6 @@ __all__ = [
     # Hashing
     "NodeHasher",
     "hash_tree",
+    "rehash_node",
+    "invalidate_hash",
 ]
@@ -10,13 +10,32 @@ This module computes content-based hashes for each AST node, enabling:
 
 import hashlib
 import json
+from functools import partial
 from typing import Any, Dict
 from .node import ASTNode
 
+try:
+    import blake3 as _blake3
+except ImportError:  # blake3 is optional; SHA-256 from hashlib is the fallback
+    _blake3 = None
+
+# BLAKE3 when the blake3 package is installed, SHA-256 otherwise. Hashes are
+# also sent to clients in FULL_AST and diff payloads, which compare them
+# against hashes from the same server run: the choice only has to be stable
+# for the server's lifetime, but a client must not compare hashes across
+# servers that may have used different algorithms.
+DEFAULT_ALGORITHM = "blake3" if _blake3 is not None else "sha256"
+
+# Attribute encoding dominates hashing time; reusing one encoder skips the
+# per-call JSONEncoder construction json.dumps does for non-default options.
+# Output is identical to json.dumps(..., sort_keys=True, default=str).
+_encode_attributes = json.JSONEncoder(sort_keys=True, default=str).encode
+
 
 class NodeHasher:
     """
-    Computes SHA-256 hashes for AST nodes.
+    Computes content hashes for AST nodes (BLAKE3 or SHA-256 by default,
+    see DEFAULT_ALGORITHM).
 
     The hash is computed from:
     - Node type
@@ -24,14 +43,23 @@ class NodeHasher:
     - Hashes of all children (for incremental hashing)
     """
 
-    def __init__(self, algorithm: str = "sha256"):
+    def __init__(self, algorithm: str = DEFAULT_ALGORITHM):
         """
         Initialize the hasher.
 
         Args:
-            algorithm: Hash algorithm to use (default: sha256)
+            algorithm: Hash algorithm to use: "blake3" or any hashlib name
+                (default: blake3 if installed, otherwise sha256)
         """
         self.algorithm = algorithm
+        if algorithm == "blake3" and _blake3 is not None:
+            self._new_hash = _blake3.blake3
+        elif algorithm in hashlib.algorithms_guaranteed:
+            # The named constructors (hashlib.sha256, ...) skip the name
+            # lookup hashlib.new repeats on every call
+            self._new_hash = getattr(hashlib, algorithm)
+        else:
+            self._new_hash = partial(hashlib.new, algorithm)
 
     def hash_node(self, node: ASTNode, recursive: bool = True) -> str:
         """
@@ -45,10 +73,18 @@ class NodeHasher:
             Hexadecimal hash string
         """
         if recursive:
-            # First hash all children
-            for child in node.children:
-                if child.hash is None:
-                    child.hash = self.hash_node(child, recursive=True)
+            # Hash unhashed descendants bottom-up with an explicit stack, so
+            # deep or wide trees cost no Python recursion per node
+            compute = self._compute_hash
+            pending = [child for child in node.children if child.hash is None]
+            ordered = []
+            while pending:
+                current = pending.pop()
+                ordered.append(current)
+                pending.extend(child for child in current.children if child.hash is None)
+            # Reversed pre-order visits every child before its parent
+            for current in reversed(ordered):
+                current.hash = compute(current)
 
         # Compute hash for this node
         node.hash = self._compute_hash(node)
@@ -64,25 +100,13 @@ class NodeHasher:
         - Attributes (sorted for consistency)
         - Child hashes (not full child content)
         """
-        hasher = hashlib.new(self.algorithm)
-
-        # Include node type
-        hasher.update(node.node_type.value.encode('utf-8'))
-
-        # Include node ID
-        if node.id:
-            hasher.update(node.id.encode('utf-8'))
-
-        # Include attributes (sorted for deterministic hashing)
-        attrs_str = self._serialize_attributes(node.attributes)
-        hasher.update(attrs_str.encode('utf-8'))
+        # Node type, node ID, attributes (sorted for deterministic hashing),
+        # then child hashes (not full content - this is what makes it
+        # incremental), fed to the hash function in a single update
+        parts = [node.node_type.value, node.id or "", self._serialize_attributes(node.attributes)]
+        parts.extend(child.hash for child in node.children if child.hash)
 
-        # Include child hashes (not full content - this is what makes it incremental)
-        for child in node.children:
-            if child.hash:
-                hasher.update(child.hash.encode('utf-8'))
-
-        return hasher.hexdigest()
+        return self._new_hash("".join(parts).encode('utf-8')).hexdigest()
 
     def _serialize_attributes(self, attributes: Dict[str, Any]) -> str:
         """
@@ -92,7 +116,7 @@ class NodeHasher:
         """
         # Filter out None values and sort keys
         filtered = {k: v for k, v in attributes.items() if v is not None}
-        return json.dumps(filtered, sort_keys=True, default=str)
+        return _encode_attributes(filtered)
 
     def verify_hash(self, node: ASTNode) -> bool:
         """
@@ -122,9 +146,12 @@ class NodeHasher:
         # Recompute this node's hash
         node.hash = self._compute_hash(node)
 
-        # Propagate up to parent
-        if propagate_up and node.parent:
-            self.update_hash(node.parent, propagate_up=True)
+        # Propagate up through the ancestors
+        if propagate_up:
+            current = node.parent
+            while current is not None:
+                current.hash = self._compute_hash(current)
+                current = current.parent
 
         return node.hash
 
@@ -182,7 +209,7 @@ class NodeHasher:
                 )
 
 
-def hash_tree(root: ASTNode, algorithm: str = "sha256") -> ASTNode:
+def hash_tree(root: ASTNode, algorithm: str = DEFAULT_ALGORITHM) -> ASTNode:
     """
     Convenience function to hash an entire AST tree.
 
@@ -196,3 +223,42 @@ def hash_tree(root: ASTNode, algorithm: str = "sha256") -> ASTNode:
     hasher = NodeHasher(algorithm=algorithm)
     hasher.hash_node(root, recursive=True)
     return root
+
+
+def rehash_node(node: ASTNode, algorithm: str = DEFAULT_ALGORITHM) -> ASTNode:
+    """
+    Rehash a modified node and its ancestors up to the root.
+
+    Descendants of the node and of its ancestors without a hash (newly
+    added, or cleared by invalidate_hash) are hashed as well; every other
+    subtree keeps its hash, so the cost grows with the depth of the node
+    rather than the size of the tree. Requires parent references to be set
+    along the path.
+
+    Args:
+        node: The node whose attributes or children changed
+        algorithm: Hash algorithm to use
+
+    Returns:
+        The node (with its own and its ancestors' hashes updated)
+    """
+    hasher = NodeHasher(algorithm=algorithm)
+    current = node
+    while current is not None:
+        hasher.hash_node(current, recursive=True)
+        current = current.parent
+    return node
+
+
+def invalidate_hash(node: ASTNode) -> None:
+    """
+    Clear the hashes of a node and its ancestors without recomputing them.
+
+    For changes whose rehash is deferred: nothing can match or cache the
+    node by a hash that no longer describes it, and the next rehash_node
+    or hash_tree call on the node or any ancestor recomputes them.
+    """
+    current = node
+    while current is not None:
+        current.hash = None
+        current = current.parent
@@ -24,13 +24,17 @@ class NodeType(Enum):
     PARAMETER = "parameter"
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTNode:
     """
     Base class for all AST nodes.
 
     Each node represents a conceptual element in an Ableton Live project
     and maintains parent-child relationships for tree traversal.
+
+    Nodes use __slots__ (subclasses declare an empty ``__slots__``), so
+    there is no per-instance ``__dict__``; node data beyond the fields
+    below belongs in ``attributes``.
     """
     node_type: NodeType
     id: Optional[str] = None
@@ -68,6 +72,8 @@ class ASTNode:
 class ProjectNode(ASTNode):
     """Root node representing the entire Ableton Live project."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(node_type=NodeType.PROJECT, **kwargs)
         self.attributes['version'] = None
@@ -78,6 +84,8 @@ class ProjectNode(ASTNode):
 class TrackNode(ASTNode):
     """Node representing an audio or MIDI track."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, index: int, **kwargs):
         super().__init__(node_type=NodeType.TRACK, **kwargs)
         self.attributes['name'] = name
@@ -92,6 +100,8 @@ class TrackNode(ASTNode):
 class DeviceNode(ASTNode):
     """Node representing a device (instrument or effect) on a track."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, device_type: str, **kwargs):
         super().__init__(node_type=NodeType.DEVICE, **kwargs)
         self.attributes['name'] = name
@@ -103,6 +113,8 @@ class DeviceNode(ASTNode):
 class ClipSlotNode(ASTNode):
     """Node representing a clip slot in the session view (track × scene grid)."""
 
+    __slots__ = ()
+
     def __init__(self, track_index: int, scene_index: int, **kwargs):
         super().__init__(node_type=NodeType.CLIP_SLOT, **kwargs)
         self.attributes['track_index'] = track_index
@@ -120,6 +132,8 @@ class ClipSlotNode(ASTNode):
 class ClipNode(ASTNode):
     """Node representing a MIDI or audio clip."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, clip_type: str, **kwargs):
         super().__init__(node_type=NodeType.CLIP, **kwargs)
         self.attributes['name'] = name
@@ -135,6 +149,8 @@ class ClipNode(ASTNode):
 class FileRefNode(ASTNode):
     """Node representing a reference to an external file (samples, etc.)."""
 
+    __slots__ = ()
+
     def __init__(self, name: Optional[str], path: Optional[str], hash_val: Optional[str], ref_type: str, **kwargs):
         super().__init__(node_type=NodeType.FILE_REF, **kwargs)
         self.attributes['name'] = name
@@ -147,6 +163,8 @@ class FileRefNode(ASTNode):
 class SceneNode(ASTNode):
     """Node representing a scene (horizontal row in session view)."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, index: int, **kwargs):
         super().__init__(node_type=NodeType.SCENE, **kwargs)
         self.attributes['name'] = name
@@ -158,6 +176,8 @@ class SceneNode(ASTNode):
 class MixerNode(ASTNode):
     """Node representing mixer settings for a track."""
 
+    __slots__ = ()
+
     def __init__(self, volume: float = 1.0, pan: float = 0.0, **kwargs):
         super().__init__(node_type=NodeType.MIXER, **kwargs)
         self.attributes['volume'] = volume
@@ -170,6 +190,8 @@ class MixerNode(ASTNode):
 class ParameterNode(ASTNode):
     """Node representing an automatable parameter."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, value: Any, **kwargs):
         super().__init__(node_type=NodeType.PARAMETER, **kwargs)
         self.attributes['name'] = name
@@ -8,10 +8,23 @@ This module provides:
 - Pretty printing for debugging
 """
 
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Callable
 from .node import ASTNode, NodeType
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Upper bound on serializations kept by a cache_by_hash SerializationVisitor.
+# Live edits leave the old dicts of every changed node and its ancestors
+# behind; beyond this size the least recently used entries are evicted. It
+# has to exceed the node count of a large project (a 200-track set is ~11k
+# nodes), or every full serialization evicts entries before they are reused.
+_SERIALIZATION_CACHE_SIZE = 50_000
+
 
 class ASTVisitor:
     """
@@ -59,11 +72,47 @@ class ASTVisitor:
 
 
 class SerializationVisitor(ASTVisitor):
-    """Visitor that serializes AST to JSON-compatible dict structure."""
+    """
+    Visitor that serializes AST to JSON-compatible dict structure.
+
+    With cache_by_hash, visit() reuses the dict serialized for any node with
+    the same hash, since equal hashes mean equal type, ID, attributes and
+    children. Cached dicts are shared between results and must be treated
+    as read-only; call clear_cache() when the tree is replaced. The cache
+    holds at most _SERIALIZATION_CACHE_SIZE entries and evicts the least
+    recently used. A hit on a subtree skips its descendants, so their
+    entries may age out while the subtree's own entry stays cached.
+    """
 
-    def __init__(self, include_hash: bool = True, include_parent_ref: bool = False):
+    def __init__(self, include_hash: bool = True, include_parent_ref: bool = False,
+                 cache_by_hash: bool = False):
         self.include_hash = include_hash
         self.include_parent_ref = include_parent_ref
+        # parent_id is not covered by the hash, so it disables the cache
+        self.cache_by_hash = cache_by_hash and not include_parent_ref
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def visit(self, node: ASTNode) -> Any:
+        """Serialize a node, reusing the cached result for its hash if enabled."""
+        key = node.hash
+        if not self.cache_by_hash or key is None:
+            return super().visit(node)
+
+        cache = self._cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+
+        result = super().visit(node)
+        cache[key] = result
+        if len(cache) > _SERIALIZATION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop all cached serializations."""
+        self._cache.clear()
 
     def generic_visit(self, node: ASTNode) -> Dict[str, Any]:
         """Serialize a node to a dictionary."""
@@ -82,9 +131,117 @@ class SerializationVisitor(ASTVisitor):
 
         return result
 
-    def to_json(self, node: ASTNode, indent: int = 2) -> str:
-        """Serialize AST to JSON string."""
-        return json.dumps(self.visit(node), indent=indent)
+    def to_dict(self, node: ASTNode) -> Dict[str, Any]:
+        """Serialize AST to a JSON-compatible dict."""
+        return self.visit(node)
+
+    def to_json(self, node: ASTNode, indent: Optional[int] = 2) -> str:
+        """
+        Serialize AST to JSON string.
+
+        Uses orjson when it is installed and the indent is one it supports
+        (None or 2), otherwise the stdlib encoder. The plain visitor skips
+        the to_dict() copy: orjson encodes a lightweight view that shares
+        each node's attributes dict, and the stdlib path writes JSON text
+        straight from the nodes. Subclasses that override visit methods
+        are serialized through to_dict() so their output is honoured.
+        """
+        if type(self) is not SerializationVisitor:
+            data = self.to_dict(node)
+            if orjson is not None and indent in (None, 2):
+                return orjson.dumps(data, option=self._orjson_option(indent)).decode("utf-8")
+            return json.dumps(data, indent=indent)
+
+        if orjson is not None and indent in (None, 2):
+            return orjson.dumps(self._json_view(node), option=self._orjson_option(indent)).decode("utf-8")
+
+        if indent is not None and not isinstance(indent, int):
+            return json.dumps(self.to_dict(node), indent=indent)
+
+        parts: List[str] = []
+        self._write_json(node, parts, json.JSONEncoder(indent=indent).encode, indent, "")
+        return "".join(parts)
+
+    @staticmethod
+    def _orjson_option(indent: Optional[int]) -> int:
+        """orjson options matching the stdlib output for the given indent."""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _json_view(self, node: ASTNode) -> Dict[str, Any]:
+        """Like generic_visit, but shares attribute dicts instead of copying them."""
+        result = {
+            "node_type": node.node_type.value,
+            "id": node.id,
+            "attributes": node.attributes,
+            "children": [self._json_view(child) for child in node.children],
+        }
+
+        if self.include_hash and node.hash:
+            result["hash"] = node.hash
+
+        if self.include_parent_ref and node.parent:
+            result["parent_id"] = node.parent.id
+
+        return result
+
+    def _write_json(self, node: ASTNode, parts: List[str], encode: Callable[[Any], str],
+                    indent: Optional[int], pad: str) -> None:
+        """
+        Append the JSON text for a node to parts.
+
+        Produces exactly what json.dumps(self.to_dict(node), indent=indent)
+        would. Nested attribute values are re-indented by replacing
+        newlines, which is safe because JSON strings escape them.
+        """
+        w = parts.append
+        if indent is None:
+            sep, open_children, child_sep, close_children = ", ", "[", ", ", "]"
+            open_node, close_node, child_pad = "{", "}", pad
+        else:
+            inner = pad + " " * indent
+            child_pad = inner + " " * indent
+            sep = ",\n" + inner
+            open_node, close_node = "{\n" + inner, "\n" + pad + "}"
+            open_children, child_sep, close_children = "[\n" + child_pad, ",\n" + child_pad, "\n" + inner + "]"
+
+        w(open_node)
+        w('"node_type": ')
+        w(encode(node.node_type.value))
+        w(sep)
+        w('"id": ')
+        w(encode(node.id))
+        w(sep)
+        w('"attributes": ')
+        attributes = encode(node.attributes)
+        w(attributes if indent is None else attributes.replace("\n", "\n" + inner))
+        w(sep)
+        w('"children": ')
+        if node.children:
+            w(open_children)
+            first = True
+            for child in node.children:
+                if not first:
+                    w(child_sep)
+                first = False
+                self._write_json(child, parts, encode, indent, child_pad)
+            w(close_children)
+        else:
+            w("[]")
+
+        if self.include_hash and node.hash:
+            w(sep)
+            w('"hash": ')
+            w(encode(node.hash))
+
+        if self.include_parent_ref and node.parent:
+            w(sep)
+            w('"parent_id": ')
+            w(encode(node.parent.id))
+
+        w(close_node)
 
 
 class DiffVisitor(ASTVisitor):
@@ -92,6 +249,8 @@ class DiffVisitor(ASTVisitor):
     Visitor that computes differences between two AST trees.
 
     Returns a list of changes: additions, deletions, and modifications.
+    Subtrees whose hashes match on both sides are skipped, so both trees
+    should be hashed (see ``hash_tree``) for the diff to be cheap.
     """
 
     def __init__(self):
@@ -141,6 +300,11 @@ class DiffVisitor(ASTVisitor):
 
         # Both exist - check for modifications
         if old is not None and new is not None:
+            # Merkle hashes cover type, id, attributes and all descendants,
+            # so an equal hash means the whole subtree is unchanged
+            if old.hash is not None and old.hash == new.hash:
+                return
+
             # Check if attributes changed
             if old.attributes != new.attributes:
                 self.changes.append({
@@ -220,32 +384,55 @@ class PrettyPrintVisitor(ASTVisitor):
 
 
 class SearchVisitor(ASTVisitor):
-    """Visitor for searching nodes by various criteria."""
+    """
+    Visitor for searching nodes by various criteria.
+
+    Searches walk the tree with an explicit stack instead of recursing, and
+    visit nodes in pre-order (parents before children, children in order).
+    """
 
     def find_by_id(self, root: ASTNode, node_id: str) -> Optional[ASTNode]:
         """Find a node by its ID."""
-        if root.id == node_id:
-            return root
-        for child in root.children:
-            result = self.find_by_id(child, node_id)
-            if result:
-                return result
+        stack = [root]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            if node.id == node_id:
+                return node
+            children = node.children
+            if children:
+                extend(children[::-1])
         return None
 
     def find_by_type(self, root: ASTNode, node_type: NodeType) -> List[ASTNode]:
         """Find all nodes of a specific type."""
         results = []
-        if root.node_type == node_type:
-            results.append(root)
-        for child in root.children:
-            results.extend(self.find_by_type(child, node_type))
+        append = results.append
+        stack = [root]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            if node.node_type == node_type:
+                append(node)
+            children = node.children
+            if children:
+                extend(children[::-1])
         return results
 
     def find_by_predicate(self, root: ASTNode, predicate: Callable[[ASTNode], bool]) -> List[ASTNode]:
         """Find all nodes matching a predicate function."""
         results = []
-        if predicate(root):
-            results.append(root)
-        for child in root.children:
-            results.extend(self.find_by_predicate(child, predicate))
+        append = results.append
+        stack = [root]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            if predicate(node):
+                append(node)
+            children = node.children
+            if children:
+                extend(children[::-1])
         return results
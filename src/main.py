@@ -143,7 +143,7 @@ async def run_websocket_server(path: Path, host: str, port: int, use_signals: bo
     gap_threshold = 5  # If we miss more than this many events, trigger XML reload
 
     # Create UDP event callback
-    async def udp_event_callback(event_path: str, args: list, seq_num: int, timestamp: float):
+    async def udp_event_callback(event_path: str, args: list, seq_num: int, timestamp: int):
         """Handle UDP events from Ableton Live and broadcast changes."""
         try:
             # Update sequence tracking
@@ -164,7 +164,7 @@ async def run_websocket_server(path: Path, host: str, port: int, use_signals: bo
                             'timestamp': timestamp
                         }
                     }
-                    await server.websocket_server.broadcaster.broadcast(event_message)
+                    await server.websocket_server.broadcast_event(event_message)
                     logger.debug(f"[UDP] Cursor event broadcasted: {event_path}")
             else:
                 # AST events: process and update AST
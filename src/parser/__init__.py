@@ -11,11 +11,12 @@ This module handles:
 from .xml_loader import load_ableton_xml
 from .file_refs import extract_file_refs
 from .tracks import extract_tracks
-from .ast_builder import build_ast
+from .ast_builder import build_ast, iter_track_data
 
 __all__ = [
     "load_ableton_xml",
     "extract_file_refs",
     "extract_tracks",
     "build_ast",
+    "iter_track_data",
 ]
@@ -4,65 +4,89 @@ from .devices import extract_devices
 from .clips import extract_clips, extract_clip_slots
 from .scenes import extract_scenes
 from .mixer import extract_mixer_from_track
+from .utils import find_descendant
 
 
-def build_ast(root):
+def iter_track_data(root, num_scenes, legacy=True):
     """
-    Build a comprehensive AST from the XML root.
+    Yield enriched track dictionaries one at a time.
+
+    Callers that turn each track into nodes straight away can consume this
+    generator without ever holding the data for the whole set at once.
 
     Args:
         root: XML root element
+        num_scenes: Total number of scenes (used to pad clip slot lists)
+        legacy: Also extract the legacy ``clips`` array for each track
 
-    Returns:
-        Dictionary with tracks, scenes, file_refs, and enriched track data
+    Yields:
+        Track dictionaries with devices, clip slots and mixer settings
     """
-    # Extract scenes FIRST to get the total number of scenes
-    scenes = extract_scenes(root)
-    num_scenes = len(scenes)
-
     # Extract basic track information (includes regular and return tracks from <Tracks>, plus master)
     tracks = extract_tracks(root)
 
     # Find all track elements in the XML (including return tracks)
     track_elements = root.findall('.//Tracks/*')
-    master_track_element = root.find('.//MasterTrack')
+    master_track_element = find_descendant(root, 'MasterTrack')
 
     # Enrich each track with devices, clips, and mixer settings
     # Note: Return tracks (identified by type="return") won't have clips
     for i, track_elem in enumerate(track_elements):
         if i < len(tracks):  # Make sure we don't go out of bounds
+            track = tracks[i]
+
             # Extract devices for this track
-            devices = extract_devices(track_elem)
-            tracks[i]['devices'] = devices
+            track['devices'] = extract_devices(track_elem)
 
             # Extract clip slots and clips only for non-return tracks
-            if tracks[i]['type'] != 'return':
+            if track['type'] != 'return':
                 # Extract clip slots (all slots: empty and filled)
                 # Pass num_scenes to ensure we get all slots, even empty ones
-                clip_slots = extract_clip_slots(track_elem, num_scenes)
-                tracks[i]['clip_slots'] = clip_slots
+                track['clip_slots'] = extract_clip_slots(track_elem, num_scenes)
 
-                # Also keep legacy clips array for backward compatibility (for now)
-                clips = extract_clips(track_elem)
-                tracks[i]['clips'] = clips
+                # Legacy clips array duplicates the clip slot data; only the raw dict output needs it
+                if legacy:
+                    track['clips'] = extract_clips(track_elem)
 
             # Extract mixer settings for this track
-            mixer = extract_mixer_from_track(track_elem)
-            tracks[i]['mixer'] = mixer
+            track['mixer'] = extract_mixer_from_track(track_elem)
+            yield track
+
+    yielded = min(len(track_elements), len(tracks))
 
     # Enrich master track (if exists, it's always the last track in the list)
     if master_track_element is not None:
         master_idx = len(track_elements)  # Master is after all tracks in <Tracks>
         if master_idx < len(tracks):
-            devices = extract_devices(master_track_element)
-            tracks[master_idx]['devices'] = devices
-
-            mixer = extract_mixer_from_track(master_track_element)
-            tracks[master_idx]['mixer'] = mixer
+            track = tracks[master_idx]
+            track['devices'] = extract_devices(master_track_element)
+            track['mixer'] = extract_mixer_from_track(master_track_element)
             # Master track doesn't have clips
+            yield track
+            yielded = master_idx + 1
+
+    # Entries without an XML element (the placeholder master extract_tracks
+    # adds when there is no <MasterTrack>) are yielded un-enriched
+    for track in tracks[yielded:]:
+        yield track
+
+
+def build_ast(root, legacy=True):
+    """
+    Build a comprehensive AST from the XML root.
+
+    Args:
+        root: XML root element
+        legacy: Include the legacy per-track ``clips`` array
+
+    Returns:
+        Dictionary with tracks, scenes, file_refs, and enriched track data
+    """
+    # Extract scenes FIRST to get the total number of scenes
+    scenes = extract_scenes(root)
 
     return {
-        "tracks": tracks,
+        "tracks": list(iter_track_data(root, len(scenes), legacy=legacy)),
         "scenes": scenes,
         "file_refs": extract_file_refs(root),
     }
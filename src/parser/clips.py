@@ -8,6 +8,7 @@ Clips include:
 
 from typing import List, Dict, Any, Optional, Tuple
 import xml.etree.ElementTree as ET
+from .utils import find_descendant
 
 
 def extract_clip_slots(track_elem: ET.Element, num_scenes: int) -> List[Dict[str, Any]]:
@@ -28,11 +29,11 @@ def extract_clip_slots(track_elem: ET.Element, num_scenes: int) -> List[Dict[str
     clip_slots = []
 
     # Find ClipSlotList (session view clips)
-    clip_slot_list = track_elem.find('.//ClipSlotList')
+    clip_slot_list = find_descendant(track_elem, 'ClipSlotList')
     if clip_slot_list is not None:
-        # Use ./ClipSlot to get ONLY immediate children (not nested ClipSlot elements)
+        # Plain 'ClipSlot' matches ONLY immediate children (not nested ClipSlot elements)
         # .// would recursively find nested ClipSlots and count them twice!
-        xml_clip_slots = clip_slot_list.findall('./ClipSlot')
+        xml_clip_slots = clip_slot_list.findall('ClipSlot')
         
         for scene_index in range(num_scenes):
             if scene_index < len(xml_clip_slots):
@@ -76,15 +77,15 @@ def extract_clips(track_elem: ET.Element) -> List[Dict[str, Any]]:
     clips = []
 
     # Find ClipSlotList (session view clips)
-    clip_slot_list = track_elem.find('.//ClipSlotList')
+    clip_slot_list = find_descendant(track_elem, 'ClipSlotList')
     if clip_slot_list is not None:
-        for clip_slot in clip_slot_list.findall('.//ClipSlot'):
+        for clip_slot in clip_slot_list.iter('ClipSlot'):
             clip_info = _extract_clip_from_slot(clip_slot)
             if clip_info:
                 clips.append(clip_info)
 
     # Find ArrangementClipList (arrangement view clips)
-    arrangement_clips = track_elem.find('.//ArrangementClipList')
+    arrangement_clips = find_descendant(track_elem, 'ArrangementClipList')
     if arrangement_clips is not None:
         for clip_elem in arrangement_clips:
             if clip_elem.tag in ['MidiClip', 'AudioClip']:
@@ -113,22 +114,22 @@ def _extract_clip_slot_info(clip_slot: ET.Element, scene_index: int) -> Dict[str
         - clip: Clip data dictionary (if has_clip=True), None otherwise
     """
     # Get ClipSlot element (may be nested)
-    clip_slot_elem = clip_slot.find('./ClipSlot')
+    clip_slot_elem = clip_slot.find('ClipSlot')
     if clip_slot_elem is None:
         clip_slot_elem = clip_slot
 
     # Check HasStop property (default is true if not specified)
-    has_stop_elem = clip_slot_elem.find('./HasStop')
+    has_stop_elem = clip_slot_elem.find('HasStop')
     has_stop_button = True  # Default value
     if has_stop_elem is not None:
         has_stop_button = has_stop_elem.get('Value', 'true') == 'true'
 
     # Get slot color (if available)
-    color_elem = clip_slot_elem.find('./Color')
+    color_elem = clip_slot_elem.find('Color')
     color = int(color_elem.get('Value', '-1')) if color_elem is not None else None
 
     # Check if the slot has a clip
-    value_elem = clip_slot_elem.find('./Value')
+    value_elem = clip_slot_elem.find('Value')
     has_clip = False
     clip_data = None
 
@@ -205,30 +206,30 @@ def _extract_clip_info(clip_elem: ET.Element) -> Optional[Dict[str, Any]]:
     clip_type = 'midi' if clip_elem.tag == 'MidiClip' else 'audio'
 
     # Get clip name
-    name_elem = clip_elem.find('./Name')
+    name_elem = clip_elem.find('Name')
     clip_name = ''
     if name_elem is not None:
-        user_name = name_elem.find('./UserName')
-        effective_name = name_elem.find('./EffectiveName')
+        user_name = name_elem.find('UserName')
+        effective_name = name_elem.find('EffectiveName')
         if user_name is not None:
             clip_name = user_name.get('Value', '')
         elif effective_name is not None:
             clip_name = effective_name.get('Value', '')
 
     # Get timing information
-    current_start = clip_elem.find('./CurrentStart')
-    current_end = clip_elem.find('./CurrentEnd')
+    current_start = clip_elem.find('CurrentStart')
+    current_end = clip_elem.find('CurrentEnd')
 
     start_time = float(current_start.get('Value', '0')) if current_start is not None else 0.0
     end_time = float(current_end.get('Value', '0')) if current_end is not None else 0.0
 
     # Get loop settings
-    loop_elem = clip_elem.find('./Loop')
+    loop_elem = clip_elem.find('Loop')
     loop_info = {}
     if loop_elem is not None:
-        loop_start_elem = loop_elem.find('./LoopStart')
-        loop_end_elem = loop_elem.find('./LoopEnd')
-        loop_on_elem = loop_elem.find('./LoopOn')
+        loop_start_elem = loop_elem.find('LoopStart')
+        loop_end_elem = loop_elem.find('LoopEnd')
+        loop_on_elem = loop_elem.find('LoopOn')
 
         loop_info = {
             'loop_start': float(loop_start_elem.get('Value', '0')) if loop_start_elem is not None else 0.0,
@@ -237,7 +238,7 @@ def _extract_clip_info(clip_elem: ET.Element) -> Optional[Dict[str, Any]]:
         }
 
     # Get color
-    color_elem = clip_elem.find('./Color')
+    color_elem = clip_elem.find('Color')
     color = int(color_elem.get('Value', '-1')) if color_elem is not None else -1
 
     clip_info = {
@@ -273,7 +274,7 @@ def _extract_midi_clip_info(clip_elem: ET.Element) -> Dict[str, Any]:
     midi_info = {}
 
     # Count notes (without parsing all of them for performance)
-    notes_elem = clip_elem.find('.//Notes')
+    notes_elem = find_descendant(clip_elem, 'Notes')
     if notes_elem is not None:
         key_tracks = notes_elem.findall('./KeyTracks/KeyTrack')
         total_notes = 0
@@ -283,7 +284,7 @@ def _extract_midi_clip_info(clip_elem: ET.Element) -> Dict[str, Any]:
         midi_info['note_count'] = total_notes
 
     # Get time signature
-    time_signature_elem = clip_elem.find('.//TimeSignature')
+    time_signature_elem = find_descendant(clip_elem, 'TimeSignature')
     if time_signature_elem is not None:
         numerator_elem = time_signature_elem.find('./TimeSignatures/RemoteableTimeSignature/Numerator')
         denominator_elem = time_signature_elem.find('./TimeSignatures/RemoteableTimeSignature/Denominator')
@@ -309,12 +310,12 @@ def _extract_audio_clip_info(clip_elem: ET.Element) -> Dict[str, Any]:
     audio_info = {}
 
     # Get sample reference
-    sample_ref = clip_elem.find('.//SampleRef')
+    sample_ref = find_descendant(clip_elem, 'SampleRef')
     if sample_ref is not None:
-        file_ref = sample_ref.find('./FileRef')
+        file_ref = sample_ref.find('FileRef')
         if file_ref is not None:
-            name_elem = file_ref.find('./Name')
-            path_elem = file_ref.find('./Path')
+            name_elem = file_ref.find('Name')
+            path_elem = file_ref.find('Path')
 
             if name_elem is not None:
                 audio_info['sample_name'] = name_elem.get('Value', '')
@@ -322,12 +323,12 @@ def _extract_audio_clip_info(clip_elem: ET.Element) -> Dict[str, Any]:
                 audio_info['sample_path'] = path_elem.get('Value', '')
 
             # Get sample hash
-            hash_elem = file_ref.find('./OriginalFileSize')
+            hash_elem = file_ref.find('OriginalFileSize')
             if hash_elem is not None:
                 audio_info['sample_size'] = int(hash_elem.get('Value', '0'))
 
     # Get warp settings
-    warp_mode_elem = clip_elem.find('.//WarpMode')
+    warp_mode_elem = find_descendant(clip_elem, 'WarpMode')
     if warp_mode_elem is not None:
         warp_mode_value = warp_mode_elem.get('Value', '0')
         warp_modes = {
@@ -340,7 +341,7 @@ def _extract_audio_clip_info(clip_elem: ET.Element) -> Dict[str, Any]:
         }
         audio_info['warp_mode'] = warp_modes.get(warp_mode_value, 'Unknown')
 
-    is_warped_elem = clip_elem.find('.//IsWarped')
+    is_warped_elem = find_descendant(clip_elem, 'IsWarped')
     if is_warped_elem is not None:
         audio_info['is_warped'] = is_warped_elem.get('Value', 'true') == 'true'
 
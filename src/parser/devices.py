@@ -9,6 +9,33 @@ Devices include:
 
 from typing import List, Dict, Any, Optional
 import xml.etree.ElementTree as ET
+from .utils import find_descendant
+
+
+# Device tags to extract, in output order, with their category
+_DEVICE_TYPES = [
+    ('InstrumentGroupDevice', 'instrument'),
+    ('PluginDevice', 'plugin'),
+    ('AuPluginDevice', 'au_plugin'),
+    ('Vst3PluginDevice', 'vst3_plugin'),
+    ('AudioEffectGroupDevice', 'audio_effect_group'),
+    ('MidiEffectGroupDevice', 'midi_effect_group'),
+    # Ableton native devices
+    ('Compressor2', 'audio_effect'),
+    ('Eq8', 'audio_effect'),
+    ('Reverb', 'audio_effect'),
+    ('Delay', 'audio_effect'),
+    ('Chorus', 'audio_effect'),
+    ('Saturator', 'audio_effect'),
+    # MIDI effects
+    ('MidiArpeggiator', 'midi_effect'),
+    ('MidiNoteLength', 'midi_effect'),
+    ('MidiScale', 'midi_effect'),
+    ('MidiChord', 'midi_effect'),
+]
+
+# Position of each device tag in _DEVICE_TYPES
+_DEVICE_TYPE_ORDER = {tag: i for i, (tag, _) in enumerate(_DEVICE_TYPES)}
 
 
 def extract_devices(track_elem: ET.Element) -> List[Dict[str, Any]]:
@@ -24,34 +51,20 @@ def extract_devices(track_elem: ET.Element) -> List[Dict[str, Any]]:
     devices = []
 
     # Find the DeviceChain element
-    device_chain = track_elem.find('.//DeviceChain')
+    device_chain = find_descendant(track_elem, 'DeviceChain')
     if device_chain is None:
         return devices
 
-    # Look for different device types
-    device_types = [
-        ('InstrumentGroupDevice', 'instrument'),
-        ('PluginDevice', 'plugin'),
-        ('AuPluginDevice', 'au_plugin'),
-        ('Vst3PluginDevice', 'vst3_plugin'),
-        ('AudioEffectGroupDevice', 'audio_effect_group'),
-        ('MidiEffectGroupDevice', 'midi_effect_group'),
-        # Ableton native devices
-        ('Compressor2', 'audio_effect'),
-        ('Eq8', 'audio_effect'),
-        ('Reverb', 'audio_effect'),
-        ('Delay', 'audio_effect'),
-        ('Chorus', 'audio_effect'),
-        ('Saturator', 'audio_effect'),
-        # MIDI effects
-        ('MidiArpeggiator', 'midi_effect'),
-        ('MidiNoteLength', 'midi_effect'),
-        ('MidiScale', 'midi_effect'),
-        ('MidiChord', 'midi_effect'),
-    ]
-
-    for device_tag, device_category in device_types:
-        for device_elem in device_chain.iter(device_tag):
+    # Walk the chain once and bucket devices by type, so the result keeps
+    # the per-type ordering of one iter() pass per device tag
+    buckets = [[] for _ in _DEVICE_TYPES]
+    for elem in device_chain.iter():
+        position = _DEVICE_TYPE_ORDER.get(elem.tag)
+        if position is not None:
+            buckets[position].append(elem)
+
+    for (_, device_category), device_elems in zip(_DEVICE_TYPES, buckets):
+        for device_elem in device_elems:
             device_info = _extract_device_info(device_elem, device_category)
             if device_info:
                 devices.append(device_info)
@@ -71,12 +84,12 @@ def _extract_device_info(device_elem: ET.Element, device_category: str) -> Optio
         Dictionary with device information
     """
     # Get device name
-    name_elem = device_elem.find('.//UserName')
+    name_elem = find_descendant(device_elem, 'UserName')
     if name_elem is not None and name_elem.get('Value'):
         device_name = name_elem.get('Value', '')
     else:
         # Fall back to EffectiveName or tag name
-        effective_name = device_elem.find('.//EffectiveName')
+        effective_name = find_descendant(device_elem, 'EffectiveName')
         if effective_name is not None:
             device_name = effective_name.get('Value', device_elem.tag)
         else:
@@ -153,7 +166,7 @@ def _extract_parameters(device_elem: ET.Element) -> List[Dict[str, Any]]:
 def _extract_float_parameter(param_elem: ET.Element) -> Optional[Dict[str, Any]]:
     """Extract a float parameter."""
     param_id = param_elem.get('Id', '')
-    manual_elem = param_elem.find('./Manual')
+    manual_elem = param_elem.find('Manual')
 
     if manual_elem is not None:
         value = manual_elem.get('Value', '0')
@@ -169,7 +182,7 @@ def _extract_float_parameter(param_elem: ET.Element) -> Optional[Dict[str, Any]]
 def _extract_enum_parameter(param_elem: ET.Element) -> Optional[Dict[str, Any]]:
     """Extract an enum parameter."""
     param_id = param_elem.get('Id', '')
-    manual_elem = param_elem.find('./Manual')
+    manual_elem = param_elem.find('Manual')
 
     if manual_elem is not None:
         value = manual_elem.get('Value', '0')
@@ -195,18 +208,18 @@ def _extract_plugin_info(device_elem: ET.Element) -> Dict[str, Any]:
     plugin_info = {}
 
     # Find PluginDesc element
-    plugin_desc = device_elem.find('.//PluginDesc')
+    plugin_desc = find_descendant(device_elem, 'PluginDesc')
     if plugin_desc is not None:
         # Extract VstPluginInfo or AuPluginInfo
-        vst_info = plugin_desc.find('.//VstPluginInfo')
-        au_info = plugin_desc.find('.//AuPluginInfo')
+        vst_info = find_descendant(plugin_desc, 'VstPluginInfo')
+        au_info = find_descendant(plugin_desc, 'AuPluginInfo')
 
         if vst_info is not None:
-            plugin_info['plugin_name'] = vst_info.find('./PlugName').get('Value', '') if vst_info.find('./PlugName') is not None else ''
-            plugin_info['plugin_vendor'] = vst_info.find('./VendorName').get('Value', '') if vst_info.find('./VendorName') is not None else ''
+            plugin_info['plugin_name'] = vst_info.find('PlugName').get('Value', '') if vst_info.find('PlugName') is not None else ''
+            plugin_info['plugin_vendor'] = vst_info.find('VendorName').get('Value', '') if vst_info.find('VendorName') is not None else ''
         elif au_info is not None:
-            plugin_info['plugin_name'] = au_info.find('./Name').get('Value', '') if au_info.find('./Name') is not None else ''
-            plugin_info['plugin_manufacturer'] = au_info.find('./Manufacturer').get('Value', '') if au_info.find('./Manufacturer') is not None else ''
+            plugin_info['plugin_name'] = au_info.find('Name').get('Value', '') if au_info.find('Name') is not None else ''
+            plugin_info['plugin_manufacturer'] = au_info.find('Manufacturer').get('Value', '') if au_info.find('Manufacturer') is not None else ''
 
     return plugin_info
 
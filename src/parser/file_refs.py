@@ -1,12 +1,13 @@
 import xml.etree.ElementTree as ET
+from .utils import find_descendant
 
 
 def extract_file_refs(root: ET.Element):
     """Extract file references, names, paths, and hashes."""
     refs = []
-    for fileref in root.findall(".//FileRef"):
+    for fileref in root.iter("FileRef"):
         ref_type = fileref.get("Type") or "Unknown"
-        hash_tag = fileref.find(".//Hash")
+        hash_tag = find_descendant(fileref, "Hash")
         hash_val = hash_tag.get("Value") if hash_tag is not None else None
 
         name = None
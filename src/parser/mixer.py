@@ -1,5 +1,7 @@
 """Extract mixer information from Ableton Live XML."""
 
+from .utils import find_descendant
+
 
 def extract_mixer_from_track(track_elem):
     """
@@ -41,8 +43,8 @@ def extract_mixer_from_track(track_elem):
     sends = []
     send_holders = mixer_elem.findall('.//Sends/TrackSendHolder')
     for index, send_holder in enumerate(send_holders):
-        send_manual = send_holder.find('.//Manual')
-        send_on = send_holder.find('.//On')
+        send_manual = find_descendant(send_holder, 'Manual')
+        send_on = find_descendant(send_holder, 'On')
 
         level = float(send_manual.get('Value', 0.0)) if send_manual is not None else 0.0
         is_active = (send_on.get('Value', 'true').lower() == 'true'
@@ -1,5 +1,7 @@
 """Extract scene information from Ableton Live XML."""
 
+from .utils import find_descendant
+
 
 def extract_scenes(root):
     """
@@ -26,33 +28,33 @@ def extract_scenes(root):
 
     for index, scene_elem in enumerate(scene_elements):
         # Extract scene name
-        name_elem = scene_elem.find('.//Name')
+        name_elem = find_descendant(scene_elem, 'Name')
         name = name_elem.get('Value', '') if name_elem is not None else ''
 
         # Extract color
-        color_elem = scene_elem.find('.//Color')
+        color_elem = find_descendant(scene_elem, 'Color')
         color = int(color_elem.get('Value', -1)) if color_elem is not None else -1
 
         # Extract tempo
-        tempo_elem = scene_elem.find('.//Tempo')
+        tempo_elem = find_descendant(scene_elem, 'Tempo')
         tempo = float(tempo_elem.get('Value', 120.0)) if tempo_elem is not None else 120.0
 
         # Extract tempo enabled state
-        tempo_enabled_elem = scene_elem.find('.//IsTempoEnabled')
+        tempo_enabled_elem = find_descendant(scene_elem, 'IsTempoEnabled')
         is_tempo_enabled = (tempo_enabled_elem.get('Value', 'false').lower() == 'true'
                            if tempo_enabled_elem is not None else False)
 
         # Extract time signature
-        time_sig_elem = scene_elem.find('.//TimeSignatureId')
+        time_sig_elem = find_descendant(scene_elem, 'TimeSignatureId')
         time_signature_id = int(time_sig_elem.get('Value', 201)) if time_sig_elem is not None else 201
 
         # Extract time signature enabled state
-        time_sig_enabled_elem = scene_elem.find('.//IsTimeSignatureEnabled')
+        time_sig_enabled_elem = find_descendant(scene_elem, 'IsTimeSignatureEnabled')
         is_time_signature_enabled = (time_sig_enabled_elem.get('Value', 'false').lower() == 'true'
                                      if time_sig_enabled_elem is not None else False)
 
         # Extract annotation
-        annotation_elem = scene_elem.find('.//Annotation')
+        annotation_elem = find_descendant(scene_elem, 'Annotation')
         annotation = annotation_elem.get('Value', '') if annotation_elem is not None else ''
 
         scene_data = {
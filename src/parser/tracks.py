@@ -1,3 +1,6 @@
+from .utils import find_descendant
+
+
 def extract_tracks(root):
     tracks = []
     
@@ -14,7 +17,7 @@ def extract_tracks(root):
             name = user_name_elem.get("Value", f"Track {i}") if user_name_elem is not None else f"Track {i}"
 
         # Extract color index (0-69 in Ableton's color palette)
-        color_elem = track.find(".//Color")
+        color_elem = find_descendant(track, "Color")
         color_index = None
         if color_elem is not None:
             try:
@@ -36,7 +39,7 @@ def extract_tracks(root):
     # The master track may be stored as <MasterTrack> element (newer versions)
     # or may not be in XML at all (older versions), but Live API always has one
     # Check both .//MasterTrack and root level MasterTrack
-    master_track_elem = root.find(".//MasterTrack")
+    master_track_elem = find_descendant(root, "MasterTrack")
     if master_track_elem is None:
         master_track_elem = root.find("MasterTrack")
 
@@ -51,7 +54,7 @@ def extract_tracks(root):
             user_name_elem = master_track_elem.find(".//Name/UserName")
             name = user_name_elem.get("Value", "Master") if user_name_elem is not None else "Master"
 
-        color_elem = master_track_elem.find(".//Color")
+        color_elem = find_descendant(master_track_elem, "Color")
         color_index = None
         if color_elem is not None:
             try:
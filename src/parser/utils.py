@@ -0,0 +1,15 @@
+"""Shared helpers for the XML extractors."""
+
+
+def find_descendant(elem, tag: str):
+    """
+    Return the first descendant of elem with the given tag, or None.
+
+    Same result as elem.find('.//' + tag) whenever elem itself has a
+    different tag, but walks the tree with the C-level iterator instead of
+    the pure-Python ElementPath engine.
+    """
+    for match in elem.iter(tag):
+        if match is not elem:
+            return match
+    return None
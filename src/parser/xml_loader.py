@@ -1,18 +1,63 @@
 import gzip
+import threading
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - lxml is optional
+    _lxml_etree = None
+
+
+# lxml parsers can be reused between documents but not shared between
+# threads, so each thread keeps its own
+_parsers = threading.local()
+
+
+def _get_parser():
+    """Return this thread's parser for the available backend (lxml if installed)."""
+    parser = getattr(_parsers, "parser", None)
+    if parser is None and _lxml_etree is not None:
+        # huge_tree lifts libxml2's default depth/text-size limits, which
+        # large sessions with embedded automation can exceed. Entities are
+        # left unresolved and network access is off, so a crafted file can
+        # neither pull in other files nor expand entities without bound
+        # (the stdlib parser does neither either).
+        # collect_ids is off because Ableton's Id attributes are not xml:id.
+        parser = _lxml_etree.XMLParser(
+            huge_tree=True,
+            resolve_entities=False,
+            no_network=True,
+            remove_comments=True,
+            remove_pis=True,
+            collect_ids=False,
+        )
+        _parsers.parser = parser
+    return parser
+
+
+def _parse(source):
+    """Parse a path or binary file object with the preferred backend."""
+    if _lxml_etree is not None:
+        return _lxml_etree.parse(source, _get_parser())
+    return ET.parse(source)
+
 
 def load_ableton_xml(path: Path) -> ET.ElementTree:
-    """Load and parse Ableton .als or .xml file into an ElementTree."""
+    """
+    Load and parse Ableton .als or .xml file into an ElementTree.
+
+    Uses lxml when it is installed and falls back to the standard library
+    otherwise. Compressed .als files are parsed straight from the gzip
+    stream, so the decompressed document is never held as bytes or str.
+    """
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
     if path.suffix == ".als":
         with gzip.open(path, "rb") as f:
-            xml_data = f.read().decode("utf-8")
-        return ET.ElementTree(ET.fromstring(xml_data))
+            return _parse(f)
     elif path.suffix == ".xml":
-        return ET.parse(path)
+        return _parse(str(path))
     else:
         raise ValueError(f"Unsupported file type: {path.suffix}")
@@ -12,20 +12,21 @@ import time
 from typing import Any, List, Union
 
 
+# Null terminator plus up to three padding bytes; sliced instead of
+# branching on the remainder
+_PADDING = b'\x00\x00\x00\x00'
+
+
 def _pad_to_multiple_of_4(data: bytes) -> bytes:
     """Pad bytes to a multiple of 4 bytes with null bytes."""
-    remainder = len(data) % 4
-    if remainder != 0:
-        data += b'\x00' * (4 - remainder)
-    return data
+    return data + _PADDING[:-len(data) & 3]
 
 
 def _encode_string(s: str) -> bytes:
     """Encode a string as OSC string (null-terminated, padded to 4 bytes)."""
-    # Convert to bytes and add null terminator
-    encoded = s.encode('utf-8') + b'\x00'
-    # Pad to multiple of 4
-    return _pad_to_multiple_of_4(encoded)
+    encoded = s.encode('utf-8')
+    # Null terminator and padding in one slice: always 1-4 bytes
+    return encoded + _PADDING[:4 - (len(encoded) & 3)]
 
 
 def _encode_int(i: int) -> bytes:
@@ -38,19 +39,48 @@ def _encode_float(f: float) -> bytes:
     return struct.pack('>f', f)
 
 
+def _encode_int64(i: int) -> bytes:
+    """Encode an integer as OSC int64 (big-endian)."""
+    return struct.pack('>q', i)
+
+
 def _encode_bool(b: bool) -> bytes:
     """Encode a boolean as OSC bool (no data, just type tag T or F)."""
     # Booleans have no data in OSC, only the type tag matters
     return b''
 
 
+class Int64(int):
+    """Marker type for integers that must be sent as OSC int64 ('h')."""
+    __slots__ = ()
+
+
+# Type tag per exact Python type; bool maps to 'T' and is flipped to 'F' when false
+_TYPE_TAGS = {bool: 'T', int: 'i', Int64: 'h', float: 'f', str: 's'}
+
+
+def _type_tag_for(arg: Any) -> str:
+    """Resolve the type tag for subclasses of the supported argument types."""
+    if isinstance(arg, bool):
+        return 'T'
+    if isinstance(arg, Int64):
+        return 'h'
+    if isinstance(arg, int):
+        return 'i'
+    if isinstance(arg, float):
+        return 'f'
+    if isinstance(arg, str):
+        return 's'
+    raise TypeError(f"Unsupported OSC argument type: {type(arg)}")
+
+
 def build_osc_message(address: str, *args: Any) -> bytes:
     """
     Build an OSC message with the given address pattern and arguments.
 
     Args:
         address: OSC address pattern (e.g., "/live/track/renamed")
-        *args: Variable arguments (int, float, str, bool)
+        *args: Variable arguments (int, Int64, float, str, bool)
 
     Returns:
         bytes: Complete OSC message ready to send via UDP
@@ -62,45 +92,27 @@ def build_osc_message(address: str, *args: Any) -> bytes:
     if not address.startswith('/'):
         raise ValueError(f"OSC address must start with '/': {address}")
 
-    # Encode address pattern
-    message = _encode_string(address)
-
-    # Build type tag string
-    type_tags = ','
-    encoded_args = []
-
-    for arg in args:
-        if isinstance(arg, bool):
-            # Booleans use T/F tags and have no data
-            type_tags += 'T' if arg else 'F'
-            encoded_args.append(_encode_bool(arg))
-        elif isinstance(arg, int):
-            type_tags += 'i'
-            encoded_args.append(_encode_int(arg))
-        elif isinstance(arg, float):
-            type_tags += 'f'
-            encoded_args.append(_encode_float(arg))
-        elif isinstance(arg, str):
-            type_tags += 's'
-            encoded_args.append(_encode_string(arg))
-        else:
-            raise TypeError(f"Unsupported OSC argument type: {type(arg)}")
-
-    # Encode type tag string
-    message += _encode_string(type_tags)
-
-    # Append encoded arguments
-    for encoded_arg in encoded_args:
-        message += encoded_arg
-
-    return message
+    # Repeated messages of the same shape reuse a specialized encoder, so the
+    # per-argument dispatch and header encoding run once per signature.
+    key = (address, tuple(arg if type(arg) is bool else type(arg) for arg in args))
+    encoder = _FORMAT_CACHE.get(key)
+    if encoder is None:
+        tagstr = ''.join(_TYPE_TAGS.get(type(arg)) or _type_tag_for(arg) for arg in args)
+        encoder = _make_encoder(address, tagstr)
+        if len(_FORMAT_CACHE) >= _FORMAT_CACHE_SIZE:
+            _FORMAT_CACHE.clear()
+        _FORMAT_CACHE[key] = encoder
+    return encoder(*args)
 
 
 def build_sequenced_message(seq_num: int, event_path: str, *args: Any) -> bytes:
     """
     Build an OSC message with sequence number wrapper.
 
-    Format: /live/seq <seq_num:int> <timestamp:float> <event_path:str> <args...>
+    Format: /live/seq <seq_num:int> <timestamp:int64> <event_path:str> <args...>
+
+    The timestamp is time.monotonic_ns(): nanoseconds from an arbitrary
+    origin, only meaningful relative to other timestamps from this sender.
 
     Args:
         seq_num: Sequence number (monotonically increasing)
@@ -112,14 +124,53 @@ def build_sequenced_message(seq_num: int, event_path: str, *args: Any) -> bytes:
 
     Example:
         >>> msg = build_sequenced_message(42, "/live/track/renamed", 0, "Bass")
-        >>> # Returns: /live/seq,ifs...\x00\x00\x00*...
+        >>> # Returns: /live/seq,ihs...\x00\x00\x00*...
     """
-    timestamp = time.time()
+    encoder = _EVENT_ENCODERS.get(event_path)
+    if encoder is not None:
+        return encoder(seq_num, *args)
+    return _build_sequenced_generic(seq_num, event_path, args)
+
 
-    # Combine sequence metadata with event path and args
-    all_args = [seq_num, timestamp, event_path] + list(args)
+def _build_sequenced_generic(seq_num: int, event_path: str, args: tuple) -> bytes:
+    """Build a sequenced message through the generic per-argument encoder."""
+    timestamp = Int64(time.monotonic_ns())
 
-    return build_osc_message("/live/seq", *all_args)
+    return build_osc_message("/live/seq", seq_num, timestamp, event_path, *args)
+
+
+def build_sequenced_batch(seq_num: int, event_path: str, rows: list) -> list:
+    """
+    Encode many events that share one event path and argument signature.
+
+    The encoder is resolved (or compiled from the first row) once for the
+    whole batch instead of once per event. Rows whose argument types differ
+    from the first row's (e.g. a bool where the first row has an int) are
+    encoded on their own through build_sequenced_message, so every message
+    matches what send_event would produce for that event.
+
+    Args:
+        seq_num: Sequence number of the first event
+        event_path: Event address pattern shared by all rows
+        rows: Argument tuples, one per event
+
+    Returns:
+        list: Encoded messages with consecutive sequence numbers
+    """
+    if not rows:
+        return []
+
+    encoder = _EVENT_ENCODERS.get(event_path)
+    if encoder is None:
+        tagstr = ''.join(_TYPE_TAGS.get(type(arg)) or _type_tag_for(arg) for arg in rows[0])
+        encoder = _make_sequenced_encoder(event_path, tagstr)
+
+    signature = tuple(map(type, rows[0]))
+    return [
+        encoder(seq_num + offset, *row) if tuple(map(type, row)) == signature
+        else build_sequenced_message(seq_num + offset, event_path, *row)
+        for offset, row in enumerate(rows)
+    ]
 
 
 def build_batch_start(batch_id: int) -> bytes:
@@ -132,6 +183,194 @@ def build_batch_end(batch_id: int) -> bytes:
     return build_osc_message("/live/batch/end", batch_id)
 
 
+# Specialized encoders for events with a fixed argument signature
+_STRUCT_CODES = {'i': 'i', 'h': 'q', 'f': 'f'}
+_SEQ_HEADER = struct.Struct('>iq')
+
+
+def _compile_segments(tagstr: str) -> list:
+    """
+    Split a type tag signature into encoding segments.
+
+    Runs of numeric tags become one pre-built Struct, each 's' becomes a
+    string segment and 'T' (bool) contributes no payload.
+
+    Returns:
+        list: (start, stop, Struct or None) per segment; None marks a string
+    """
+    segments = []
+    codes = []
+    run_start = 0
+    position = 0
+
+    for tag in tagstr:
+        if tag in _STRUCT_CODES:
+            if not codes:
+                run_start = position
+            codes.append(_STRUCT_CODES[tag])
+        else:
+            if codes:
+                segments.append((run_start, position, struct.Struct('>' + ''.join(codes))))
+                codes = []
+            if tag == 's':
+                segments.append((position, position + 1, None))
+            elif tag != 'T':
+                raise ValueError(f"Unsupported OSC type tag in signature: {tag}")
+        position += 1
+
+    if codes:
+        segments.append((run_start, position, struct.Struct('>' + ''.join(codes))))
+    return segments
+
+
+def _encode_headers(address: str, tagstr: str, tag_prefix: str = '') -> tuple:
+    """
+    Pre-encode address + type tag headers for a fixed signature.
+
+    A 'T' in ``tagstr`` marks a bool argument whose tag (T or F) depends on
+    the value, so one header is built per combination of bool values.
+
+    Returns:
+        tuple: (headers keyed by tuple of bool values, bool argument positions)
+    """
+    address_bytes = _encode_string(address)
+    bool_positions = tuple(i for i, tag in enumerate(tagstr) if tag == 'T')
+
+    headers = {}
+    for combo in range(1 << len(bool_positions)):
+        values = tuple(bool(combo & (1 << bit)) for bit in range(len(bool_positions)))
+        tags = list(tagstr)
+        for position, value in zip(bool_positions, values):
+            tags[position] = 'T' if value else 'F'
+        headers[values] = address_bytes + _encode_string(',' + tag_prefix + ''.join(tags))
+    return headers, bool_positions
+
+
+def _make_encoder(address: str, tagstr: str):
+    """
+    Build a message encoder specialized for one address and type signature.
+
+    Address and type tag bytes are encoded once; each call only packs the
+    argument payload.
+
+    Args:
+        address: OSC address pattern
+        tagstr: Type tags without the leading comma (e.g. "is"), 'T' for bools
+
+    Returns:
+        Callable taking the message arguments and returning bytes
+    """
+    headers, bool_positions = _encode_headers(address, tagstr)
+    segments = _compile_segments(tagstr)
+    arg_count = len(tagstr)
+
+    if not bool_positions and len(segments) == 1 and segments[0][2] is not None:
+        # All-numeric signature: header plus one Struct.pack, no piece list
+        header = headers[()]
+        pack = segments[0][2].pack
+
+        def encode_numeric(*args: Any) -> bytes:
+            if len(args) != arg_count:
+                raise TypeError(f"{address} expects {arg_count} arguments, got {len(args)}")
+            return header + pack(*args)
+
+        return encode_numeric
+
+    def encode(*args: Any) -> bytes:
+        if len(args) != arg_count:
+            raise TypeError(f"{address} expects {arg_count} arguments, got {len(args)}")
+        pieces = [headers[tuple(bool(args[i]) for i in bool_positions)]]
+        for start, stop, packer in segments:
+            if packer is None:
+                pieces.append(_encode_string(args[start]))
+            else:
+                pieces.append(packer.pack(*args[start:stop]))
+        return b''.join(pieces)
+
+    return encode
+
+
+# Encoders built by build_osc_message, keyed by (address, argument signature).
+# Bools are keyed by value since True and False use different type tags.
+_FORMAT_CACHE = {}
+_FORMAT_CACHE_SIZE = 256
+
+
+def _make_sequenced_encoder(event_path: str, tagstr: str):
+    """
+    Build a /live/seq encoder specialized for one event path and signature.
+
+    The header and the event path string are encoded once. Arguments that
+    do not fit the signature fall back to the generic encoder, so the
+    result is always a valid message.
+
+    Returns:
+        Callable(seq_num, *args) -> bytes
+    """
+    headers, bool_positions = _encode_headers("/live/seq", tagstr, tag_prefix='ihs')
+    segments = _compile_segments(tagstr)
+    path_bytes = _encode_string(event_path)
+    arg_count = len(tagstr)
+    pack_header = _SEQ_HEADER.pack
+
+    if not bool_positions and len(segments) == 1 and segments[0][2] is not None:
+        # All-numeric signature: four fixed pieces, no piece list
+        header = headers[()]
+        pack = segments[0][2].pack
+
+        def encode_numeric(seq_num: int, *args: Any) -> bytes:
+            if len(args) != arg_count:
+                return _build_sequenced_generic(seq_num, event_path, args)
+            try:
+                return b''.join((
+                    header, pack_header(seq_num, time.monotonic_ns()), path_bytes, pack(*args)
+                ))
+            except struct.error:
+                return _build_sequenced_generic(seq_num, event_path, args)
+
+        return encode_numeric
+
+    def encode(seq_num: int, *args: Any) -> bytes:
+        if len(args) != arg_count:
+            return _build_sequenced_generic(seq_num, event_path, args)
+        try:
+            pieces = [
+                headers[tuple(bool(args[i]) for i in bool_positions)],
+                pack_header(seq_num, time.monotonic_ns()),
+                path_bytes,
+            ]
+            for start, stop, packer in segments:
+                if packer is None:
+                    pieces.append(_encode_string(args[start]))
+                else:
+                    pieces.append(packer.pack(*args[start:stop]))
+        except (struct.error, TypeError, AttributeError):
+            return _build_sequenced_generic(seq_num, event_path, args)
+        return b''.join(pieces)
+
+    return encode
+
+
+# Events sent often enough to deserve a specialized encoder, with the
+# signature documented in docs/api-reference/osc-protocol.md
+_EVENT_ENCODERS = {
+    event_path: _make_sequenced_encoder(event_path, tagstr)
+    for event_path, tagstr in (
+        ("/live/track/renamed", "is"),
+        ("/live/track/mute", "iT"),
+        ("/live/track/arm", "iT"),
+        ("/live/track/volume", "if"),
+        ("/live/device/param", "iiif"),
+        ("/live/clip_slot/playing_status", "iii"),
+        ("/live/clip/name", "iis"),
+        ("/live/scene/renamed", "is"),
+        ("/live/transport/play", "T"),
+        ("/live/transport/tempo", "f"),
+        ("/live/transport/position", "f"),
+    )
+}
+
+
 # Event builder helper functions
 def build_track_renamed(track_idx: int, name: str) -> str:
     """Build event path and args for track renamed event."""
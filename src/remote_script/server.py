@@ -3,8 +3,49 @@ Socket server and thread synchronization for command execution
 """
 
 import socket
+import struct
 import threading
 import json
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+try:
+    from .logging_config import ENABLE_LOGGING as _LOG
+except ImportError:
+    # Standalone use outside the Remote Script package
+    _LOG = True
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize a response to UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    # Live's bundled Python has no third-party packages; stdlib fallback
+    def _dumps(obj):
+        """Serialize a response to UTF-8 JSON bytes"""
+        return json.dumps(obj).encode('utf-8')
+
+
+# Persistent clients frame every request and response with a 4-byte
+# big-endian length. A frame header always starts with a zero byte for
+# payloads under 16 MiB, which never happens for plain-text commands, so
+# the first byte of a connection tells both protocols apart.
+_FRAME_HEADER = struct.Struct('>I')
+_MAX_FRAME_SIZE = 1 << 20
+
+
+def _recv_exact(conn, size):
+    """Read exactly ``size`` bytes, or return None if the peer closed first"""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = conn.recv(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
 
 
 class CommandServer:
@@ -26,15 +67,13 @@ class CommandServer:
         self.host = host
         self.port = port
 
-        # Thread-safe command execution
-        self._pending_command = None
-        self._command_result = None
-        self._command_lock = threading.Lock()
-        self._result_ready = threading.Event()
-
         # Get command registry
         self._handlers = command_handlers.register_commands()
         self._direct_commands = command_handlers.get_direct_commands()
+        # Lookup by raw request bytes so plain commands are never decoded
+        self._handlers_by_name = {
+            name.encode('utf-8'): (name, handler) for name, handler in self._handlers.items()
+        }
 
         # Server thread
         self._server_thread = None
@@ -47,33 +86,29 @@ class CommandServer:
 
     def _execute_in_main_thread(self, handler, params=None):
         """Execute handler in main thread using schedule_message"""
-        with self._command_lock:
-            self._pending_command = (handler, params)
-            self._command_result = None
-            self._result_ready.clear()
+        # Each call gets its own future, so concurrent connections never share
+        # state and the waiting thread is woken exactly once
+        future = Future()
+
+        def run():
+            # Skip commands whose caller already gave up waiting
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(handler(params))
+            except Exception as e:
+                future.set_result({"success": False, "error": str(e)})
 
         # Schedule execution in main thread (0 = ASAP, not next tick)
-        self.schedule_message(0, self._execute_pending_command)
+        self.schedule_message(0, run)
 
         # Wait for result (with timeout)
-        if self._result_ready.wait(timeout=1.0):
-            return self._command_result
-        else:
+        try:
+            return future.result(timeout=1.0)
+        except FutureTimeoutError:
+            future.cancel()
             return {"success": False, "error": "Command timeout"}
 
-    def _execute_pending_command(self):
-        """Called in main thread to execute pending command"""
-        with self._command_lock:
-            if self._pending_command:
-                handler, params = self._pending_command
-                try:
-                    self._command_result = handler(params)
-                except Exception as e:
-                    self._command_result = {"success": False, "error": str(e)}
-                finally:
-                    self._pending_command = None
-                    self._result_ready.set()
-
     def _run_server(self):
         """Run a simple socket server to expose state to Hammerspoon"""
         # Outer try-catch for server setup only
@@ -81,53 +116,121 @@ class CommandServer:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 s.bind((self.host, self.port))
-                s.listen(1)
+                s.listen(5)
                 self.log_message(f"Server listening on {self.host}:{self.port}")
 
                 while True:
                     try:
-                        # Handle each connection in its own try-catch
                         conn, addr = s.accept()
-                        with conn:
-                            data = conn.recv(1024)
-                            if data:
-                                request = data.decode('utf-8').strip()
-
-                                # Parse command and optional parameters (format: COMMAND:param1:param2)
-                                parts = request.split(':')
-                                command = parts[0]
-                                params = parts[1:] if len(parts) > 1 else None
-
-                                # Dispatch to handler
-                                handler = self._handlers.get(command)
-                                if handler:
-                                    try:
-                                        # Check if command can execute directly (no thread switching)
-                                        if command in self._direct_commands:
-                                            # Fast path: execute immediately (no logging for speed)
-                                            result = handler(params)
-                                        else:
-                                            # Slow path: execute in main thread for thread safety
-                                            self.log_message(f"Executing command: {command}")
-                                            result = self._execute_in_main_thread(handler, params)
-
-                                        response = json.dumps(result)
-                                    except Exception as e:
-                                        error_msg = f"Handler error for {command}: {str(e)}"
-                                        self.log_message(error_msg)
-                                        response = json.dumps({"success": False, "error": str(e)})
-                                else:
-                                    error_msg = f"Unknown command: {command}"
-                                    self.log_message(error_msg)
-                                    response = json.dumps({
-                                        "success": False,
-                                        "error": error_msg
-                                    })
-
-                                conn.sendall(response.encode('utf-8'))
+                        # Each connection gets its own thread so a persistent
+                        # client never blocks one-shot `nc` requests
+                        threading.Thread(
+                            target=self._handle_connection, args=(conn,), daemon=True
+                        ).start()
                     except Exception as e:
                         # Log connection errors but keep server running
-                        self.log_message(f"Connection error: {str(e)}")
+                        if _LOG:
+                            self.log_message(f"Connection error: {str(e)}")
                         continue
         except Exception as e:
             self.log_message(f"Fatal server error: {str(e)}")
+
+    def _handle_connection(self, conn):
+        """Serve one client connection in either framing mode"""
+        try:
+            with conn:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                data = conn.recv(1024)
+                if not data:
+                    return
+
+                if data[0] == 0:
+                    self._serve_framed(conn, data)
+                else:
+                    # One-shot text command (format: COMMAND:param1:param2),
+                    # answered with raw JSON and closed - what `nc` expects
+                    conn.sendall(self._dispatch(data))
+        except Exception as e:
+            # Log connection errors but keep server running
+            if _LOG:
+                self.log_message(f"Connection error: {str(e)}")
+
+    def _serve_framed(self, conn, pending):
+        """Serve length-prefixed requests on a persistent connection
+
+        Args:
+            conn: Client socket
+            pending: Bytes already read from the connection
+        """
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        header_size = _FRAME_HEADER.size
+
+        while True:
+            if len(pending) < header_size:
+                rest = _recv_exact(conn, header_size - len(pending))
+                if rest is None:
+                    return
+                pending += rest
+            (size,) = _FRAME_HEADER.unpack_from(pending)
+            if size > _MAX_FRAME_SIZE:
+                if _LOG:
+                    self.log_message(f"Frame too large ({size} bytes), closing connection")
+                return
+
+            body = pending[header_size:header_size + size]
+            pending = pending[header_size + size:]
+            if len(body) < size:
+                rest = _recv_exact(conn, size - len(body))
+                if rest is None:
+                    return
+                body += rest
+
+            response = self._dispatch(body)
+            conn.sendall(_FRAME_HEADER.pack(len(response)) + response)
+
+    def _dispatch(self, request):
+        """Run one command request and return the encoded JSON response
+
+        Args:
+            request: Raw request bytes (format: COMMAND:param1:param2)
+        """
+        name, sep, rest = request.strip().partition(b':')
+
+        # Dispatch to handler
+        command, handler = self._handlers_by_name.get(name, (None, None))
+        if handler is None:
+            return self._unknown_command_response(name)
+
+        try:
+            # Only the parameter part is decoded and split, and only if present
+            params = rest.decode('utf-8').split(':') if sep else None
+
+            # Check if command can execute directly (no thread switching)
+            if command in self._direct_commands:
+                # Fast path: execute immediately (no logging for speed)
+                result = handler(params)
+            else:
+                # Slow path: execute in main thread for thread safety
+                if _LOG:
+                    self.log_message(f"Executing command: {command}")
+                result = self._execute_in_main_thread(handler, params)
+
+            return _dumps(result)
+        except Exception as e:
+            return self._handler_error_response(command, e)
+
+    def _unknown_command_response(self, name):
+        """Log and build the response for an unregistered command"""
+        error_msg = f"Unknown command: {name.decode('utf-8', 'replace')}"
+        if _LOG:
+            self.log_message(error_msg)
+        return _dumps({
+            "success": False,
+            "error": error_msg
+        })
+
+    def _handler_error_response(self, command, error):
+        """Log and build the response for a handler that raised"""
+        if _LOG:
+            self.log_message(f"Handler error for {command}: {str(error)}")
+        return _dumps({"success": False, "error": str(error)})
@@ -7,7 +7,8 @@ to the UDP listener service without blocking Ableton's main thread.
 PERFORMANCE TUNING:
 -------------------
 Logging is controlled centrally in logging_config.py
-Set ENABLE_LOGGING = False for better performance
+Set ENABLE_LOGGING = False for better performance; it is read once at
+import (as _LOG) so hot-path log calls are skipped without formatting
 """
 
 import socket
@@ -15,19 +16,29 @@ import time
 from typing import Any, Optional
 
 try:
-    from .osc import build_sequenced_message
-    from .logging_config import log
+    from .osc import (
+        build_sequenced_message, build_sequenced_batch, build_batch_start, build_batch_end
+    )
+    from .logging_config import log, ENABLE_LOGGING as _LOG
 except ImportError:
     # For testing outside of package context
     import sys
     import os
     sys.path.insert(0, os.path.dirname(__file__))
-    from osc import build_sequenced_message
+    from osc import (
+        build_sequenced_message, build_sequenced_batch, build_batch_start, build_batch_end
+    )
     # Fallback logging function for standalone testing
+    _LOG = True
+
     def log(component: str, message: str, level: str = "INFO", force: bool = False):
         print(f"[{level}] [{component}] {message}")
 
 
+# Minimum seconds between log lines about a refused (unreachable) listener
+_REFUSED_LOG_INTERVAL = 10.0
+
+
 class UDPSender:
     """
     Non-blocking UDP sender for OSC events.
@@ -46,13 +57,19 @@ class UDPSender:
         """
         self.host = host
         self.port = port
+        self._addr = (host, port)
         self.socket: Optional[socket.socket] = None
+        # Bound socket.send, set in start() to skip the method lookup per event
+        self._send = None
         self.seq_num = 0
         self.enabled = False
 
         # Statistics
         self.sent_count = 0
         self.error_count = 0
+        # Sends refused because no listener is running (see _handle_send_error)
+        self.refused_count = 0
+        self._last_refused_log: Optional[float] = None
 
     def start(self):
         """Initialize UDP socket and enable sending."""
@@ -60,6 +77,9 @@ class UDPSender:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             # Set non-blocking mode
             self.socket.setblocking(False)
+            # Fix the default peer once so sends skip per-call address handling
+            self.socket.connect(self._addr)
+            self._send = self.socket.send
             self.enabled = True
             self.log("UDP sender started on {}:{}".format(self.host, self.port))
         except Exception as e:
@@ -69,6 +89,7 @@ class UDPSender:
     def stop(self):
         """Close UDP socket and disable sending."""
         self.enabled = False
+        self._send = None
         if self.socket:
             try:
                 self.socket.close()
@@ -89,31 +110,49 @@ class UDPSender:
         Returns:
             bool: True if sent successfully, False otherwise
         """
-        if not self.enabled or not self.socket:
+        send = self._send
+        if not self.enabled or send is None:
             return False
 
+        seq_num = self.seq_num
         try:
-            # Build OSC message with sequence number
-            message = build_sequenced_message(self.seq_num, event_path, *args)
-
-            # Send via UDP (non-blocking, fire-and-forget)
-            self.socket.sendto(message, (self.host, self.port))
-
-            # Update sequence number and stats
-            self.seq_num += 1
-            self.sent_count += 1
-
-            # Log scene events for debugging
-            if "/scene/" in event_path:
-                log("UDPSender", f"Sent: {event_path} {args}", level="INFO", force=True)
-
-            return True
-
+            # Build OSC message with sequence number and send it
+            # (non-blocking, fire-and-forget)
+            send(build_sequenced_message(seq_num, event_path, *args))
         except Exception as e:
-            self.error_count += 1
-            self.log("Failed to send UDP message: {}".format(str(e)))
+            return self._handle_send_error(e)
+
+        # Update sequence number and stats
+        self.seq_num = seq_num + 1
+        self.sent_count += 1
+
+        # Log scene events for debugging
+        if _LOG and "/scene/" in event_path:
+            log("UDPSender", f"Sent: {event_path} {args}", level="INFO", force=True)
+
+        return True
+
+    def _handle_send_error(self, error: Exception) -> bool:
+        """Count and log a failed send; returns False for send_event to pass on."""
+        if isinstance(error, ConnectionRefusedError):
+            # The connected socket reports the ICMP "port unreachable" of an
+            # earlier datagram while the listener is down. That is the normal
+            # state when the listener is not running, so it is counted
+            # separately and logged at most once per interval.
+            self.refused_count += 1
+            now = time.monotonic()
+            if _LOG and (self._last_refused_log is None
+                         or now - self._last_refused_log >= _REFUSED_LOG_INTERVAL):
+                self._last_refused_log = now
+                self.log("UDP listener on {}:{} not reachable ({} refused sends)".format(
+                    self.host, self.port, self.refused_count))
             return False
 
+        self.error_count += 1
+        if _LOG:
+            self.log("Failed to send UDP message: {}".format(str(error)))
+        return False
+
     def send_batch(self, batch_id: int, events: list):
         """
         Send a batch of events grouped together.
@@ -125,44 +164,134 @@ class UDPSender:
         if not self.enabled:
             return
 
-        # Import here to avoid circular dependency
-        try:
-            from .osc import build_batch_start, build_batch_end
-        except ImportError:
-            from osc import build_batch_start, build_batch_end
+        if self._send is None:
+            return
 
         try:
-            # Send batch start marker
-            if self.socket:
-                batch_start = build_batch_start(batch_id)
-                self.socket.sendto(batch_start, (self.host, self.port))
-
-            # Send all events
-            for event_data in events:
-                if len(event_data) >= 1:
-                    event_path = event_data[0]
-                    args = event_data[1:] if len(event_data) > 1 else ()
-                    self.send_event(event_path, *args)
-
-            # Send batch end marker
-            if self.socket:
-                batch_end = build_batch_end(batch_id)
-                self.socket.sendto(batch_end, (self.host, self.port))
+            # Encode the whole batch before touching the socket so the send
+            # loop below is nothing but back-to-back send calls.
+            events = [event_data for event_data in events if len(event_data) >= 1]
+            seq_num = self.seq_num
+            messages = [
+                build_sequenced_message(seq_num + offset, event_data[0], *event_data[1:])
+                for offset, event_data in enumerate(events)
+            ]
+
+            self._send_messages((build_batch_start(batch_id),))
+            self._send_sequenced(
+                messages,
+                lambda seq, i: build_sequenced_message(seq, events[i][0], *events[i][1:]),
+            )
+            self._send_messages((build_batch_end(batch_id),))
 
         except Exception as e:
-            self.log("Failed to send batch: {}".format(str(e)))
+            if _LOG:
+                self.log("Failed to send batch: {}".format(str(e)))
+
+    def send_batch_homogeneous(self, event_path: str, *columns) -> int:
+        """
+        Send many events of one type, given as one column per argument.
+
+        Suited to high-rate telemetry such as a sweep of volume changes:
+        the encoder for the event signature is resolved once for the whole
+        batch and the datagrams go out back to back. No batch markers are
+        sent.
+
+        Args:
+            event_path: OSC address pattern shared by all events
+            *columns: Equal-length sequences, one per event argument
+
+        Returns:
+            int: Number of events sent successfully
+
+        Example:
+            >>> sender.send_batch_homogeneous("/live/track/volume", [0, 1, 2], [0.5, 0.7, 0.9])
+        """
+        if not self.enabled or self._send is None:
+            return 0
+
+        rows = list(zip(*columns))
+        try:
+            messages = build_sequenced_batch(self.seq_num, event_path, rows)
+        except Exception as e:
+            if _LOG:
+                self.log("Failed to encode batch: {}".format(str(e)))
+            return 0
+
+        return self._send_sequenced(
+            messages, lambda seq, i: build_sequenced_message(seq, event_path, *rows[i])
+        )
+
+    def _send_sequenced(self, messages: list, encode) -> int:
+        """
+        Send pre-built sequenced datagrams, consuming a sequence number per sent event.
+
+        Like send_event, a failed send does not use up its sequence number:
+        once a send fails, the remaining events are re-encoded with
+        ``encode(seq_num, position)`` so the numbers that reach the listener
+        stay contiguous.
+
+        Args:
+            messages: Encoded messages numbered from the current seq_num
+            encode: Callable re-encoding the event at a position with a new sequence number
+
+        Returns:
+            int: Number of messages sent successfully
+        """
+        send = self._send
+        seq_num = self.seq_num
+        sent = 0
+        for position, message in enumerate(messages):
+            if sent != position:
+                message = encode(seq_num, position)
+            try:
+                send(message)
+            except Exception as e:
+                self._handle_send_error(e)
+                continue
+            seq_num += 1
+            sent += 1
+
+        self.seq_num = seq_num
+        self.sent_count += sent
+        return sent
+
+    def _send_messages(self, messages: list) -> int:
+        """
+        Send pre-built datagrams in a tight loop.
+
+        Linux offers sendmmsg(2) to push many datagrams in one syscall, but
+        Live runs on macOS and Windows where it does not exist, so this keeps
+        the per-datagram send and just removes all other work from the loop.
+
+        Args:
+            messages: Encoded OSC messages to send in order
+
+        Returns:
+            int: Number of messages sent successfully
+        """
+        send = self._send
+        sent = 0
+        for message in messages:
+            try:
+                send(message)
+                sent += 1
+            except Exception as e:
+                self._handle_send_error(e)
+        return sent
 
     def get_stats(self) -> dict:
         """
         Get sender statistics.
 
         Returns:
-            dict: Statistics including sent_count, error_count, seq_num
+            dict: Statistics including sent_count, error_count, refused_count, seq_num
         """
         return {
             "enabled": self.enabled,
             "sent_count": self.sent_count,
             "error_count": self.error_count,
+            "refused_count": self.refused_count,
             "seq_num": self.seq_num,
             "host": self.host,
             "port": self.port
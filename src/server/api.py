@@ -14,12 +14,13 @@ import asyncio
 import json
 import logging
 import uuid
+from functools import partial
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
-from ..parser import load_ableton_xml, build_ast
+from ..parser import load_ableton_xml
 from ..ast import (
     ASTNode,
     NodeType,
@@ -60,6 +61,15 @@ from .validation import validate_event_args, validate_required_keys, safe_get
 from .utils import DebouncedBroadcaster
 from .services import QueryService, ProjectService
 
+# 'events.processed.by_type' tags for paths that used to be routed by
+# prefix, kept so the exact-match routing reports them under the same tags
+_PROCESSED_TAGS = {
+    "/live/device/param": {'event_type': 'device_param'},
+    "/live/transport/play": {'event_type': 'transport'},
+    "/live/transport/tempo": {'event_type': 'transport'},
+    "/live/transport/position": {'event_type': 'transport'},
+}
+
 
 class ASTServer:
     """
@@ -103,6 +113,10 @@ class ASTServer:
         self.cache = ASTCache(enabled=enable_cache, capacity=cache_capacity)
         logger.info(f"AST Cache initialized: enabled={enable_cache}, capacity={cache_capacity}")
 
+        # Parsed project trees, so repeated diffs against an unchanged file skip the parse
+        from .utils import ParsedASTCache
+        self.parse_cache = ParsedASTCache()
+
         # Metrics collection for monitoring
         from .utils import MetricsCollector
         self.metrics = MetricsCollector(enabled=enable_metrics)
@@ -140,6 +154,7 @@ class ASTServer:
             # Device events
             "/live/device/added": self.device_handler.handle_device_added,
             "/live/device/deleted": self.device_handler.handle_device_deleted,
+            "/live/device/param": self.device_handler.handle_device_param,
 
             # Scene events
             "/live/scene/renamed": self.scene_handler.handle_scene_renamed,
@@ -149,6 +164,12 @@ class ASTServer:
 
             # Clip slot events
             "/live/clip_slot/created": self.clip_slot_handler.handle_clip_slot_created,
+
+            # Transport events (the paths the remote script sends; other
+            # /live/transport/ paths still go through prefix routing)
+            "/live/transport/play": partial(self.transport_handler.handle_transport_event, "/live/transport/play"),
+            "/live/transport/tempo": partial(self.transport_handler.handle_transport_event, "/live/transport/tempo"),
+            "/live/transport/position": partial(self.transport_handler.handle_transport_event, "/live/transport/position"),
         }
 
     async def _broadcast_if_running(self, diff_result: Dict[str, Any]) -> None:
@@ -158,7 +179,8 @@ class ASTServer:
         Args:
             diff_result: Diff result dictionary to broadcast
         """
-        await self._broadcast_if_running(diff_result)
+        if self.websocket_server and self.websocket_server.is_running():
+            await self.websocket_server.broadcast_diff(diff_result)
 
     async def _broadcast_error_if_running(self, error_type: str, message: str) -> None:
         """
@@ -295,7 +317,7 @@ class ASTServer:
         """
         await self._broadcast_if_running(diff_result)
 
-    async def process_live_event(self, event_path: str, args: list, seq_num: int, timestamp: float) -> Optional[Dict[str, Any]]:
+    async def process_live_event(self, event_path: str, args: list, seq_num: int, timestamp: int) -> Optional[Dict[str, Any]]:
         """
         Process a real-time event from Ableton Live and update the AST.
 
@@ -305,14 +327,16 @@ class ASTServer:
             event_path: OSC event path (e.g., "/live/track/renamed")
             args: Event arguments
             seq_num: Sequence number from UDP
-            timestamp: Event timestamp
+            timestamp: Sender's time.monotonic_ns() at emission (relative
+                nanoseconds, not wall-clock time)
 
         Returns:
             Dictionary with processing result, or None if event was ignored
         """
-        # Track event received
+        # Track event received (the tag dict is shared by all metrics below)
+        event_tags = {'event_type': event_path}
         self.metrics.increment('events.received')
-        self.metrics.increment('events.received.by_type', tags={'event_type': event_path})
+        self.metrics.increment('events.received.by_type', tags=event_tags)
 
         if not self.current_ast:
             logger.warning(f"No AST loaded, ignoring event: {event_path}")
@@ -320,16 +344,20 @@ class ASTServer:
             return None
 
         # Time the entire event processing
-        with self.metrics.timer('event.processing.duration', tags={'event_type': event_path}):
+        with self.metrics.timer('event.processing.duration', tags=event_tags):
             try:
-                # Try exact match first
+                # Try exact match first; this covers the high-frequency
+                # device param and transport events as well
                 handler = self._event_handlers.get(event_path)
                 
                 if handler:
                     result = await handler(args, seq_num)
                     if result:
                         self.metrics.increment('events.processed')
-                        self.metrics.increment('events.processed.by_type', tags={'event_type': event_path})
+                        self.metrics.increment(
+                            'events.processed.by_type',
+                            tags=_PROCESSED_TAGS.get(event_path, event_tags)
+                        )
                     return result
                 
                 # Handle prefix-based routing for transport and device params
@@ -348,13 +376,13 @@ class ASTServer:
                 else:
                     logger.debug(f"Unhandled event type: {event_path}")
                     self.metrics.increment('events.unhandled')
-                    self.metrics.increment('events.unhandled.by_type', tags={'event_type': event_path})
+                    self.metrics.increment('events.unhandled.by_type', tags=event_tags)
                     return None
 
             except Exception as e:
                 logger.error(f"Error processing event {event_path}: {e}", exc_info=True)
                 self.metrics.increment('errors.event_processing')
-                self.metrics.increment('errors.event_processing.by_type', tags={'event_type': event_path})
+                self.metrics.increment('errors.event_processing.by_type', tags=event_tags)
                 
                 await self._broadcast_error_if_running(
                     "Event processing error",
@@ -8,7 +8,6 @@ This module provides utility classes for:
 - Generating diff results
 """
 
-import uuid
 from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
 from pathlib import Path
 
@@ -27,7 +26,10 @@ from ..ast import (
     SceneNode,
     MixerNode,
     hash_tree,
+    rehash_node,
 )
+from ..parser import extract_file_refs, iter_track_data
+from ..parser.scenes import extract_scenes
 from .constants import (
     EventConstants,
     NodeIDPatterns,
@@ -41,8 +43,28 @@ class ASTNavigator:
     Helper class for finding nodes in the AST.
     
     Supports optional caching for performance optimization.
+
+    With an ASTCache, tracks and scenes are looked up by index through the
+    cache's index maps (see ASTCache.find_by_index), which also work while
+    the root is unhashed; without one, the root's children are scanned.
     """
 
+    @staticmethod
+    def _find_by_index(
+        root: ProjectNode,
+        node_type: NodeType,
+        index: int,
+        cache: Optional['ASTCache']
+    ) -> Optional[ASTNode]:
+        """Find a direct child of the root by type and 'index' attribute."""
+        if cache and cache.enabled:
+            return cache.find_by_index(root, node_type, index)
+
+        for child in root.children:
+            if child.node_type == node_type and child.attributes.get('index') == index:
+                return child
+        return None
+
     @staticmethod
     def find_track_by_index(
         root: ProjectNode,
@@ -62,24 +84,7 @@ class ASTNavigator:
         """
         if not root:
             return None
-
-        # Try cache first
-        if cache:
-            cached = cache.get_track_by_index(index, ast_version=root.hash)
-            if cached is not None:
-                return cached
-
-        # Cache miss or no cache - compute
-        tracks = [child for child in root.children if child.node_type == NodeType.TRACK]
-
-        for track in tracks:
-            if track.attributes.get('index') == index:
-                # Cache the result
-                if cache:
-                    cache.put_track_by_index(index, track, ast_version=root.hash)
-                return track
-
-        return None
+        return ASTNavigator._find_by_index(root, NodeType.TRACK, index, cache)
 
     @staticmethod
     def find_scene_by_index(
@@ -100,24 +105,7 @@ class ASTNavigator:
         """
         if not root:
             return None
-
-        # Try cache first
-        if cache:
-            cached = cache.get_scene_by_index(index, ast_version=root.hash)
-            if cached is not None:
-                return cached
-
-        # Cache miss or no cache - compute
-        scenes = [child for child in root.children if child.node_type == NodeType.SCENE]
-
-        for scene in scenes:
-            if scene.attributes.get('index') == index:
-                # Cache the result
-                if cache:
-                    cache.put_scene_by_index(index, scene, ast_version=root.hash)
-                return scene
-
-        return None
+        return ASTNavigator._find_by_index(root, NodeType.SCENE, index, cache)
 
     @staticmethod
     def get_scenes(
@@ -138,7 +126,7 @@ class ASTNavigator:
             return []
 
         # Try cache first
-        if cache:
+        if cache and root.hash is not None:
             cached = cache.get_all_scenes(ast_version=root.hash)
             if cached is not None:
                 return cached
@@ -147,7 +135,7 @@ class ASTNavigator:
         scenes = [c for c in root.children if c.node_type == NodeType.SCENE]
 
         # Cache the result
-        if cache:
+        if cache and root.hash is not None:
             cache.put_all_scenes(scenes, ast_version=root.hash)
 
         return scenes
@@ -171,7 +159,7 @@ class ASTNavigator:
             return []
 
         # Try cache first
-        if cache:
+        if cache and root.hash is not None:
             cached = cache.get_all_tracks(ast_version=root.hash)
             if cached is not None:
                 return cached
@@ -180,7 +168,7 @@ class ASTNavigator:
         tracks = [c for c in root.children if c.node_type == NodeType.TRACK]
 
         # Cache the result
-        if cache:
+        if cache and root.hash is not None:
             cache.put_all_tracks(tracks, ast_version=root.hash)
 
         return tracks
@@ -200,12 +188,10 @@ class HashManager:
         """
         Recompute hashes for a node and all its parents.
 
-        Note: Since nodes don't have parent references, we rehash from root.
-        This could be optimized with parent pointers in the future.
+        Walks the parent references up to the root, so only the path from
+        the node to the root is rehashed.
         """
-        hash_tree(node)
-        if root:
-            hash_tree(root)
+        rehash_node(node)
 
 
 class DiffGenerator:
@@ -383,25 +369,30 @@ class SceneIndexManager:
             List of change dictionaries for shifted clip slots
         """
         changes = []
-        tracks = ASTNavigator.get_tracks(root, cache=None)
+        append = changes.append
+        slot_type = NodeType.CLIP_SLOT
 
-        for track in tracks:
+        # A shift near the top of a large set emits one change per slot,
+        # so the create_modified_change() layout is built inline here
+        for track in ASTNavigator.get_tracks(root, cache=None):
+            track_path = f"tracks[{track.attributes.get('index')}]"
             for slot in track.children:
-                if slot.node_type == NodeType.CLIP_SLOT:
-                    current_slot_scene_idx = slot.attributes.get('scene_index', -1)
-                    if current_slot_scene_idx >= start_idx:
-                        new_slot_scene_idx = current_slot_scene_idx + offset
-                        slot.attributes['scene_index'] = new_slot_scene_idx
-                        changes.append(
-                            DiffGenerator.create_modified_change(
-                                node_id=slot.id,
-                                node_type='clip_slot',
-                                path=f"tracks[{track.attributes.get('index')}].clip_slots[{current_slot_scene_idx}]",
-                                old_value={'scene_index': current_slot_scene_idx},
-                                new_value={'scene_index': new_slot_scene_idx},
-                                seq_num=seq_num
-                            )
-                        )
+                if slot.node_type != slot_type:
+                    continue
+                attributes = slot.attributes
+                current_slot_scene_idx = attributes.get('scene_index', -1)
+                if current_slot_scene_idx >= start_idx:
+                    new_slot_scene_idx = current_slot_scene_idx + offset
+                    attributes['scene_index'] = new_slot_scene_idx
+                    append({
+                        'type': 'modified',
+                        'node_id': slot.id,
+                        'node_type': 'clip_slot',
+                        'path': f"{track_path}.clip_slots[{current_slot_scene_idx}]",
+                        'old_value': {'scene_index': current_slot_scene_idx},
+                        'new_value': {'scene_index': new_slot_scene_idx},
+                        'seq_num': seq_num
+                    })
 
         return changes
 
@@ -449,26 +440,27 @@ class ClipSlotManager:
             new_slot: New clip slot node
             scene_idx: Scene index of the new slot
         """
-        # Find insertion point among clip slots
-        clip_slots = [c for c in track_node.children
-                     if c.node_type == NodeType.CLIP_SLOT]
-
-        # Try to find a slot with higher scene index
-        for slot in clip_slots:
-            if slot.attributes.get('scene_index') > scene_idx:
-                insert_idx = track_node.children.index(slot)
-                track_node.children.insert(insert_idx, new_slot)
-                return
+        new_slot.parent = track_node
+        children = track_node.children
+
+        # Find the insertion point in one pass over the track's children
+        mixer_idx = None
+        for pos, child in enumerate(children):
+            node_type = child.node_type
+            if node_type == NodeType.CLIP_SLOT:
+                # Slot with higher scene index found
+                if child.attributes.get('scene_index') > scene_idx:
+                    children.insert(pos, new_slot)
+                    return
+            elif node_type == NodeType.MIXER and mixer_idx is None:
+                mixer_idx = pos
 
         # No slot with higher index found, insert before mixer if possible
-        mixer_node = next((c for c in track_node.children
-                          if c.node_type == NodeType.MIXER), None)
-        if mixer_node:
-            insert_idx = track_node.children.index(mixer_node)
-            track_node.children.insert(insert_idx, new_slot)
+        if mixer_idx is not None:
+            children.insert(mixer_idx, new_slot)
         else:
             # No mixer, just append
-            track_node.children.append(new_slot)
+            children.append(new_slot)
 
     @staticmethod
     def update_clip_slot_attributes(
@@ -516,7 +508,7 @@ class ClipSlotManager:
         slot = ClipSlotNode(
             track_index=track_idx,
             scene_index=scene_idx,
-            id=NodeIDPatterns.clip_slot(uuid.uuid4().hex[:8])
+            id=NodeIDPatterns.clip_slot(NodeIDPatterns.runtime_suffix())
         )
         ClipSlotManager.update_clip_slot_attributes(
             slot, has_clip, has_stop, playing_status
@@ -548,34 +540,61 @@ class ASTBuilder:
 
         return project
 
+    @staticmethod
+    def build_from_xml(xml_root) -> ProjectNode:
+        """
+        Build structured node objects directly from the XML root.
+
+        Each track is turned into a TrackNode as soon as the parser has
+        extracted it, so the raw dictionary for the whole project is never
+        materialized and the legacy per-track clip list is skipped.
+        """
+        project = ProjectNode(id="project")
+
+        # Scenes are needed up front to size each track's clip slot list
+        scenes = extract_scenes(xml_root)
+
+        for track_data in iter_track_data(xml_root, len(scenes), legacy=False):
+            project.add_child(ASTBuilder._build_track(track_data))
+
+        ASTBuilder._build_scenes(project, {"scenes": scenes})
+        ASTBuilder._build_file_refs(project, {"file_refs": extract_file_refs(xml_root)})
+
+        return project
+
     @staticmethod
     def _build_tracks(project: ProjectNode, raw_ast: Dict) -> None:
         """Build track nodes and add them to the project."""
         for track_data in raw_ast.get("tracks", []):
-            track_node = TrackNode(
-                name=track_data["name"],
-                index=track_data["index"],
-                id=NodeIDPatterns.track(track_data['index'])
-            )
+            project.add_child(ASTBuilder._build_track(track_data))
+
+    @staticmethod
+    def _build_track(track_data: Dict) -> TrackNode:
+        """Build a track node with its devices, clip slots, and mixer."""
+        track_node = TrackNode(
+            name=track_data["name"],
+            index=track_data["index"],
+            id=NodeIDPatterns.track(track_data['index'])
+        )
 
-            # Set track type (regular, return, or master)
-            if track_data.get("type") is not None:
-                track_node.attributes["type"] = track_data["type"]
+        # Set track type (regular, return, or master)
+        if track_data.get("type") is not None:
+            track_node.attributes["type"] = track_data["type"]
 
-            # Set color if available
-            if track_data.get("color") is not None:
-                track_node.attributes["color"] = track_data["color"]
+        # Set color if available
+        if track_data.get("color") is not None:
+            track_node.attributes["color"] = track_data["color"]
 
-            # Add devices
-            ASTBuilder._build_devices(track_node, track_data)
+        # Add devices
+        ASTBuilder._build_devices(track_node, track_data)
 
-            # Add clip slots
-            ASTBuilder._build_clip_slots(track_node, track_data)
+        # Add clip slots
+        ASTBuilder._build_clip_slots(track_node, track_data)
 
-            # Add mixer settings
-            ASTBuilder._build_mixer(track_node, track_data)
+        # Add mixer settings
+        ASTBuilder._build_mixer(track_node, track_data)
 
-            project.add_child(track_node)
+        return track_node
 
     @staticmethod
     def _build_devices(track_node: TrackNode, track_data: Dict) -> None:
@@ -600,7 +619,7 @@ class ASTBuilder:
             clip_slot_node = ClipSlotNode(
                 track_index=track_data["index"],
                 scene_index=scene_idx,
-                id=NodeIDPatterns.clip_slot(uuid.uuid4().hex[:8])
+                id=NodeIDPatterns.loaded_clip_slot(track_data["index"], scene_idx)
             )
 
             # Set clip slot properties
@@ -666,7 +685,7 @@ class ASTBuilder:
             scene_node = SceneNode(
                 name=scene_data.get("name", ""),
                 index=scene_data.get("index", 0),
-                id=NodeIDPatterns.scene(uuid.uuid4().hex[:8])
+                id=NodeIDPatterns.loaded_scene(scene_data.get("index", 0))
             )
             scene_node.attributes['color'] = scene_data.get("color", EventConstants.DEFAULT_COLOR)
             scene_node.attributes['tempo'] = scene_data.get("tempo", EventConstants.DEFAULT_TEMPO)
@@ -5,8 +5,16 @@ This module centralizes magic values and constants used throughout
 the event handling and AST manipulation code.
 """
 
+import itertools
+import secrets
 from enum import IntEnum
 
+# Suffixes for IDs of nodes created by live events: a random per-process
+# prefix plus a counter, unique within the process without a uuid4() call
+# (and its urandom read) per node
+_RUNTIME_ID_PREFIX = secrets.token_hex(3)
+_runtime_id_counter = itertools.count()
+
 
 class EventConstants:
     """Constants for event handling and processing."""
@@ -66,6 +74,11 @@ class NodeIDPatterns:
             return f"device_{track_idx}_{device_idx}_{seq_num}"
         return f"device_{track_idx}_{device_idx}"
 
+    @staticmethod
+    def runtime_suffix() -> str:
+        """Generate a process-unique suffix for scene() and clip_slot() IDs."""
+        return f"{_RUNTIME_ID_PREFIX}{next(_runtime_id_counter):05x}"
+
     @staticmethod
     def scene(uuid_hex: str) -> str:
         """Generate a scene node ID with UUID."""
@@ -76,6 +89,28 @@ class NodeIDPatterns:
         """Generate a clip slot node ID with UUID."""
         return f"clip_slot_{uuid_hex}"
 
+    @staticmethod
+    def loaded_scene(index: int) -> str:
+        """
+        Generate the ID of a scene read from a project file.
+
+        Derived from the scene's position, like clip IDs, so parsing the
+        same file always yields the same IDs and reloads diff cleanly.
+        Scenes added by live events use scene() instead, whose random
+        suffix cannot collide with these.
+        """
+        return f"scene_{index}"
+
+    @staticmethod
+    def loaded_clip_slot(track_idx: int, scene_idx: int) -> str:
+        """
+        Generate the ID of a clip slot read from a project file.
+
+        Position-derived for the same reasons as loaded_scene(); clip
+        slots created by live events use clip_slot().
+        """
+        return f"clip_slot_{track_idx}_{scene_idx}"
+
     @staticmethod
     def clip(track_idx: int, scene_idx: int) -> str:
         """Generate a clip node ID."""
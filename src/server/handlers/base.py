@@ -196,12 +196,12 @@ class BaseEventHandler:
     def _find_track(self, track_index: int) -> Optional[ASTNode]:
         """Find track node by index."""
         from ..ast_helpers import ASTNavigator
-        return ASTNavigator.find_track_by_index(self.ast, track_index)
+        return ASTNavigator.find_track_by_index(self.ast, track_index, cache=self.server.cache)
 
     def _find_scene(self, scene_index: int) -> Optional[ASTNode]:
         """Find scene node by index."""
         from ..ast_helpers import ASTNavigator
-        return ASTNavigator.find_scene_by_index(self.ast, scene_index)
+        return ASTNavigator.find_scene_by_index(self.ast, scene_index, cache=self.server.cache)
 
     def _find_device(self, track_index: int, device_index: int) -> Optional[ASTNode]:
         """Find device node by track and device index."""
@@ -10,7 +10,7 @@ import json
 import logging
 from typing import Dict, Any
 
-from ...ast import hash_tree
+from ...ast import rehash_node
 from ..ast_helpers import DiffGenerator, ClipSlotManager
 from .base import BaseEventHandler
 
@@ -63,8 +63,7 @@ class ClipSlotEventHandler(BaseEventHandler):
                 existing_slot, has_clip, has_stop, playing_status
             )
 
-            hash_tree(existing_slot)
-            self._recompute_parent_hashes(track_node)
+            rehash_node(existing_slot)
 
             # Send 'modified' diff instead of 'added'
             change = DiffGenerator.create_modified_change(
@@ -95,8 +94,7 @@ class ClipSlotEventHandler(BaseEventHandler):
             # Insert clip slot in correct position
             ClipSlotManager.insert_clip_slot(track_node, new_slot, scene_idx)
 
-            hash_tree(track_node)
-            self._recompute_parent_hashes(track_node)
+            rehash_node(track_node)
 
             # Generate diff for added clip slot
             change = DiffGenerator.create_added_change(
@@ -118,15 +116,9 @@ class ClipSlotEventHandler(BaseEventHandler):
                 added=[new_slot.id]
             )
 
-        logger.info(f"[handle_clip_slot_created] Broadcasting diff_result: {json.dumps(diff_result, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[handle_clip_slot_created] Broadcasting diff_result: %s", json.dumps(diff_result))
         await self._broadcast_if_running(diff_result)
 
         logger.info(f"Clip slot created for track {track_idx}, scene {scene_idx}")
         return {"type": "clip_slot_created", "track_idx": track_idx, "scene_idx": scene_idx}
-
-    def _recompute_parent_hashes(self, node):
-        """Recompute hashes for parent nodes."""
-        current = node
-        while hasattr(current, 'parent') and current.parent:
-            hash_tree(current.parent)
-            current = current.parent
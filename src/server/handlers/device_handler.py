@@ -8,9 +8,9 @@ Handles all device-related events including:
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-from ...ast import DeviceNode, NodeType, hash_tree
+from ...ast import DeviceNode, NodeType, invalidate_hash, rehash_node
 from ..ast_helpers import DiffGenerator
 from ..constants import EventConstants, NodeIDPatterns, PlayingStatus
 from .base import BaseEventHandler
@@ -57,15 +57,18 @@ class DeviceEventHandler(BaseEventHandler):
             id=NodeIDPatterns.device(track_idx, device_idx, seq_num)
         )
 
-        # Insert device at the specified index
-        devices_list = track_node.children
-        if device_idx <= len(devices_list):
-            devices_list.insert(device_idx, new_device)
+        # Insert device at the specified index among the track's devices
+        new_device.parent = track_node
+        positions = self._device_positions(track_node)
+        if device_idx < len(positions):
+            track_node.children.insert(positions[device_idx], new_device)
+        elif positions:
+            track_node.children.insert(positions[-1] + 1, new_device)
         else:
-            devices_list.append(new_device)
+            # Devices come before clip slots and the mixer
+            track_node.children.insert(0, new_device)
 
-        hash_tree(track_node)
-        self._recompute_parent_hashes(track_node)
+        rehash_node(track_node)
 
         # Generate diff using DiffGenerator
         change = DiffGenerator.create_added_change(
@@ -112,13 +115,13 @@ class DeviceEventHandler(BaseEventHandler):
             return None
 
         # Find and remove device
-        devices_list = track_node.children
-        if device_idx < len(devices_list):
-            removed_device = devices_list.pop(device_idx)
+        positions = self._device_positions(track_node)
+        if device_idx < len(positions):
+            removed_device = track_node.children.pop(positions[device_idx])
+            removed_device.parent = None
 
             # Recompute hashes
-            hash_tree(track_node)
-            self._recompute_parent_hashes(track_node)
+            rehash_node(track_node)
 
             # Generate diff
             diff_result = {
@@ -192,6 +195,10 @@ class DeviceEventHandler(BaseEventHandler):
 
         device_node.attributes['parameters'] = params
 
+        # Parameter automation arrives in bursts, so only clear the stale
+        # hashes here; broadcast_device_param_change rehashes once per burst
+        invalidate_hash(device_node)
+
         # Create event arguments for debouncing
         event_args = {
             'track_index': track_idx,
@@ -213,7 +220,7 @@ class DeviceEventHandler(BaseEventHandler):
 
     async def broadcast_device_param_change(self, event_type: str, event_args: Dict[str, Any]) -> None:
         """
-        Broadcast device parameter change after debouncing.
+        Rehash and broadcast a device parameter change after debouncing.
 
         Args:
             event_type: Event type (device_parameter_changed)
@@ -226,6 +233,13 @@ class DeviceEventHandler(BaseEventHandler):
         node_id = event_args['device_node_id']
         seq_num = event_args.get('seq_num', 0)
 
+        # Update hashes, unless the device was deleted in the meantime
+        track_node = self._find_track(track_idx)
+        if track_node:
+            device_node = next((c for c in track_node.children if c.id == node_id), None)
+            if device_node:
+                rehash_node(device_node)
+
         # Generate diff
         diff_result = {
             'changes': [{
@@ -246,9 +260,13 @@ class DeviceEventHandler(BaseEventHandler):
 
         await self._broadcast_if_running(diff_result)
 
-    def _recompute_parent_hashes(self, node):
-        """Recompute hashes for parent nodes."""
-        current = node
-        while hasattr(current, 'parent') and current.parent:
-            hash_tree(current.parent)
-            current = current.parent
+    @staticmethod
+    def _device_positions(track_node) -> List[int]:
+        """
+        Get the positions of a track's devices within its children.
+
+        Track children also hold clip slots and the mixer, so a Live device
+        index has to be mapped to a position in the children list.
+        """
+        return [i for i, child in enumerate(track_node.children)
+                if child.node_type == NodeType.DEVICE]
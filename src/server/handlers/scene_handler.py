@@ -10,10 +10,9 @@ Handles all scene-related events including:
 
 import json
 import logging
-import uuid
 from typing import Dict, Any, List
 
-from ...ast import NodeType, SceneNode, hash_tree
+from ...ast import NodeType, SceneNode, hash_tree, rehash_node
 from ..ast_helpers import ASTNavigator, DiffGenerator, SceneIndexManager
 from ..constants import NodeIDPatterns
 from .base import BaseEventHandler
@@ -52,15 +51,16 @@ class SceneEventHandler(BaseEventHandler):
             logger.warning(f"Scene {scene_idx} not found in AST")
             return None
 
-        # Store old name
+        # Store old name; an unchanged name needs no rehash or broadcast
         old_name = scene_node.attributes.get('name', '')
+        if old_name == new_name:
+            return {"type": "scene_renamed", "scene_idx": scene_idx, "name": new_name, "ignored": True}
 
         # Update scene name
         scene_node.attributes['name'] = new_name
 
         # Recompute hash
-        hash_tree(scene_node)
-        self._recompute_parent_hashes(scene_node)
+        rehash_node(scene_node)
 
         # Generate diff
         diff_result = {
@@ -125,14 +125,14 @@ class SceneEventHandler(BaseEventHandler):
         new_scene = SceneNode(
             name=scene_name,
             index=scene_idx,
-            id=NodeIDPatterns.scene(uuid.uuid4().hex[:8])
+            id=NodeIDPatterns.scene(NodeIDPatterns.runtime_suffix())
         )
 
         # Insert scene into project children
         self._insert_scene_at_index(new_scene, scene_idx)
 
-        hash_tree(new_scene)
-        self._recompute_parent_hashes(new_scene)
+        # Shifted scenes and clip slots changed index as well
+        self._rehash_after_scene_shift(scene_idx)
 
         # Add new scene change to list
         changes.append(
@@ -153,7 +153,10 @@ class SceneEventHandler(BaseEventHandler):
             modified=modified_nodes
         )
 
-        logger.info(f"[handle_scene_added] Broadcasting diff_result: {json.dumps(diff_result, indent=2)}")
+        # Arguments are evaluated even when the record is dropped, so only
+        # serialize the diff when someone is listening
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[handle_scene_added] Broadcasting diff_result: %s", json.dumps(diff_result))
         await self._broadcast_if_running(diff_result)
 
         logger.info(f"Scene {scene_idx} added: '{scene_name}'")
@@ -206,7 +209,7 @@ class SceneEventHandler(BaseEventHandler):
         changes.extend(slot_changes)
 
         # Recompute hashes after all modifications
-        self._recompute_parent_hashes(self.ast)
+        self._rehash_after_scene_shift(scene_idx)
 
         diff_result = DiffGenerator.create_diff_result(
             changes=changes,
@@ -249,6 +252,29 @@ class SceneEventHandler(BaseEventHandler):
         # Return success without making changes
         return {"type": "scene_reordered", "scene_idx": new_idx, "ignored": True}
 
+    def _rehash_after_scene_shift(self, scene_idx: int) -> None:
+        """
+        Recompute hashes after a scene was added or removed at scene_idx.
+
+        Only scenes and clip slots at or after scene_idx changed index, so
+        only those are rehashed, along with the tracks holding them and the
+        root. Slots before the change point and deeper nodes (clips) keep
+        their hashes.
+        """
+        scene_type = NodeType.SCENE
+        track_type = NodeType.TRACK
+        slot_type = NodeType.CLIP_SLOT
+        for node in self.ast.children:
+            if node.node_type == track_type:
+                for child in node.children:
+                    if child.node_type == slot_type and child.attributes.get('scene_index', -1) >= scene_idx:
+                        child.hash = None
+                node.hash = None
+            elif node.node_type == scene_type and node.attributes.get('index', -1) >= scene_idx:
+                node.hash = None
+        self.ast.hash = None
+        hash_tree(self.ast)
+
     def _insert_scene_at_index(self, new_scene: SceneNode, scene_idx: int) -> None:
         """
         Insert a scene at the specified index in the project children list.
@@ -261,34 +287,39 @@ class SceneEventHandler(BaseEventHandler):
             logger.warning("No current AST, cannot insert scene.")
             return
 
-        scenes = ASTNavigator.get_scenes(self.ast, cache=self.server.cache)
-        tracks = ASTNavigator.get_tracks(self.ast, cache=self.server.cache)
-
-        # Find the scene with index > scene_idx to insert before
-        target_scene = None
-        for s in self.ast.children:
-            if s.node_type == NodeType.SCENE and s.attributes.get('index') > scene_idx:
-                target_scene = s
-                break
-
-        if target_scene:
-            insert_idx = self.ast.children.index(target_scene)
-            self.ast.children.insert(insert_idx, new_scene)
+        new_scene.parent = self.ast
+        children = self.ast.children
+
+        # One pass over the children finds the insertion point: before the
+        # first scene with a higher index, else after the last scene
+        insert_idx = None
+        last_scene_idx = None
+        scene_type = NodeType.SCENE
+        for pos, child in enumerate(children):
+            if child.node_type == scene_type:
+                if child.attributes.get('index') > scene_idx:
+                    insert_idx = pos
+                    break
+                last_scene_idx = pos
+
+        if insert_idx is not None:
+            children.insert(insert_idx, new_scene)
             logger.debug(f"Inserted new scene at index {insert_idx}")
-        elif scenes:
+        elif last_scene_idx is not None:
             # Append after last scene
-            last_scene_idx = self.ast.children.index(scenes[-1])
-            self.ast.children.insert(last_scene_idx + 1, new_scene)
+            children.insert(last_scene_idx + 1, new_scene)
             logger.debug(f"Appended after last scene (index {last_scene_idx + 1})")
-        elif tracks:
-            # No scenes, insert after last track
-            last_track_idx = self.ast.children.index(tracks[-1])
-            self.ast.children.insert(last_track_idx + 1, new_scene)
-            logger.debug(f"Inserted after last track (index {last_track_idx + 1})")
         else:
-            # Empty project
-            self.ast.children.append(new_scene)
-            logger.debug("Appended to empty children list")
+            tracks = ASTNavigator.get_tracks(self.ast, cache=self.server.cache)
+            if tracks:
+                # No scenes, insert after last track
+                last_track_idx = children.index(tracks[-1])
+                children.insert(last_track_idx + 1, new_scene)
+                logger.debug(f"Inserted after last track (index {last_track_idx + 1})")
+            else:
+                # Empty project
+                children.append(new_scene)
+                logger.debug("Appended to empty children list")
 
     def _remove_clip_slots_for_scene(
         self,
@@ -334,13 +365,6 @@ class SceneEventHandler(BaseEventHandler):
 
         return removed_clip_slot_ids
 
-    def _recompute_parent_hashes(self, node):
-        """Recompute hashes for parent nodes."""
-        current = node
-        while hasattr(current, 'parent') and current.parent:
-            hash_tree(current.parent)
-            current = current.parent
-
     def _find_scene(self, scene_idx: int):
         """Find scene by index. Alias for consistency."""
-        return ASTNavigator.find_scene_by_index(self.ast, scene_idx)
+        return ASTNavigator.find_scene_by_index(self.ast, scene_idx, cache=self.server.cache)
@@ -9,12 +9,19 @@ Handles all track-related events including:
 import logging
 from typing import Dict, Any, Optional
 
-from ...ast import hash_tree
+from ...ast import invalidate_hash, rehash_node
 from ..ast_helpers import DiffGenerator
 from .base import BaseEventHandler, EventResult
 
 logger = logging.getLogger(__name__)
 
+# Continuous track attributes (fader moves) and the debouncer event type used
+# to coalesce them; discrete states like mute and arm are broadcast at once
+DEBOUNCED_TRACK_ATTRIBUTES = {
+    "volume": "volume_changed",
+    "pan": "pan_changed",
+}
+
 
 class TrackEventHandler(BaseEventHandler):
     """
@@ -47,13 +54,16 @@ class TrackEventHandler(BaseEventHandler):
             logger.warning(f"Track {track_idx} not found in AST")
             return None
 
-        # Update track name
+        # Live re-sends unchanged names; nothing to rehash or broadcast
         old_name = track_node.attributes.get('name', '')
+        if old_name == new_name:
+            return {"type": "track_renamed", "track_idx": track_idx, "name": new_name, "ignored": True}
+
+        # Update track name
         track_node.attributes['name'] = new_name
 
         # Update hashes
-        hash_tree(track_node)
-        self._recompute_parent_hashes(track_node)
+        rehash_node(track_node)
 
         # Generate diff
         change = DiffGenerator.create_modified_change(
@@ -80,6 +90,11 @@ class TrackEventHandler(BaseEventHandler):
         """
         Handle track state change (mute, arm, volume, etc.).
 
+        Continuous attributes (volume, pan) are debounced: the AST value is
+        updated right away and the track's hash path is cleared, while the
+        rehash and the broadcast happen once per burst in
+        broadcast_track_state_change().
+
         Args:
             args: [track_index, value]
             seq_num: Sequence number from event
@@ -101,13 +116,36 @@ class TrackEventHandler(BaseEventHandler):
             logger.warning(f"Track {track_idx} not found in AST")
             return None
 
-        # Update track state
+        # Redundant updates (e.g. idle volume messages) change nothing, so
+        # skip the rehash and broadcast
         old_value = track_node.attributes.get(attribute)
+        if attribute in track_node.attributes and old_value == value:
+            return {"type": "track_state", "track_idx": track_idx, "attribute": attribute, "value": value, "ignored": True}
+
+        # Update track state
         track_node.attributes[attribute] = value
 
+        event_type = DEBOUNCED_TRACK_ATTRIBUTES.get(attribute)
+        if event_type:
+            invalidate_hash(track_node)
+            event_args = {
+                'track_index': track_idx,
+                'attribute': attribute,
+                'old_value': old_value,
+                'new_value': value,
+                'seq_num': seq_num
+            }
+
+            await self.server.debouncer.debounce(
+                event_type,
+                event_args,
+                self.broadcast_track_state_change
+            )
+
+            return {"type": "track_state", "track_idx": track_idx, "attribute": attribute, "value": value, "debounced": True}
+
         # Update hashes
-        hash_tree(track_node)
-        self._recompute_parent_hashes(track_node)
+        rehash_node(track_node)
 
         # Generate diff
         change = DiffGenerator.create_state_changed(
@@ -131,9 +169,36 @@ class TrackEventHandler(BaseEventHandler):
         logger.info(f"Track {track_idx} {attribute} changed: {old_value} → {value}")
         return {"type": "track_state", "track_idx": track_idx, "attribute": attribute, "value": value}
 
-    def _recompute_parent_hashes(self, node):
-        """Recompute hashes for parent nodes."""
-        current = node
-        while hasattr(current, 'parent') and current.parent:
-            hash_tree(current.parent)
-            current = current.parent
+    async def broadcast_track_state_change(self, event_type: str, event_args: Dict[str, Any]) -> None:
+        """
+        Rehash and broadcast a debounced track state change.
+
+        Args:
+            event_type: Event type (volume_changed, pan_changed)
+            event_args: Event arguments with the latest value of the burst
+        """
+        track_idx = event_args['track_index']
+        track_node = self._find_track(track_idx)
+        if not track_node:
+            logger.warning(f"Track {track_idx} not found in AST")
+            return
+
+        # Update hashes
+        rehash_node(track_node)
+
+        change = DiffGenerator.create_state_changed(
+            node_id=track_node.id,
+            node_type='track',
+            path=f"tracks[{track_idx}]",
+            attribute=event_args['attribute'],
+            old_value=event_args['old_value'],
+            new_value=event_args['new_value'],
+            seq_num=event_args.get('seq_num', 0)
+        )
+
+        diff_result = DiffGenerator.create_diff_result(
+            changes=[change],
+            modified=[track_node.id]
+        )
+
+        await self._broadcast_if_running(diff_result)
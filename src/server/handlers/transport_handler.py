@@ -10,6 +10,7 @@ Handles all transport-related events including:
 import logging
 from typing import Dict, Any
 
+from ...ast import invalidate_hash, rehash_node
 from .base import BaseEventHandler
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,9 @@ class TransportEventHandler(BaseEventHandler):
 
         # Phase 12a Task 3: Debounce tempo changes to reduce message floods
         if attribute == "tempo":
+            # Rehashed once per burst by broadcast_transport_change
+            invalidate_hash(self.ast)
+
             event_args = {
                 'node_id': self.ast.id,
                 'attribute': attribute,
@@ -81,6 +85,7 @@ class TransportEventHandler(BaseEventHandler):
             return {"type": "transport_event", "attribute": attribute, "value": value, "debounced": True}
 
         # Playback and position events are sent immediately (not debounced)
+        rehash_node(self.ast)
         diff_result = {
             'changes': [{
                 'type': 'state_changed',
@@ -103,12 +108,15 @@ class TransportEventHandler(BaseEventHandler):
 
     async def broadcast_transport_change(self, event_type: str, event_args: Dict[str, Any]) -> None:
         """
-        Broadcast transport change after debouncing (Phase 12a Task 3).
+        Rehash and broadcast transport change after debouncing (Phase 12a Task 3).
 
         Args:
             event_type: Event type (tempo_changed, etc.)
             event_args: Event arguments with transport details
         """
+        if self.ast:
+            rehash_node(self.ast)
+
         diff_result = {
             'changes': [{
                 'type': 'state_changed',
@@ -10,9 +10,10 @@ import logging
 from pathlib import Path
 from typing import Dict, Any
 
-from ...ast import ProjectNode, hash_tree
-from ...parser import load_ableton_xml, build_ast
+from ...ast import hash_tree
+from ...parser import load_ableton_xml
 from ..ast_helpers import ASTBuilder
+from ..utils import ParsedASTCache
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,7 @@ class ProjectService:
         """
         self.server = server
         self.logger = logging.getLogger(f"{__name__}.ProjectService")
+        self._pending_broadcasts = set()
 
     def load_project(self, file_path: Path, broadcast: bool = True) -> Dict[str, Any]:
         """
@@ -51,24 +53,30 @@ class ProjectService:
         """
         self.server.current_file = file_path
 
-        # Load and parse XML
-        tree = load_ableton_xml(file_path)
-        raw_ast = build_ast(tree.getroot())
+        # Cached nodes point into the previous tree; drop them with it. An
+        # unchanged file reloads with the same root hash, so the
+        # version-keyed caches would otherwise keep serving the old nodes.
+        self.server.cache.invalidate_all()
+        self.server.cache.reset_index()
 
-        # Convert to structured AST nodes
-        self.server.current_ast = self._build_node_tree(raw_ast, tree.getroot())
+        # Reuse a tree parsed earlier (e.g. by diff_with_file) if the file is unchanged.
+        # It is taken out of the cache because the live AST gets mutated by events.
+        cache_key = ParsedASTCache.key_for(file_path)
+        cached = self.server.parse_cache.take(cache_key) if cache_key else None
 
-        # Compute hashes
-        hash_tree(self.server.current_ast)
+        if cached is not None:
+            self.server.current_ast = cached
+        else:
+            # Load and parse XML, building structured AST nodes in the same pass
+            tree = load_ableton_xml(file_path)
+            self.server.current_ast = ASTBuilder.build_from_xml(tree.getroot())
+
+            # Compute hashes
+            hash_tree(self.server.current_ast)
 
         # Broadcast to WebSocket clients if enabled
         if broadcast and self.server.websocket_server and self.server.websocket_server.is_running():
-            asyncio.create_task(
-                self.server.websocket_server.broadcast_full_ast(
-                    self.server.current_ast,
-                    str(file_path)
-                )
-            )
+            self._schedule_full_ast_broadcast(str(file_path))
 
         return {
             "status": "success",
@@ -76,18 +84,44 @@ class ProjectService:
             "root_hash": self.server.current_ast.hash,
         }
 
-    def _build_node_tree(self, raw_ast: Dict, xml_root) -> ProjectNode:
+    def _schedule_full_ast_broadcast(self, project_path: str) -> None:
         """
-        Convert the raw dictionary AST to structured node objects.
+        Schedule a FULL_AST broadcast without waiting for it.
 
-        This bridges the gap between the parser's dict output
-        and the AST node structure.
+        load_project is synchronous, so the broadcast runs as a task on the
+        WebSocket server's event loop: directly when called on that loop,
+        thread-safely otherwise (e.g. from a file watcher thread). Failures
+        are logged instead of being lost with the unawaited task.
 
         Args:
-            raw_ast: Raw AST dictionary from parser
-            xml_root: XML root element
-
-        Returns:
-            ProjectNode representing the AST root
+            project_path: Path of the loaded project file
         """
-        return ASTBuilder.build_node_tree(raw_ast, xml_root)
+        websocket_server = self.server.websocket_server
+        coro = websocket_server.broadcast_full_ast(self.server.current_ast, project_path)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            future = loop.create_task(coro)
+        elif websocket_server.loop is not None and websocket_server.loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(coro, websocket_server.loop)
+        else:
+            coro.close()
+            self.logger.warning("No running event loop, skipping full AST broadcast")
+            return
+
+        # Keep a reference so the task is not garbage collected while pending
+        self._pending_broadcasts.add(future)
+        future.add_done_callback(self._on_broadcast_done)
+
+    def _on_broadcast_done(self, future) -> None:
+        """Forget a finished broadcast and log its failure, if any."""
+        self._pending_broadcasts.discard(future)
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            self.logger.error("Full AST broadcast failed: %s", exc, exc_info=exc)
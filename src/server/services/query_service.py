@@ -4,9 +4,10 @@ Query service for AST operations.
 This service provides all query, search, and diff operations on the AST.
 """
 
+import ast
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable
 
 from ...ast import (
     ASTNode,
@@ -16,11 +17,124 @@ from ...ast import (
     SearchVisitor,
     hash_tree,
 )
-from ...parser import load_ableton_xml, build_ast
+from ...parser import load_ableton_xml
 from ..ast_helpers import ASTBuilder
+from ..utils import ParsedASTCache
 
 logger = logging.getLogger(__name__)
 
+# NodeType members by their string value, for request-time lookups
+_NODE_TYPES_BY_VALUE: Dict[str, NodeType] = {t.value: t for t in NodeType}
+
+# Comparison operators allowed in query predicates
+_PREDICATE_OPS = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn)
+
+# Upper bound on distinct compiled predicates kept by a QueryService
+_PREDICATE_CACHE_SIZE = 128
+
+
+def _predicate_literal(node: ast.expr) -> Any:
+    """Evaluate the right-hand side of a predicate comparison."""
+    # Bare words compare as strings, e.g. "name == Audio"
+    if isinstance(node, ast.Name):
+        return node.id
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError):
+        raise ValueError(f"Unsupported predicate value: {ast.unparse(node)}")
+    # Constants must be immutable to be compiled into the code object
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _attr_equals(value: Any, literal: Any, raw: str) -> bool:
+    """Equality used for ``==``/``!=``: string attributes compare against the raw text."""
+    if isinstance(value, str):
+        return value == raw
+    return value == literal
+
+
+def _rewrite_predicate(node: ast.expr, source: str) -> ast.expr:
+    """Rewrite a parsed predicate into an expression over an attributes dict ``a``."""
+    if isinstance(node, ast.BoolOp):
+        return ast.BoolOp(op=node.op, values=[_rewrite_predicate(v, source) for v in node.values])
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return ast.UnaryOp(op=node.op, operand=_rewrite_predicate(node.operand, source))
+
+    if (isinstance(node, ast.Compare) and isinstance(node.left, ast.Name)
+            and len(node.ops) == 1 and isinstance(node.ops[0], _PREDICATE_OPS)):
+        # a.get("<attribute>") <op> <literal>
+        lookup = ast.Call(
+            func=ast.Attribute(value=ast.Name(id="a", ctx=ast.Load()), attr="get", ctx=ast.Load()),
+            args=[ast.Constant(node.left.id)],
+            keywords=[],
+        )
+        literal = ast.Constant(_predicate_literal(node.comparators[0]))
+        if isinstance(node.ops[0], (ast.Eq, ast.NotEq)):
+            # _attr_equals(a.get("<attribute>"), <literal>, "<raw text>")
+            raw = ast.get_source_segment(source, node.comparators[0]) or ""
+            equals = ast.Call(
+                func=ast.Name(id="_attr_equals", ctx=ast.Load()),
+                args=[lookup, literal, ast.Constant(raw.strip().strip("'\""))],
+                keywords=[],
+            )
+            if isinstance(node.ops[0], ast.NotEq):
+                return ast.UnaryOp(op=ast.Not(), operand=equals)
+            return equals
+        return ast.Compare(left=lookup, ops=node.ops, comparators=[literal])
+
+    raise ValueError(f"Unsupported predicate expression: {ast.unparse(node)}")
+
+
+def _compile_predicate(predicate_str: str) -> Callable[[ASTNode], bool]:
+    """
+    Compile a query predicate into a function over nodes.
+
+    Supports comparisons of an attribute against a literal (``==``, ``!=``,
+    ``<``, ``<=``, ``>``, ``>=``, ``in``, ``not in``) combined with ``and``,
+    ``or`` and ``not``. The expression is parsed and compiled once; matching
+    a node is a single call of the compiled function on its attributes.
+    String attributes compare equal to the text of the value as written, so
+    "name == 5" matches a track named "5". Values that are not valid literal
+    expressions ("name == Audio 1", "name == Bass-1") keep the original
+    split-on-``==`` string comparison.
+
+    Raises:
+        ValueError: If the predicate uses unsupported syntax
+    """
+    source = predicate_str.strip()
+    try:
+        tree = ast.parse(source, mode="eval")
+        func = ast.Expression(ast.Lambda(
+            args=ast.arguments(posonlyargs=[], args=[ast.arg(arg="a")], kwonlyargs=[],
+                               kw_defaults=[], defaults=[]),
+            body=_rewrite_predicate(tree.body, source),
+        ))
+        ast.fix_missing_locations(func)
+        code = compile(func, "<predicate>", "eval")
+    except (SyntaxError, ValueError, TypeError):
+        if "==" not in predicate_str:
+            raise ValueError(f"Invalid predicate: {predicate_str!r}")
+        key, _, value = predicate_str.partition("==")
+        key = key.strip()
+        value = value.strip().strip("'\"")
+        return lambda node: node.attributes.get(key) == value
+
+    match = eval(code, {"__builtins__": {}, "_attr_equals": _attr_equals})
+
+    def predicate(node: ASTNode) -> bool:
+        try:
+            return bool(match(node.attributes))
+        except TypeError:
+            # Ordering against a missing or differently typed attribute
+            return False
+
+    return predicate
+
 
 class QueryService:
     """
@@ -41,20 +155,89 @@ class QueryService:
             server: ASTServer instance providing current_ast reference
         """
         self.server = server
-        self.serializer = SerializationVisitor()
+        self.serializer = SerializationVisitor(cache_by_hash=True)
         self.diff_visitor = DiffVisitor()
         self.search_visitor = SearchVisitor()
         self.logger = logging.getLogger(f"{__name__}.QueryService")
 
+        # Lookup indexes for the current AST, see _get_index()
+        self._index_root: Optional[ASTNode] = None
+        self._index_version: Optional[str] = None
+        self._nodes_by_type: Dict[NodeType, List[ASTNode]] = {}
+        self._nodes_by_id: Dict[str, ASTNode] = {}
+
+        # Tree whose nodes the serializer's hash cache was filled from
+        self._serialized_root: Optional[ASTNode] = None
+
+        # Compiled query predicates keyed by predicate string
+        self._predicate_cache: Dict[str, Callable[[ASTNode], bool]] = {}
+
+        # JSON serializers per include_hash, and the last get_ast_json
+        # output per include_hash as (root hash, JSON)
+        self._json_serializers = {
+            True: SerializationVisitor(include_hash=True),
+            False: SerializationVisitor(include_hash=False),
+        }
+        self._ast_json: Dict[bool, Tuple[str, str]] = {}
+
     @property
     def ast(self):
         """Get current AST from server."""
         return self.server.current_ast
 
+    def _serialize(self, node: ASTNode) -> Dict[str, Any]:
+        """
+        Serialize a node of the current AST.
+
+        The serializer caches results by node hash; the cache is dropped
+        whenever a new project replaces the tree so it does not keep the
+        previous project's serializations alive.
+        """
+        if self.ast is not self._serialized_root:
+            self.serializer.clear_cache()
+            self._serialized_root = self.ast
+        return self.serializer.visit(node)
+
+    def _get_index(self) -> Tuple[Dict[NodeType, List[ASTNode]], Dict[str, ASTNode]]:
+        """
+        Get type and ID indexes for the current AST.
+
+        Both are filled by a single pre-order walk, so lookups return nodes
+        in the same order as SearchVisitor. The indexes are reused until the
+        root is replaced or its hash changes (handlers rehash up to the root
+        after every mutation); unhashed trees are re-indexed on every call.
+
+        Returns:
+            Tuple of (nodes by type, nodes by ID)
+        """
+        root = self.ast
+        if root is self._index_root and root.hash is not None and root.hash == self._index_version:
+            return self._nodes_by_type, self._nodes_by_id
+
+        by_type: Dict[NodeType, List[ASTNode]] = {}
+        by_id: Dict[str, ASTNode] = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            by_type.setdefault(node.node_type, []).append(node)
+            if node.id and node.id not in by_id:
+                by_id[node.id] = node
+            stack.extend(reversed(node.children))
+
+        self._index_root = root
+        self._index_version = root.hash
+        self._nodes_by_type = by_type
+        self._nodes_by_id = by_id
+        return by_type, by_id
+
     def get_ast_json(self, include_hash: bool = True) -> str:
         """
         Get the current AST as JSON.
 
+        The output is reused while the root hash is unchanged: equal root
+        hashes mean identical trees. Unhashed trees (e.g. during a deferred
+        rehash) are serialized on every call.
+
         Args:
             include_hash: Whether to include node hashes
 
@@ -67,8 +250,16 @@ class QueryService:
         if not self.ast:
             raise RuntimeError("No project loaded")
 
-        serializer = SerializationVisitor(include_hash=include_hash)
-        return serializer.to_json(self.ast)
+        include_hash = bool(include_hash)
+        root_hash = self.ast.hash
+        cached = self._ast_json.get(include_hash)
+        if cached is not None and root_hash is not None and cached[0] == root_hash:
+            return cached[1]
+
+        ast_json = self._json_serializers[include_hash].to_json(self.ast)
+        if root_hash is not None:
+            self._ast_json[include_hash] = (root_hash, ast_json)
+        return ast_json
 
     def find_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -86,9 +277,9 @@ class QueryService:
         if not self.ast:
             raise RuntimeError("No project loaded")
 
-        node = self.search_visitor.find_by_id(self.ast, node_id)
+        node = self._get_index()[1].get(node_id)
         if node:
-            return self.serializer.visit(node)
+            return self._serialize(node)
         return None
 
     def find_nodes_by_type(self, node_type_str: str) -> List[Dict[str, Any]]:
@@ -107,13 +298,12 @@ class QueryService:
         if not self.ast:
             raise RuntimeError("No project loaded")
 
-        try:
-            node_type = NodeType(node_type_str)
-        except ValueError:
+        node_type = _NODE_TYPES_BY_VALUE.get(node_type_str)
+        if node_type is None:
             return []
 
-        nodes = self.search_visitor.find_by_type(self.ast, node_type)
-        return [self.serializer.visit(node) for node in nodes]
+        nodes = self._get_index()[0].get(node_type, [])
+        return [self._serialize(node) for node in nodes]
 
     def query_nodes(self, predicate_str: str) -> List[Dict[str, Any]]:
         """
@@ -122,6 +312,7 @@ class QueryService:
         Example predicates:
         - "name == 'Audio'"
         - "index > 5"
+        - "index >= 2 and type != 'return'"
 
         Args:
             predicate_str: Simple predicate expression
@@ -135,22 +326,19 @@ class QueryService:
         if not self.ast:
             raise RuntimeError("No project loaded")
 
-        # Simple predicate parser (can be expanded)
-        # For now, just support attribute equality
-        def predicate(node: ASTNode) -> bool:
+        predicate = self._predicate_cache.get(predicate_str)
+        if predicate is None:
             try:
-                # Very basic evaluation - expand as needed
-                if "==" in predicate_str:
-                    key, value = predicate_str.split("==")
-                    key = key.strip()
-                    value = value.strip().strip("'\"")
-                    return node.attributes.get(key) == value
-                return False
-            except Exception:
-                return False
+                predicate = _compile_predicate(predicate_str)
+            except ValueError as e:
+                self.logger.warning(f"Ignoring query predicate: {e}")
+                return []
+            if len(self._predicate_cache) >= _PREDICATE_CACHE_SIZE:
+                self._predicate_cache.clear()
+            self._predicate_cache[predicate_str] = predicate
 
         nodes = self.search_visitor.find_by_predicate(self.ast, predicate)
-        return [self.serializer.visit(node) for node in nodes]
+        return [self._serialize(node) for node in nodes]
 
     def diff_with_file(self, other_file: Path) -> List[Dict[str, Any]]:
         """
@@ -168,11 +356,16 @@ class QueryService:
         if not self.ast:
             raise RuntimeError("No project loaded")
 
-        # Load the other file
-        tree = load_ableton_xml(other_file)
-        raw_ast = build_ast(tree.getroot())
-        other_ast = ASTBuilder.build_node_tree(raw_ast, tree.getroot())
-        hash_tree(other_ast)
+        # Load the other file, reusing the parsed tree if it has not changed
+        cache_key = ParsedASTCache.key_for(other_file)
+        other_ast = self.server.parse_cache.get(cache_key) if cache_key else None
+
+        if other_ast is None:
+            tree = load_ableton_xml(other_file)
+            other_ast = ASTBuilder.build_from_xml(tree.getroot())
+            hash_tree(other_ast)
+            if cache_key:
+                self.server.parse_cache.put(cache_key, other_ast)
 
         # Compute diff
         return self.diff_visitor.diff(self.ast, other_ast)
@@ -190,11 +383,12 @@ class QueryService:
         if not self.ast:
             raise RuntimeError("No project loaded")
 
-        tracks = self.search_visitor.find_by_type(self.ast, NodeType.TRACK)
-        devices = self.search_visitor.find_by_type(self.ast, NodeType.DEVICE)
-        clips = self.search_visitor.find_by_type(self.ast, NodeType.CLIP)
-        scenes = self.search_visitor.find_by_type(self.ast, NodeType.SCENE)
-        file_refs = self.search_visitor.find_by_type(self.ast, NodeType.FILE_REF)
+        by_type = self._get_index()[0]
+        tracks = by_type.get(NodeType.TRACK, [])
+        devices = by_type.get(NodeType.DEVICE, [])
+        clips = by_type.get(NodeType.CLIP, [])
+        scenes = by_type.get(NodeType.SCENE, [])
+        file_refs = by_type.get(NodeType.FILE_REF, [])
 
         return {
             "file": str(self.server.current_file) if self.server.current_file else None,
@@ -6,7 +6,7 @@ caching, metrics, and other common server operations.
 """
 
 from .debouncer import DebouncedBroadcaster, DebouncedEvent, EventRateLimiter
-from .cache import ASTCache, LRUCache, CacheStats
+from .cache import ASTCache, LRUCache, CacheStats, ParsedASTCache
 from .metrics import MetricsCollector, MetricsExporter, TimerContext
 
 __all__ = [
@@ -16,6 +16,7 @@ __all__ = [
     "ASTCache",
     "LRUCache",
     "CacheStats",
+    "ParsedASTCache",
     "MetricsCollector",
     "MetricsExporter",
     "TimerContext",
@@ -7,7 +7,8 @@ invalidation to ensure consistency.
 
 import logging
 from functools import lru_cache
-from typing import Optional, Dict, Any, List, Callable, TypeVar, Generic
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, TypeVar, Generic, Tuple
 from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
@@ -66,6 +67,18 @@ class LRUCache(Generic[T]):
 
         self.cache[key] = value
 
+    def pop(self, key: str) -> Optional[T]:
+        """
+        Remove an item from the cache and return it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The removed value or None if not found
+        """
+        return self.cache.pop(key, None)
+
     def clear(self) -> None:
         """Clear all cached items."""
         self.cache.clear()
@@ -131,6 +144,104 @@ class CacheStats:
         }
 
 
+class ParsedASTCache:
+    """
+    Cache of parsed project trees keyed on file identity.
+
+    Entries are keyed on ``(path, st_mtime_ns, st_size)`` so a file that is
+    saved again gets a new key and is re-parsed. Cached trees are hashed and
+    must not be mutated; ``take`` hands a tree over to a caller that will
+    (e.g. as the live AST) and removes it from the cache.
+    """
+
+    def __init__(self, capacity: int = 8):
+        """
+        Initialize parsed AST cache.
+
+        Args:
+            capacity: Maximum number of parsed trees to keep (default: 8)
+        """
+        self.capacity = capacity
+        self._trees: LRUCache = LRUCache(capacity)
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key_for(path: Any) -> Optional[Tuple[str, int, int]]:
+        """
+        Build the cache key for a file.
+
+        Args:
+            path: Path to the project file
+
+        Returns:
+            Key tuple, or None if the file cannot be stat'ed
+        """
+        try:
+            st = Path(path).stat()
+        except OSError:
+            return None
+        return (str(path), st.st_mtime_ns, st.st_size)
+
+    def get(self, key: Optional[Tuple[str, int, int]]) -> Optional[Any]:
+        """
+        Get a cached tree without removing it.
+
+        Args:
+            key: Key from ``key_for``
+
+        Returns:
+            Cached ProjectNode or None on a miss
+        """
+        if key is None:
+            return None
+
+        result = self._trees.get(key)
+        if result is not None:
+            self.stats.record_hit()
+        else:
+            self.stats.record_miss()
+        return result
+
+    def take(self, key: Optional[Tuple[str, int, int]]) -> Optional[Any]:
+        """
+        Remove and return a cached tree.
+
+        Args:
+            key: Key from ``key_for``
+
+        Returns:
+            Cached ProjectNode or None on a miss
+        """
+        if key is None:
+            return None
+
+        result = self._trees.pop(key)
+        if result is not None:
+            self.stats.record_hit()
+        else:
+            self.stats.record_miss()
+        return result
+
+    def put(self, key: Optional[Tuple[str, int, int]], tree: Any) -> None:
+        """
+        Cache a parsed tree.
+
+        Args:
+            key: Key from ``key_for``
+            tree: Hashed ProjectNode to cache
+        """
+        if key is None:
+            return
+
+        if key not in self._trees.cache and self._trees.size() >= self.capacity:
+            self.stats.record_eviction()
+        self._trees.put(key, tree)
+
+    def clear(self) -> None:
+        """Drop all cached trees."""
+        self._trees.clear()
+
+
 class ASTCache:
     """
     Cache for AST node lookups with version-based invalidation.
@@ -168,6 +279,10 @@ class ASTCache:
         self._tracks_all: Optional[Any] = None
         self._scenes_all: Optional[Any] = None
 
+        # Index -> node maps per node type for _index_root, see find_by_index()
+        self._index_root: Optional[Any] = None
+        self._index_maps: Dict[Any, Dict[Any, Any]] = {}
+
         # Statistics
         self.stats = CacheStats()
 
@@ -200,6 +315,53 @@ class ASTCache:
 
         logger.debug("All caches invalidated")
 
+    # Index lookups
+
+    def find_by_index(self, root: Any, node_type: Any, index: int) -> Optional[Any]:
+        """
+        Find a direct child of the root by type and 'index' attribute.
+
+        Backed by an index -> node map per node type for the current root.
+        A hit is trusted only if the node is still attached to the root and
+        still has that index, so nothing has to invalidate the map: any
+        structural change or index shift fails the check and rebuilds it.
+        Unlike the version-keyed caches this works while the root is
+        unhashed. Like a linear scan, the first child with a given index wins.
+
+        Args:
+            root: Project root node
+            node_type: NodeType of the child to find
+            index: Index attribute to match
+
+        Returns:
+            The matching node or None if not found
+        """
+        nodes = self._index_maps.get(node_type) if root is self._index_root else None
+        if nodes is not None:
+            node = nodes.get(index)
+            if node is not None and node.parent is root and node.attributes.get('index') == index:
+                self.stats.record_hit()
+                return node
+
+        if root is not self._index_root:
+            if self._index_root is not None:
+                self.stats.record_invalidation()
+            self._index_root = root
+            self._index_maps = {}
+
+        self.stats.record_miss()
+        nodes = {}
+        for child in root.children:
+            if child.node_type == node_type:
+                nodes.setdefault(child.attributes.get('index'), child)
+        self._index_maps[node_type] = nodes
+        return nodes.get(index)
+
+    def reset_index(self) -> None:
+        """Drop the index maps and the root they reference (e.g. on project load)."""
+        self._index_root = None
+        self._index_maps = {}
+
     # Track lookups
 
     def get_track_by_index(self, index: int, ast_version: Optional[str] = None) -> Optional[Any]:
@@ -205,7 +205,7 @@ class MetricsCollector:
         with self._lock:
             self._timings[metric_key].record(value)
 
-        logger.debug(f"Timing recorded: {metric_key} = {value:.6f}s")
+        logger.debug("Timing recorded: %s = %.6fs", metric_key, value)
 
     def increment(self, name: str, amount: int = 1, tags: Optional[Dict[str, str]] = None) -> None:
         """
@@ -224,7 +224,7 @@ class MetricsCollector:
         with self._lock:
             self._counters[metric_key].increment(amount)
 
-        logger.debug(f"Counter incremented: {metric_key} += {amount}")
+        logger.debug("Counter incremented: %s += %s", metric_key, amount)
 
     def decrement(self, name: str, amount: int = 1, tags: Optional[Dict[str, str]] = None) -> None:
         """
@@ -260,7 +260,7 @@ class MetricsCollector:
         with self._lock:
             self._gauges[metric_key].set(value)
 
-        logger.debug(f"Gauge set: {metric_key} = {value}")
+        logger.debug("Gauge set: %s = %s", metric_key, value)
 
     def timer(self, name: str, tags: Optional[Dict[str, str]] = None) -> 'TimerContext':
         """
@@ -346,6 +346,11 @@ class MetricsCollector:
         if not tags:
             return name
 
+        # Per-event metrics carry a single tag, which needs no sorting
+        if len(tags) == 1:
+            for k, v in tags.items():
+                return f"{name}[{k}={v}]"
+
         # Sort tags for consistent key generation
         tag_str = ','.join(f"{k}={v}" for k, v in sorted(tags.items()))
         return f"{name}[{tag_str}]"
@@ -322,7 +322,7 @@ class UDPListener:
         }
 
 
-async def example_event_callback(event_path: str, args: list, seq_num: int, timestamp: float):
+async def example_event_callback(event_path: str, args: list, seq_num: int, timestamp: int):
     """Example callback for testing."""
     print(f"[{seq_num}] {event_path} {args}")
 
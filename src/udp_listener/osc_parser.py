@@ -53,6 +53,17 @@ def _read_int(data: bytes, offset: int) -> Tuple[int, int]:
     return value, offset + 4
 
 
+def _read_int64(data: bytes, offset: int) -> Tuple[int, int]:
+    """
+    Read OSC int64 (big-endian).
+
+    Returns:
+        Tuple of (int, new_offset)
+    """
+    value = struct.unpack('>q', data[offset:offset+8])[0]
+    return value, offset + 8
+
+
 def _read_float(data: bytes, offset: int) -> Tuple[float, int]:
     """
     Read OSC float32 (big-endian).
@@ -107,6 +118,9 @@ def parse_osc_message(data: bytes) -> OSCMessage:
         if tag == 'i':
             value, offset = _read_int(data, offset)
             arguments.append(value)
+        elif tag == 'h':
+            value, offset = _read_int64(data, offset)
+            arguments.append(value)
         elif tag == 'f':
             value, offset = _read_float(data, offset)
             arguments.append(value)
@@ -125,7 +139,7 @@ def parse_osc_message(data: bytes) -> OSCMessage:
     return OSCMessage(address=address, type_tags=type_tags, arguments=arguments)
 
 
-def parse_sequenced_message(data: bytes) -> Tuple[int, float, str, List[Any]]:
+def parse_sequenced_message(data: bytes) -> Tuple[int, Union[int, float], str, List[Any]]:
     """
     Parse sequenced OSC message (format: /live/seq <seq> <time> <path> <args...>).
 
@@ -133,7 +147,9 @@ def parse_sequenced_message(data: bytes) -> Tuple[int, float, str, List[Any]]:
         data: Raw bytes from UDP packet
 
     Returns:
-        Tuple of (seq_num, timestamp, event_path, event_args)
+        Tuple of (seq_num, timestamp, event_path, event_args). The timestamp
+        is an int64 of monotonic nanoseconds from current senders; older
+        senders used a float of seconds.
 
     Raises:
         ValueError: If not a valid sequenced message
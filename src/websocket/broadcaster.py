@@ -1,11 +1,12 @@
 """Message broadcasting utility for WebSocket clients."""
 
 import asyncio
-import json
 import logging
 from typing import Any, Dict, Set, Optional
 from websockets.server import WebSocketServerProtocol
 
+from .serializers import ASTSerializer
+
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +90,7 @@ class MessageBroadcaster:
 
         # Convert message to JSON once
         try:
-            message_json = json.dumps(message)
+            message_json = ASTSerializer.to_json(message)
         except (TypeError, ValueError) as e:
             logger.error(f"Failed to serialize message: {e}")
             return
@@ -137,7 +138,7 @@ class MessageBroadcaster:
         """
         # Convert message to JSON
         try:
-            message_json = json.dumps(message)
+            message_json = ASTSerializer.to_json(message)
         except (TypeError, ValueError) as e:
             logger.error(f"Failed to serialize message: {e}")
             return
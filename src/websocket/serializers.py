@@ -13,6 +13,11 @@ from ..ast.node import (
     FileRefNode,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 class ASTSerializer:
     """Serializes AST nodes to JSON-compatible dictionaries."""
@@ -76,6 +81,9 @@ class ASTSerializer:
         """
         Convert dictionary to JSON string.
 
+        Uses orjson when it is installed, which produces compact output
+        without the stdlib's spaces after separators.
+
         Args:
             data: Dictionary to serialize
             pretty: Whether to use pretty formatting
@@ -83,6 +91,16 @@ class ASTSerializer:
         Returns:
             JSON string
         """
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(data, option=option).decode('utf-8')
+            except TypeError:
+                # e.g. integers beyond 64 bits; the stdlib encoder handles those
+                pass
+
         if pretty:
             return json.dumps(data, indent=2)
         return json.dumps(data)
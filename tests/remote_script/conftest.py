@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The Remote Script package imports Live on import; load its modules
+# standalone, the way udp_sender falls back to outside of Ableton
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src", "remote_script"))
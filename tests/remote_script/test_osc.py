@@ -0,0 +1,180 @@
+import pytest
+
+import osc
+from src.udp_listener.osc_parser import parse_sequenced_message
+
+TIMESTAMP = 1_234_567_890_123
+
+# One sample call per specialized event encoder
+EVENT_SAMPLES = [
+    ("/live/track/renamed", (2, "Bass")),
+    ("/live/track/mute", (1, True)),
+    ("/live/track/mute", (1, False)),
+    ("/live/track/arm", (3, True)),
+    ("/live/track/arm", (3, False)),
+    ("/live/track/volume", (0, 0.5)),
+    ("/live/device/param", (1, 2, 3, 0.25)),
+    ("/live/clip_slot/playing_status", (4, 5, 1)),
+    ("/live/clip/name", (0, 7, "Intro Loop")),
+    ("/live/scene/renamed", (6, "Chorus")),
+    ("/live/transport/play", (True,)),
+    ("/live/transport/play", (False,)),
+    ("/live/transport/tempo", (128.0,)),
+    ("/live/transport/position", (16.5,)),
+]
+
+
+def _reference_message(address, *args):
+    """Encode a message one argument at a time, without specialized encoders."""
+    tags = ","
+    payload = b""
+    for arg in args:
+        tag = osc._type_tag_for(arg)
+        if tag == "T":
+            tags += "T" if arg else "F"
+        elif tag == "h":
+            tags += tag
+            payload += osc._encode_int64(arg)
+        elif tag == "i":
+            tags += tag
+            payload += osc._encode_int(arg)
+        elif tag == "f":
+            tags += tag
+            payload += osc._encode_float(arg)
+        else:
+            tags += tag
+            payload += osc._encode_string(arg)
+    return osc._encode_string(address) + osc._encode_string(tags) + payload
+
+
+@pytest.fixture
+def fixed_clock(monkeypatch):
+    monkeypatch.setattr(osc.time, "monotonic_ns", lambda: TIMESTAMP)
+
+
+def test_every_specialized_event_has_a_sample():
+    """
+    Test the round-trip samples cover every entry of _EVENT_ENCODERS.
+    """
+    assert {path for path, _ in EVENT_SAMPLES} == set(osc._EVENT_ENCODERS)
+
+
+@pytest.mark.parametrize("event_path,args", EVENT_SAMPLES)
+def test_specialized_encoder_matches_generic(fixed_clock, event_path, args):
+    """
+    Test each specialized encoder produces the same bytes as the generic path.
+    """
+    encoded = osc.build_sequenced_message(42, event_path, *args)
+
+    assert encoded == osc._build_sequenced_generic(42, event_path, args)
+    assert encoded == _reference_message(
+        "/live/seq", 42, osc.Int64(TIMESTAMP), event_path, *args
+    )
+
+
+@pytest.mark.parametrize("event_path,args", EVENT_SAMPLES)
+def test_specialized_encoder_round_trip(fixed_clock, event_path, args):
+    """
+    Test messages from the specialized encoders decode with the UDP listener parser.
+    """
+    seq_num, timestamp, path, event_args = parse_sequenced_message(
+        osc.build_sequenced_message(42, event_path, *args)
+    )
+
+    assert seq_num == 42
+    assert timestamp == TIMESTAMP
+    assert path == event_path
+    # Sample floats are exact in float32
+    assert event_args == list(args)
+
+
+@pytest.fixture
+def format_cache(monkeypatch):
+    cache = {}
+    monkeypatch.setattr(osc, "_FORMAT_CACHE", cache)
+    return cache
+
+
+def test_format_cache_reuses_encoder_per_signature(format_cache):
+    """
+    Test build_osc_message compiles one encoder per address and signature.
+    """
+    first = osc.build_osc_message("/test/msg", 1, "a")
+    encoder = format_cache[("/test/msg", (int, str))]
+
+    assert osc.build_osc_message("/test/msg", 2, "b") == _reference_message("/test/msg", 2, "b")
+    assert format_cache[("/test/msg", (int, str))] is encoder
+    assert first == _reference_message("/test/msg", 1, "a")
+    assert len(format_cache) == 1
+
+    # Bools are keyed by value, since True and False use different type tags
+    osc.build_osc_message("/test/msg", True)
+    osc.build_osc_message("/test/msg", False)
+    assert len(format_cache) == 3
+
+
+def test_format_cache_cleared_when_full(format_cache):
+    """
+    Test the format cache is emptied once it holds _FORMAT_CACHE_SIZE encoders.
+    """
+    for i in range(osc._FORMAT_CACHE_SIZE):
+        osc.build_osc_message(f"/test/{i}", i)
+    assert len(format_cache) == osc._FORMAT_CACHE_SIZE
+
+    assert osc.build_osc_message("/test/overflow", 1) == _reference_message("/test/overflow", 1)
+    assert list(format_cache) == [("/test/overflow", (int,))]
+
+
+@pytest.mark.parametrize("event_path,args", [
+    # struct.error: a string where the numeric signature expects a float
+    ("/live/device/param", (1, 2, 3, "max")),
+    # struct.error: a float where the signature expects an int
+    ("/live/clip/name", (0.5, 7, "Intro")),
+    # AttributeError: an int where the signature expects a string
+    ("/live/track/renamed", (2, 5)),
+    # Argument count does not match the signature
+    ("/live/track/volume", (0,)),
+])
+def test_specialized_encoder_falls_back_on_signature_mismatch(fixed_clock, event_path, args):
+    """
+    Test arguments that do not fit a specialized signature use the generic encoder.
+    """
+    encoded = osc.build_sequenced_message(42, event_path, *args)
+
+    assert encoded == _reference_message(
+        "/live/seq", 42, osc.Int64(TIMESTAMP), event_path, *args
+    )
+    assert parse_sequenced_message(encoded)[3] == list(args)
+
+
+def test_sequenced_encoder_falls_back_on_type_error(monkeypatch):
+    """
+    Test a TypeError raised while packing an argument falls back to the generic encoder.
+    """
+    class Name(str):
+        def encode(self, *args):
+            raise TypeError("not encodable")
+
+    calls = []
+    monkeypatch.setattr(osc, "_build_sequenced_generic", lambda *a: calls.append(a) or b"generic")
+    encoder = osc._make_sequenced_encoder("/live/track/renamed", "is")
+
+    assert encoder(1, 0, Name("Bass")) == b"generic"
+    assert calls == [(1, "/live/track/renamed", (0, "Bass"))]
+
+
+def test_sequenced_batch_encodes_mismatched_rows_individually(fixed_clock):
+    """
+    Test rows whose argument types differ from the first row keep their own type tags.
+    """
+    rows = [(0, 1), (1, True), (2, 0.5), (3, 4)]
+    messages = osc.build_sequenced_batch(10, "/test/pair", rows)
+
+    assert messages == [
+        osc.build_sequenced_message(10 + offset, "/test/pair", *row)
+        for offset, row in enumerate(rows)
+    ]
+    decoded = [parse_sequenced_message(message) for message in messages]
+    assert [seq_num for seq_num, _, _, _ in decoded] == [10, 11, 12, 13]
+    assert [event_args for _, _, _, event_args in decoded] == [[0, 1], [1, True], [2, 0.5], [3, 4]]
+    assert type(decoded[1][3][1]) is bool
@@ -0,0 +1,190 @@
+import json
+import socket
+import threading
+
+import pytest
+
+import server as command_server
+
+
+class FakeCommandHandlers:
+    """Command registry with one direct and one main-thread command."""
+
+    def __init__(self):
+        self.calls = []
+
+    def register_commands(self):
+        return {"GET_VIEW": self._get_view, "GET_STATE": self._get_state}
+
+    def get_direct_commands(self):
+        return {"GET_VIEW"}
+
+    def _get_view(self, params=None):
+        self.calls.append(("GET_VIEW", params))
+        return {"view": "session", "params": params}
+
+    def _get_state(self, params=None):
+        self.calls.append(("GET_STATE", params))
+        return {"playing": False}
+
+
+class ShortFuture(command_server.Future):
+    """Future that gives up after a fraction of the real command timeout."""
+
+    def result(self, timeout=None):
+        return super().result(timeout=0.05)
+
+
+@pytest.fixture
+def handlers():
+    return FakeCommandHandlers()
+
+
+@pytest.fixture
+def make_server(handlers):
+    def make(schedule=None):
+        logs = []
+        server = command_server.CommandServer(
+            handlers,
+            schedule or (lambda delay, callback: callback()),
+            logs.append,
+        )
+        server.logs = logs
+        return server
+    return make
+
+
+@pytest.fixture
+def framed(make_server):
+    """A framed connection served on one end of a socketpair."""
+    client, conn = socket.socketpair()
+    client.settimeout(2.0)
+    server = make_server()
+    pending = []
+
+    def run(first):
+        # Closed on return, as _handle_connection does
+        with conn:
+            server._serve_framed(conn, first)
+
+    def serve(first):
+        pending.append(threading.Thread(target=run, args=(first,), daemon=True))
+        pending[0].start()
+
+    yield client, serve, pending
+    client.close()
+    if pending:
+        pending[0].join(timeout=2.0)
+    conn.close()
+
+
+def _frame(payload):
+    return command_server._FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _read_frame(client):
+    (size,) = command_server._FRAME_HEADER.unpack(command_server._recv_exact(client, 4))
+    return json.loads(command_server._recv_exact(client, size))
+
+
+def test_framed_requests_on_one_connection(framed, handlers):
+    """
+    Test several length-prefixed requests are answered in order on one connection.
+    """
+    client, serve, _ = framed
+    first = _frame(b"GET_VIEW")
+    # The header was already read when the protocol was detected
+    serve(first[:1])
+    client.sendall(first[1:])
+    assert _read_frame(client) == {"view": "session", "params": None}
+
+    # A request split across sends, then two requests in one send
+    second = _frame(b"GET_VIEW:a:b")
+    client.sendall(second[:6])
+    client.sendall(second[6:])
+    assert _read_frame(client) == {"view": "session", "params": ["a", "b"]}
+
+    client.sendall(_frame(b"GET_STATE") + _frame(b"NOPE"))
+    assert _read_frame(client) == {"playing": False}
+    assert _read_frame(client) == {"success": False, "error": "Unknown command: NOPE"}
+
+
+def test_framed_rejects_oversized_frame(framed):
+    """
+    Test a frame larger than _MAX_FRAME_SIZE closes the connection unanswered.
+    """
+    client, serve, pending = framed
+    serve(command_server._FRAME_HEADER.pack(command_server._MAX_FRAME_SIZE + 1))
+
+    pending[0].join(timeout=2.0)
+    assert not pending[0].is_alive()
+    assert client.recv(16) == b""
+
+
+def test_framed_non_utf8_payload_gets_error_frame(framed):
+    """
+    Test undecodable parameters are answered with a JSON error frame.
+    """
+    client, serve, pending = framed
+    serve(_frame(b"GET_VIEW:\xff\xfe"))
+
+    response = _read_frame(client)
+    assert response["success"] is False
+    assert "utf-8" in response["error"]
+
+    # The connection stays usable
+    client.sendall(_frame(b"GET_VIEW"))
+    assert _read_frame(client)["view"] == "session"
+
+
+def test_framed_stops_on_truncated_frame(framed):
+    """
+    Test a peer closing mid-frame ends the connection without a response.
+    """
+    client, serve, pending = framed
+    serve(_frame(b"GET_VIEW:abc")[:8])
+    client.shutdown(socket.SHUT_WR)
+
+    pending[0].join(timeout=2.0)
+    assert not pending[0].is_alive()
+    assert client.recv(16) == b""
+
+
+def test_recv_exact_short_read():
+    """
+    Test _recv_exact joins partial reads and returns None if the peer closes early.
+    """
+    a, b = socket.socketpair()
+    with a, b:
+        a.sendall(b"ab")
+        a.sendall(b"cd")
+        assert command_server._recv_exact(b, 4) == b"abcd"
+
+        a.sendall(b"xy")
+        a.shutdown(socket.SHUT_WR)
+        assert command_server._recv_exact(b, 4) is None
+
+
+def test_dispatch_main_thread_timeout_cancels_command(make_server, handlers, monkeypatch):
+    """
+    Test a main-thread command that is not run in time returns a timeout and is skipped later.
+    """
+    monkeypatch.setattr(command_server, "Future", ShortFuture)
+    scheduled = []
+    server = make_server(schedule=lambda delay, callback: scheduled.append(callback))
+
+    assert json.loads(server._dispatch(b"GET_STATE")) == {"success": False, "error": "Command timeout"}
+
+    # Live gets round to the scheduled callback after the caller gave up
+    scheduled[0]()
+    assert handlers.calls == []
+
+
+def test_dispatch_main_thread_runs_scheduled_command(make_server, handlers):
+    """
+    Test a main-thread command returns the result produced by the scheduled callback.
+    """
+    server = make_server()
+
+    assert json.loads(server._dispatch(b"GET_STATE\n")) == {"playing": False}
+    assert handlers.calls == [("GET_STATE", None)]
@@ -0,0 +1,154 @@
+import pytest
+
+import udp_sender
+from udp_sender import UDPSender
+from src.udp_listener.osc_parser import parse_osc_message, parse_sequenced_message
+
+
+class FakeSocket:
+    """Records sent datagrams and fails the sends whose call number is listed."""
+
+    def __init__(self, fail_on=(), error=BlockingIOError):
+        self.fail_on = set(fail_on)
+        self.error = error
+        self.calls = 0
+        self.sent = []
+
+    def send(self, data):
+        call = self.calls
+        self.calls += 1
+        if call in self.fail_on:
+            raise self.error("send failed")
+        self.sent.append(data)
+        return len(data)
+
+
+@pytest.fixture
+def make_sender():
+    def make(fail_on=(), error=BlockingIOError):
+        fake = FakeSocket(fail_on, error)
+        sender = UDPSender()
+        sender.enabled = True
+        sender._send = fake.send
+        return sender, fake
+    return make
+
+
+def _sequenced(fake):
+    return [parse_sequenced_message(data) for data in fake.sent
+            if parse_osc_message(data).address == "/live/seq"]
+
+
+def test_send_batch_homogeneous_sends_each_row(make_sender):
+    """
+    Test send_batch_homogeneous sends one event per row with consecutive sequence numbers.
+    """
+    sender, fake = make_sender()
+
+    assert sender.send_batch_homogeneous("/live/track/volume", [0, 1, 2], [0.5, 0.25, 1.0]) == 3
+    events = _sequenced(fake)
+    assert [seq_num for seq_num, _, _, _ in events] == [0, 1, 2]
+    assert [event_args for _, _, _, event_args in events] == [[0, 0.5], [1, 0.25], [2, 1.0]]
+    assert sender.seq_num == 3
+    assert sender.sent_count == 3
+
+
+def test_send_batch_homogeneous_keeps_row_types(make_sender):
+    """
+    Test a bool in a later row is not sent with the first row's int type tag.
+    """
+    sender, fake = make_sender()
+
+    sender.send_batch_homogeneous("/test/flag", [0, 1], [7, True])
+    assert [event_args for _, _, _, event_args in _sequenced(fake)] == [[0, 7], [1, True]]
+    assert type(_sequenced(fake)[1][3][1]) is bool
+
+
+def test_send_batch_homogeneous_failed_send_leaves_no_gap(make_sender):
+    """
+    Test a failed send does not consume a sequence number.
+    """
+    sender, fake = make_sender(fail_on={1})
+
+    assert sender.send_batch_homogeneous("/live/track/volume", [0, 1, 2], [0.5, 0.25, 1.0]) == 2
+    events = _sequenced(fake)
+    assert [seq_num for seq_num, _, _, _ in events] == [0, 1]
+    assert [event_args for _, _, _, event_args in events] == [[0, 0.5], [2, 1.0]]
+    assert sender.seq_num == 2
+    assert sender.error_count == 1
+
+
+def test_send_batch_wraps_events_in_markers(make_sender):
+    """
+    Test send_batch sends start and end markers around the sequenced events.
+    """
+    sender, fake = make_sender()
+
+    sender.send_batch(7, [
+        ("/live/track/renamed", 0, "Bass"),
+        (),
+        ("/live/track/mute", 0, True),
+    ])
+    addresses = [parse_osc_message(data).address for data in fake.sent]
+    assert addresses == ["/live/batch/start", "/live/seq", "/live/seq", "/live/batch/end"]
+    assert parse_osc_message(fake.sent[0]).arguments == [7]
+    assert [seq_num for seq_num, _, _, _ in _sequenced(fake)] == [0, 1]
+    assert sender.seq_num == 2
+    assert sender.sent_count == 2
+
+
+def test_send_batch_failed_send_leaves_no_gap(make_sender):
+    """
+    Test send_batch renumbers the events after a failed send.
+    """
+    # Call 0 is the start marker, call 1 the first event
+    sender, fake = make_sender(fail_on={1})
+
+    sender.send_batch(7, [
+        ("/live/track/renamed", 0, "Bass"),
+        ("/live/track/renamed", 1, "Drums"),
+        ("/live/scene/renamed", 0, "Verse"),
+    ])
+    events = _sequenced(fake)
+    assert [seq_num for seq_num, _, _, _ in events] == [0, 1]
+    assert [(path, event_args) for _, _, path, event_args in events] == [
+        ("/live/track/renamed", [1, "Drums"]),
+        ("/live/scene/renamed", [0, "Verse"]),
+    ]
+    assert sender.seq_num == 2
+    assert sender.sent_count == 2
+    assert sender.error_count == 1
+
+    # The next event continues the sequence without a gap
+    sender.send_event("/live/track/renamed", 2, "Keys")
+    assert _sequenced(fake)[-1][0] == 2
+
+
+def test_refused_sends_are_counted_and_logged_once(make_sender, monkeypatch):
+    """
+    Test ConnectionRefusedError (no listener running) is not an error and is rate-limited in the log.
+    """
+    sender, fake = make_sender(fail_on={0, 1, 2}, error=ConnectionRefusedError)
+    logged = []
+    monkeypatch.setattr(sender, "log", logged.append)
+    clock = iter([100.0, 101.0, 100.0 + udp_sender._REFUSED_LOG_INTERVAL])
+    monkeypatch.setattr(udp_sender.time, "monotonic", lambda: next(clock))
+
+    assert sender.send_event("/live/track/renamed", 0, "Bass") is False
+    assert sender.send_event("/live/track/renamed", 0, "Bass") is False
+    assert len(logged) == 1
+    assert sender.send_event("/live/track/renamed", 0, "Bass") is False
+    assert len(logged) == 2
+    assert "3 refused sends" in logged[1]
+
+    assert sender.get_stats()["refused_count"] == 3
+    assert sender.error_count == 0
+    assert sender.seq_num == 0
+
+    # Other failures are still counted and logged every time
+    assert sender.send_event("/live/track/renamed", 0, "Bass") is True
+    fake.fail_on.add(4)
+    fake.error = OSError
+    assert sender.send_event("/live/track/renamed", 0, "Bass") is False
+    assert sender.error_count == 1
+    assert len(logged) == 3
@@ -2,10 +2,12 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from src.server.handlers.clip_slot_handler import ClipSlotEventHandler
 from src.ast import TrackNode, ClipSlotNode, ProjectNode
+from src.server.utils import ASTCache
 
 class MockServer:
     def __init__(self):
         self.current_ast = ProjectNode()
+        self.cache = ASTCache()
         self.websocket_server = MagicMock()
         self.websocket_server.is_running.return_value = True
         self.websocket_server.broadcast_diff = AsyncMock()
@@ -1,11 +1,13 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from src.server.handlers.device_handler import DeviceEventHandler
-from src.ast import TrackNode, DeviceNode, ProjectNode, NodeType
+from src.ast import TrackNode, DeviceNode, ClipSlotNode, MixerNode, ProjectNode, NodeType
+from src.server.utils import ASTCache
 
 class MockServer:
     def __init__(self):
         self.current_ast = ProjectNode()
+        self.cache = ASTCache()
         self.websocket_server = MagicMock()
         self.websocket_server.is_running.return_value = True
         self.websocket_server.broadcast_diff = AsyncMock()
@@ -83,6 +85,32 @@ async def test_handle_device_deleted_valid(handler, server):
     assert diff_result["changes"][0]["type"] == "removed"
     assert diff_result["changes"][0]["node_id"] == "device-0"
 
+@pytest.mark.asyncio
+async def test_device_index_skips_clip_slots_and_mixer(handler, server):
+    """
+    Test device indices count only devices, not clip slots or the mixer.
+    """
+    track_node = TrackNode(name="Audio 1", index=0, id="track-0")
+    track_node.add_child(DeviceNode(name="EQ", device_type="audio_effect", id="device-0"))
+    track_node.add_child(ClipSlotNode(track_index=0, scene_index=0, id="slot-0"))
+    track_node.add_child(MixerNode(id="mixer-0"))
+    server.current_ast.add_child(track_node)
+
+    with patch("src.server.handlers.device_handler.BaseEventHandler._find_track", return_value=track_node):
+        # Index past the last device appends after it, before the clip slot
+        await handler.handle_device_added([0, 1, "Reverb"], seq_num=1)
+        assert [c.attributes.get("name") for c in track_node.children[:2]] == ["EQ", "Reverb"]
+        assert track_node.children[2].node_type == NodeType.CLIP_SLOT
+
+        # Index 2 is out of range for two devices and must not remove the clip slot
+        assert await handler.handle_device_deleted([0, 2], seq_num=2) is None
+        assert len(track_node.children) == 4
+
+        result = await handler.handle_device_deleted([0, 1], seq_num=3)
+
+    assert result["type"] == "device_deleted"
+    assert [c.node_type for c in track_node.children] == [NodeType.DEVICE, NodeType.CLIP_SLOT, NodeType.MIXER]
+
 @pytest.mark.asyncio
 async def test_handle_device_param_update(handler, server):
     """
@@ -108,6 +136,10 @@ async def test_handle_device_param_update(handler, server):
     # Let's check implementation.
     # Yes, it updates self.ast params first, THEN debounces broadcast.
     assert device_node.attributes["parameters"][0]["value"] == 0.8
+
+    # Hashes are cleared now and recomputed when the debounced broadcast runs
+    assert device_node.hash is None
+    assert server.current_ast.hash is None
     
     # Verify debouncer called
     server.debouncer.debounce.assert_called_once()
@@ -137,3 +169,29 @@ async def test_broadcast_device_param_change(handler, server):
     assert diff_result["changes"][0]["type"] == "state_changed"
     assert diff_result["changes"][0]["value"] == 0.8
     assert diff_result["changes"][0]["node_id"] == "device-0"
+
+@pytest.mark.asyncio
+async def test_broadcast_device_param_change_rehashes(handler, server):
+    """
+    Test the debounced broadcast recomputes the hashes the param change cleared.
+    """
+    track_node = TrackNode(name="Audio 1", index=0, id="track-0")
+    device_node = DeviceNode(name="Reverb", device_type="audio_effect", id="device-0")
+    track_node.add_child(device_node)
+    server.current_ast.add_child(track_node)
+
+    event_args = {
+        'track_index': 0,
+        'device_index': 0,
+        'parameter_index': 0,
+        'parameter_value': 0.8,
+        'device_node_id': 'device-0',
+        'seq_num': 4
+    }
+
+    with patch("src.server.handlers.device_handler.BaseEventHandler._find_track", return_value=track_node):
+        await handler.broadcast_device_param_change("device_parameter_changed", event_args)
+
+    assert device_node.hash is not None
+    assert server.current_ast.hash is not None
+    server.websocket_server.broadcast_diff.assert_called_once()
@@ -143,3 +143,35 @@ async def test_handle_scene_reordered_ignored(handler):
     assert result is not None
     assert result["type"] == "scene_reordered"
     assert result["ignored"] is True
+
+@pytest.mark.asyncio
+async def test_scene_added_rehashes_only_shifted_slots(handler, server):
+    """
+    Test that adding a scene keeps the hashes of clip slots before it.
+    """
+    from src.ast import hash_tree
+
+    track = TrackNode(name="Track", index=0)
+    server.current_ast.add_child(track)
+    for scene_idx in range(3):
+        server.current_ast.add_child(SceneNode(name=f"Scene {scene_idx}", index=scene_idx))
+        track.add_child(ClipSlotNode(track_index=0, scene_index=scene_idx))
+    hash_tree(server.current_ast)
+    slots = list(track.children)
+    kept_hash = slots[0].hash
+    shifted_hash = slots[2].hash
+
+    with patch("src.server.handlers.scene_handler.ASTNavigator.get_scenes", return_value=[]):
+        await handler.handle_scene_added([2, "New"], seq_num=5)
+
+    assert slots[0].hash is kept_hash
+    assert slots[2].hash != shifted_hash
+    incremental_hash = server.current_ast.hash
+
+    stack = [server.current_ast]
+    while stack:
+        node = stack.pop()
+        node.hash = None
+        stack.extend(node.children)
+    hash_tree(server.current_ast)
+    assert server.current_ast.hash == incremental_hash
@@ -2,14 +2,18 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from src.server.handlers.track_handler import TrackEventHandler
 from src.ast import TrackNode, ProjectNode
+from src.server.utils import ASTCache
 
 class MockServer:
     def __init__(self):
         self.current_ast = ProjectNode()
+        self.cache = ASTCache()
         self.websocket_server = MagicMock()
         self.websocket_server.is_running.return_value = True
         self.websocket_server.broadcast_diff = AsyncMock()
         self.websocket_server.broadcast_error = AsyncMock()
+        self.debouncer = MagicMock()
+        self.debouncer.debounce = AsyncMock()
 
 @pytest.fixture
 def server():
@@ -61,6 +65,26 @@ async def test_handle_track_renamed_track_not_found(handler):
 
     assert result is None
 
+@pytest.mark.asyncio
+async def test_redundant_track_updates_are_ignored(handler, server):
+    """
+    Test unchanged names and states are neither rehashed nor broadcast.
+    """
+    track_node = TrackNode(name="Audio 1", index=0, id="track-0")
+    track_node.attributes['volume'] = 0.5
+    server.current_ast.add_child(track_node)
+    track_node.hash = "track-hash"
+
+    with patch("src.server.ast_helpers.ASTNavigator.find_track_by_index", return_value=track_node):
+        renamed = await handler.handle_track_renamed([0, "Audio 1"], seq_num=1)
+        muted = await handler.handle_track_state([0, False], seq_num=2, attribute="is_muted")
+        volume = await handler.handle_track_state([0, 0.5], seq_num=3, attribute="volume")
+
+    assert renamed["ignored"] and muted["ignored"] and volume["ignored"]
+    assert track_node.hash == "track-hash"
+    server.websocket_server.broadcast_diff.assert_not_called()
+    server.debouncer.debounce.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_handle_track_state_mute(handler, server):
     """
@@ -97,7 +121,7 @@ async def test_handle_track_state_mute(handler, server):
 @pytest.mark.asyncio
 async def test_handle_track_state_volume(handler, server):
     """
-    Test handle_track_state for volume property.
+    Test handle_track_state debounces volume changes.
     """
     # Setup AST
     track_node = TrackNode(name="Audio 1", index=0)
@@ -112,8 +136,47 @@ async def test_handle_track_state_volume(handler, server):
 
     assert result is not None
     assert result["value"] == 0.5
+    assert result["debounced"] is True
     assert track_node.attributes["volume"] == 0.5
 
+    # Hashes are cleared until the debounced broadcast rehashes them
+    assert track_node.hash is None
+    assert server.current_ast.hash is None
+
+    server.debouncer.debounce.assert_called_once()
+    call_args = server.debouncer.debounce.call_args
+    assert call_args[0][0] == "volume_changed"
+    assert call_args[0][1]["new_value"] == 0.5
+    server.websocket_server.broadcast_diff.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_broadcast_track_state_change(handler, server):
+    """
+    Test broadcast_track_state_change rehashes the track and broadcasts.
+    """
+    track_node = TrackNode(name="Audio 1", index=0, id="track-0")
+    track_node.attributes['volume'] = 0.5
+    server.current_ast.add_child(track_node)
+
+    event_args = {
+        'track_index': 0,
+        'attribute': 'volume',
+        'old_value': 0.85,
+        'new_value': 0.5,
+        'seq_num': 3
+    }
+
+    with patch("src.server.ast_helpers.ASTNavigator.find_track_by_index", return_value=track_node):
+        await handler.broadcast_track_state_change("volume_changed", event_args)
+
+    assert track_node.hash is not None
+    assert server.current_ast.hash is not None
+
+    server.websocket_server.broadcast_diff.assert_called_once()
+    change = server.websocket_server.broadcast_diff.call_args[0][0]["changes"][0]
+    assert change["attribute"] == "volume"
+    assert change["new_value"] == 0.5
+
 @pytest.mark.asyncio
 async def test_handle_track_state_track_not_found(handler):
     """
@@ -74,6 +74,12 @@ async def test_handle_transport_event_tempo(handler, server):
     # Broadcast should NOT be called immediately (debounced)
     server.websocket_server.broadcast_diff.assert_not_called()
 
+    # The root is rehashed when the debounced broadcast runs
+    assert server.current_ast.hash is None
+    await handler.broadcast_transport_change("tempo_changed", call_args[0][1])
+    assert server.current_ast.hash is not None
+    server.websocket_server.broadcast_diff.assert_called_once()
+
 @pytest.mark.asyncio
 async def test_handle_transport_event_position(handler, server):
     """
@@ -1,11 +1,16 @@
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 from src.server.services.project_service import ProjectService
 from src.ast import ProjectNode
+from src.server.utils import ASTCache
 
 class MockServer:
     def __init__(self):
         self.current_ast = None
+        self.cache = ASTCache()
         self.current_file = None
         self.websocket_server = MagicMock()
         self.websocket_server.is_running.return_value = True
@@ -38,13 +43,11 @@ def test_load_project_valid_file(service, server):
     mock_tree = MagicMock()
     mock_root = MagicMock()
     mock_tree.getroot.return_value = mock_root
-    mock_raw_ast = {"tracks": []}
     mock_project_node = ProjectNode()
     mock_project_node.id = "project-root"
 
     with patch("src.server.services.project_service.load_ableton_xml", return_value=mock_tree), \
-         patch("src.server.services.project_service.build_ast", return_value=mock_raw_ast), \
-         patch("src.server.services.project_service.ASTBuilder.build_node_tree", return_value=mock_project_node), \
+         patch("src.server.services.project_service.ASTBuilder.build_from_xml", return_value=mock_project_node), \
          patch("src.server.services.project_service.hash_tree"):
         
         result = service.load_project(file_path, broadcast=False)
@@ -64,23 +67,49 @@ def test_load_project_invalid_file(service, server):
 
     assert server.current_ast is None
 
-def test_load_project_broadcast(service, server):
+@pytest.mark.asyncio
+async def test_load_project_broadcast(service, server):
     """
-    Test load_project triggers broadcast when enabled.
+    Test load_project schedules a full AST broadcast when enabled.
     """
     file_path = "test_project.als"
     mock_tree = MagicMock()
     mock_tree.getroot.return_value = MagicMock()
-    mock_raw_ast = {"tracks": []}
     mock_project_node = ProjectNode()
-    
+    server.websocket_server.broadcast_full_ast = AsyncMock()
+
     with patch("src.server.services.project_service.load_ableton_xml", return_value=mock_tree), \
-         patch("src.server.services.project_service.build_ast", return_value=mock_raw_ast), \
-         patch("src.server.services.project_service.ASTBuilder.build_node_tree", return_value=mock_project_node), \
-         patch("src.server.services.project_service.hash_tree"), \
-         patch("asyncio.create_task") as mock_create_task:
-        
+         patch("src.server.services.project_service.ASTBuilder.build_from_xml", return_value=mock_project_node), \
+         patch("src.server.services.project_service.hash_tree"):
+
         service.load_project(file_path, broadcast=True)
-        
-        mock_create_task.assert_called_once()
+
+    # The broadcast runs as a task on the calling loop
+    await asyncio.gather(*service._pending_broadcasts)
+    server.websocket_server.broadcast_full_ast.assert_awaited_once_with(mock_project_node, file_path)
+    assert not service._pending_broadcasts
+
+def test_load_project_broadcast_from_other_thread(service, server):
+    """
+    Test load_project called off the event loop hands the broadcast to the server's loop.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server.websocket_server.loop = loop
+    server.websocket_server.broadcast_full_ast = AsyncMock()
+
+    try:
+        with patch("src.server.services.project_service.load_ableton_xml", return_value=MagicMock()), \
+             patch("src.server.services.project_service.ASTBuilder.build_from_xml", return_value=ProjectNode()), \
+             patch("src.server.services.project_service.hash_tree"):
+            service.load_project("test_project.als", broadcast=True)
+
+        for future in list(service._pending_broadcasts):
+            future.result(timeout=5)
+        server.websocket_server.broadcast_full_ast.assert_awaited_once()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
 
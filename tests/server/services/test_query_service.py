@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from src.server.services.query_service import QueryService
-from src.ast import ProjectNode, TrackNode, NodeType
+from src.ast import ProjectNode, TrackNode, NodeType, SerializationVisitor
 
 class MockServer:
     def __init__(self):
@@ -26,6 +26,23 @@ def test_get_ast_json_success(service, server):
     assert isinstance(json_str, str)
     assert '"node_type": "project"' in json_str
 
+def test_get_ast_json_reused_until_root_hash_changes(service, server):
+    """
+    Test get_ast_json reuses its output for an unchanged root hash.
+    """
+    first = service.get_ast_json()
+    assert service.get_ast_json() is first
+    assert '"hash"' not in service.get_ast_json(include_hash=False)
+
+    server.current_ast.attributes["tempo"] = 140.0
+    server.current_ast.hash = "hash456"
+    assert '140.0' in service.get_ast_json()
+
+    # Unhashed trees are never served from the cache
+    server.current_ast.attributes["tempo"] = 150.0
+    server.current_ast.hash = None
+    assert '150.0' in service.get_ast_json()
+
 def test_get_ast_json_no_project(service, server):
     """
     Test get_ast_json raises RuntimeError if no project loaded.
@@ -88,6 +105,21 @@ def test_query_nodes_simple_predicate(service, server):
     assert len(result) == 1
     assert result[0]["attributes"]["name"] == "Target"
 
+def test_query_nodes_predicate_value_forms(service, server):
+    """
+    Test unquoted, numeric-looking and unhashable values compare as strings.
+    """
+    for i, name in enumerate(["Bass-1", "5", "(1, [2])"]):
+        server.current_ast.add_child(TrackNode(name=name, index=i))
+
+    assert [r["attributes"]["name"] for r in service.query_nodes("name == Bass-1")] == ["Bass-1"]
+    assert [r["attributes"]["name"] for r in service.query_nodes("name == 5")] == ["5"]
+    assert [r["attributes"]["name"] for r in service.query_nodes("name == '5'")] == ["5"]
+    assert [r["attributes"]["name"] for r in service.query_nodes("name == (1, [2])")] == ["(1, [2])"]
+    assert [r["attributes"]["name"] for r in service.query_nodes("name != 5 and index < 2")] == ["Bass-1"]
+    # Non-string attributes still compare against the literal value
+    assert [r["attributes"]["name"] for r in service.query_nodes("index == 1")] == ["5"]
+
 def test_get_project_info_success(service, server):
     """
     Test get_project_info returns stats.
@@ -110,9 +142,138 @@ def test_diff_with_file_success(service, server):
     mock_other_ast.id = "project-root" # Same ID to allow diff
     
     with patch("src.server.services.query_service.load_ableton_xml"), \
-         patch("src.server.services.query_service.build_ast"), \
-         patch("src.server.services.query_service.ASTBuilder.build_node_tree", return_value=mock_other_ast), \
+         patch("src.server.services.query_service.ASTBuilder.build_from_xml", return_value=mock_other_ast), \
          patch("src.server.services.query_service.hash_tree"):
         
         changes = service.diff_with_file("other.als")
         assert isinstance(changes, list)
+
+def test_diff_with_file_matching_root_hash(service, server):
+    """
+    Test diff_with_file returns no changes when root hashes match.
+    """
+    mock_other_ast = ProjectNode()
+    mock_other_ast.id = "project-root"
+    mock_other_ast.hash = server.current_ast.hash
+    # Would show up as "added" if the diff walked into the children
+    mock_other_ast.add_child(TrackNode(name="Audio 1", index=0))
+
+    with patch("src.server.services.query_service.load_ableton_xml"), \
+         patch("src.server.services.query_service.ASTBuilder.build_from_xml", return_value=mock_other_ast), \
+         patch("src.server.services.query_service.hash_tree"):
+
+        assert service.diff_with_file("other.als") == []
+
+def test_index_reused_until_root_hash_changes(service, server):
+    """
+    Test lookups reuse the type/ID index until the AST changes.
+    """
+    track = TrackNode(name="Audio 1", index=0, id="track_0")
+    server.current_ast.add_child(track)
+
+    assert service.find_node_by_id("track_0")["id"] == "track_0"
+    by_type, by_id = service._get_index()
+    assert service._get_index()[0] is by_type
+
+    # Handlers rehash up to the root after every mutation
+    server.current_ast.add_child(TrackNode(name="Audio 2", index=1, id="track_1"))
+    server.current_ast.hash = "hash456"
+
+    assert len(service.find_nodes_by_type("track")) == 2
+    assert service.find_node_by_id("track_1") is not None
+
+def test_query_nodes_compound_predicate(service, server):
+    """
+    Test query_nodes with ordering and boolean operators.
+    """
+    for i, name in enumerate(["A", "B", "C"]):
+        server.current_ast.add_child(TrackNode(name=name, index=i))
+
+    result = service.query_nodes("index >= 1 and name != 'C'")
+    assert [r["attributes"]["name"] for r in result] == ["B"]
+
+    # Nodes without the attribute (the project root) don't match or raise
+    assert len(service.query_nodes("index < 5")) == 3
+    assert service.query_nodes("__import__('os')") == []
+
+def test_serialization_cached_by_hash(service, server):
+    """
+    Test nodes are serialized once per hash and the cache follows the AST.
+    """
+    track = TrackNode(name="Audio 1", index=0, id="track_0")
+    track.hash = "track-hash"
+    server.current_ast.add_child(track)
+
+    first = service.find_node_by_id("track_0")
+    assert service.find_nodes_by_type("track")[0] is first
+
+    # A rehashed node is serialized again
+    track.attributes["name"] = "Renamed"
+    track.hash = "renamed-hash"
+    assert service.find_node_by_id("track_0")["attributes"]["name"] == "Renamed"
+
+    # Loading another project drops the cache
+    server.current_ast = ProjectNode(id="other-root")
+    assert service.find_nodes_by_type("project")[0]["id"] == "other-root"
+    assert "track-hash" not in service.serializer._cache
+
+def test_serialization_cache_is_bounded(service, server):
+    """
+    Test stale serializations left by repeated edits do not pile up.
+    """
+    track = TrackNode(name="Audio 1", index=0, id="track_0")
+    server.current_ast.add_child(track)
+
+    with patch("src.ast.visitor._SERIALIZATION_CACHE_SIZE", 4):
+        for i in range(10):
+            track.hash = f"track-hash-{i}"
+            assert service.find_node_by_id("track_0")["hash"] == f"track-hash-{i}"
+            assert len(service.serializer._cache) <= 4
+
+
+def test_serialization_cache_evicts_least_recently_used():
+    """
+    Test a full cache evicts the least recently used serialization only.
+    """
+    visitor = SerializationVisitor(cache_by_hash=True)
+    nodes = [TrackNode(name=f"Audio {i}", index=i, id=f"track_{i}") for i in range(3)]
+    for i, node in enumerate(nodes):
+        node.hash = f"track-hash-{i}"
+
+    with patch("src.ast.visitor._SERIALIZATION_CACHE_SIZE", 2):
+        first = visitor.visit(nodes[0])
+        visitor.visit(nodes[1])
+        # Touch the first node so the second becomes least recently used
+        assert visitor.visit(nodes[0]) is first
+        visitor.visit(nodes[2])
+
+    assert list(visitor._cache) == ["track-hash-0", "track-hash-2"]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("include_parent_ref", [False, True])
+def test_to_json_without_orjson_matches_json_dumps(indent, include_parent_ref):
+    """
+    Test the stdlib JSON writer produces exactly what json.dumps gives for to_dict.
+    """
+    import json
+
+    root = ProjectNode()
+    root.id = "project-root"
+    track = TrackNode(name="Audio \"1\"\n", index=0, id="track_0")
+    track.attributes["color"] = {"rgb": [1, 2, 3], "nested": {"a": None}}
+    track.hash = "track-hash"
+    root.add_child(track)
+    root.add_child(TrackNode(name="Empty", index=1, id="track_1"))
+
+    class LoudVisitor(SerializationVisitor):
+        def visit_track(self, node):
+            result = self.generic_visit(node)
+            result["loud"] = True
+            return result
+
+    for visitor in (SerializationVisitor(include_parent_ref=include_parent_ref),
+                    LoudVisitor(include_parent_ref=include_parent_ref)):
+        with patch("src.ast.visitor.orjson", None):
+            text = visitor.to_json(root, indent=indent)
+        assert text == json.dumps(visitor.to_dict(root), indent=indent)
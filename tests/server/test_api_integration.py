@@ -114,12 +114,28 @@ async def test_process_live_event_prefix_routing(server):
     """
     server.current_ast = ProjectNode()
     server.transport_handler.handle_transport_event = AsyncMock(return_value={"type": "transport"})
-    
+    server._event_handlers = server._build_event_handler_registry()
+
     result = await server.process_live_event("/live/transport/play", [True], 1, 0.0)
     
-    server.transport_handler.handle_transport_event.assert_called_once()
+    server.transport_handler.handle_transport_event.assert_called_once_with("/live/transport/play", [True], 1)
     assert result["type"] == "transport"
 
+@pytest.mark.asyncio
+async def test_process_live_event_device_param_exact_route(server):
+    """
+    Test device param events are routed by exact match, not prefix checks.
+    """
+    server.current_ast = ProjectNode()
+    server.device_handler.handle_device_param = AsyncMock(return_value={"type": "device_param_changed"})
+    server._event_handlers = server._build_event_handler_registry()
+
+    assert "/live/device/param" in server._event_handlers
+    result = await server.process_live_event("/live/device/param", [0, 0, 1, 0.5], 1, 0.0)
+
+    server.device_handler.handle_device_param.assert_called_once_with([0, 0, 1, 0.5], 1)
+    assert result["type"] == "device_param_changed"
+
 @pytest.mark.asyncio
 async def test_process_live_event_unknown(server):
     """
@@ -154,3 +170,16 @@ async def test_process_live_event_exception_handling(server):
     args = server.websocket_server.broadcast_error.call_args[0]
     assert args[0] == "Event processing error"
     assert "Fail" in args[1]
+
+@pytest.mark.asyncio
+async def test_broadcast_diff(server):
+    """
+    Test broadcast_diff forwards to the WebSocket server only while it runs.
+    """
+    server.websocket_server.broadcast_diff = AsyncMock()
+    await server.broadcast_diff({"changes": []})
+    server.websocket_server.broadcast_diff.assert_called_once_with({"changes": []})
+
+    server.websocket_server.is_running.return_value = False
+    await server.broadcast_diff({"changes": []})
+    server.websocket_server.broadcast_diff.assert_called_once()
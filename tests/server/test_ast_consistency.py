@@ -1,11 +1,14 @@
 import pytest
 from src.server.handlers.track_handler import TrackEventHandler
 from src.server.api import ASTServer
-from src.ast import ProjectNode, TrackNode, hash_tree
+from src.server.ast_helpers import ASTBuilder, DiffGenerator, SceneIndexManager
+from src.ast import ProjectNode, TrackNode, DeviceNode, hash_tree, rehash_node
+from src.server.utils import ASTCache
 
 class MockServer:
     def __init__(self):
         self.current_ast = None
+        self.cache = ASTCache()
         self.websocket_server = None
 
 @pytest.fixture
@@ -70,3 +73,103 @@ async def test_hash_propagation_on_track_state_change(track_handler, server):
     
     assert track.attributes["is_muted"] is True
     assert project.hash != initial_project_hash
+
+def test_rehash_node_matches_full_rehash():
+    """
+    Test that rehashing a modified node and its ancestors gives the same
+    hashes as rehashing the whole tree.
+    """
+    project = ProjectNode(id="project-root")
+    tracks = []
+    for i in range(3):
+        track = TrackNode(name=f"Track {i}", index=i, id=f"track_{i}")
+        track.add_child(DeviceNode(name="EQ Eight", device_type="audio_effect", id=f"device_{i}_0"))
+        project.add_child(track)
+        tracks.append(track)
+    hash_tree(project)
+    other_track_hash = tracks[0].hash
+
+    device = tracks[1].children[0]
+    device.attributes["is_enabled"] = False
+    rehash_node(device)
+    incremental = (device.hash, tracks[1].hash, project.hash)
+
+    # Clear every hash so the whole tree is hashed from scratch
+    stack = [project]
+    while stack:
+        node = stack.pop()
+        node.hash = None
+        stack.extend(node.children)
+    hash_tree(project)
+
+    assert incremental == (device.hash, tracks[1].hash, project.hash)
+    assert tracks[0].hash == other_track_hash
+
+def test_same_project_builds_identical_tree():
+    """
+    Test that building the same project twice gives the same IDs and root hash.
+    """
+    raw_ast = {
+        "tracks": [{
+            "name": "Audio 1",
+            "index": 0,
+            "clip_slots": [{"scene_index": 0}, {"scene_index": 1}],
+        }],
+        "scenes": [{"name": "Intro", "index": 0}, {"name": "Verse", "index": 1}],
+    }
+
+    first = hash_tree(ASTBuilder.build_node_tree(raw_ast, None))
+    second = hash_tree(ASTBuilder.build_node_tree(raw_ast, None))
+
+    assert first.hash == second.hash
+    ids = [c.id for c in first.children[0].children] + [c.id for c in first.children[1:]]
+    assert len(set(ids)) == len(ids)
+
+def test_clip_slot_shift_emits_modified_changes():
+    """
+    Test that shifting clip slots updates them and reports each one as modified.
+    """
+    raw_ast = {
+        "tracks": [{
+            "name": "Audio 1",
+            "index": 0,
+            "clip_slots": [{"scene_index": 0}, {"scene_index": 1}],
+        }],
+        "scenes": [],
+    }
+    project = ASTBuilder.build_node_tree(raw_ast, None)
+    slots = project.children[0].children
+
+    changes = SceneIndexManager.shift_clip_slot_indices(project, 1, 1, seq_num=7)
+
+    assert [slot.attributes["scene_index"] for slot in slots] == [0, 2]
+    assert changes == [DiffGenerator.create_modified_change(
+        node_id=slots[1].id,
+        node_type="clip_slot",
+        path="tracks[0].clip_slots[1]",
+        old_value={"scene_index": 1},
+        new_value={"scene_index": 2},
+        seq_num=7,
+    )]
+
+def test_set_without_master_track_keeps_placeholder_master():
+    """
+    Test that a set with no <MasterTrack> still ends with the placeholder master.
+    """
+    import xml.etree.ElementTree as ET
+    from src.parser import build_ast
+
+    root = ET.fromstring(
+        '<Ableton><LiveSet><Tracks>'
+        '<AudioTrack Id="1"><Name><EffectiveName Value="A"/></Name></AudioTrack>'
+        '<MidiTrack Id="2"><Name><EffectiveName Value="B"/></Name></MidiTrack>'
+        '</Tracks><Scenes/></LiveSet></Ableton>'
+    )
+
+    tracks = build_ast(root)["tracks"]
+    assert [(t["name"], t["type"]) for t in tracks] == [("A", "track"), ("B", "track"), ("Main", "master")]
+
+    project = ASTBuilder.build_from_xml(root)
+    assert [(c.attributes["name"], c.attributes["index"]) for c in project.children] == [
+        ("A", 0), ("B", 1), ("Main", 2)
+    ]
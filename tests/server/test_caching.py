@@ -7,11 +7,15 @@ Verifies that:
 3. Cache statistics are tracked properly
 4. LRU eviction works when capacity is reached
 5. ASTNavigator uses cache when provided
+6. Parsed project trees are reused until the file changes
 """
 
+import os
 import pytest
+from unittest.mock import patch
+from src.parser import load_ableton_xml
 from src.server.api import ASTServer
-from src.server.utils import ASTCache
+from src.server.utils import ASTCache, ParsedASTCache
 from src.server.ast_helpers import ASTNavigator
 from src.ast import ProjectNode, TrackNode, SceneNode, NodeType
 
@@ -207,7 +211,8 @@ class TestASTNavigatorWithCache:
             SceneNode(name="Scene 1", index=1, id="scene_1"),
         ]
 
-        self.root.children = self.tracks + self.scenes
+        for child in self.tracks + self.scenes:
+            self.root.add_child(child)
 
     def test_find_track_by_index_with_cache(self):
         """Test find_track_by_index uses cache correctly."""
@@ -287,6 +292,23 @@ class TestASTNavigatorWithCache:
         scenes = ASTNavigator.get_scenes(self.root)
         assert len(scenes) == 2
 
+    def test_index_lookup_follows_structure_changes(self):
+        """Test index lookups stay correct when scenes are shifted or removed."""
+        cache = ASTCache()
+        assert ASTNavigator.find_scene_by_index(self.root, 1, cache=cache) is self.scenes[1]
+
+        # Insert a scene at index 1, shifting the old one to index 2
+        self.scenes[1].attributes['index'] = 2
+        new_scene = SceneNode(name="New", index=1, id="scene_new")
+        new_scene.parent = self.root
+        self.root.children.insert(4, new_scene)
+        assert ASTNavigator.find_scene_by_index(self.root, 1, cache=cache) is new_scene
+        assert ASTNavigator.find_scene_by_index(self.root, 2, cache=cache) is self.scenes[1]
+
+        # A removed node is not returned even though its index still matches
+        self.root.remove_child(new_scene)
+        assert ASTNavigator.find_scene_by_index(self.root, 1, cache=cache) is None
+
 
 class TestASTServerCaching:
     """Test caching integration in ASTServer."""
@@ -328,7 +350,7 @@ class TestASTServerCaching:
         root1 = ProjectNode(id="project_1")
         root1.hash = "hash_v1"
         track1 = TrackNode(name="Track 1", index=0, id="track_0")
-        root1.children = [track1]
+        root1.add_child(track1)
         server.current_ast = root1
 
         # Use cache
@@ -347,7 +369,7 @@ class TestASTServerCaching:
         root2 = ProjectNode(id="project_2")
         root2.hash = "hash_v2"
         track2 = TrackNode(name="Track 2", index=0, id="track_0_new")
-        root2.children = [track2]
+        root2.add_child(track2)
         server.current_ast = root2
 
         # Cache should invalidate - this will be a miss
@@ -357,5 +379,92 @@ class TestASTServerCaching:
         assert stats['statistics']['invalidations'] == 1
 
 
+    def test_load_project_resets_index_maps(self, tmp_path):
+        """Test that loading a project drops the cached nodes of the old tree."""
+        server = ASTServer(enable_websocket=False)
+        project = tmp_path / "project.xml"
+        project.write_text(
+            "<Ableton><LiveSet>"
+            "<Tracks><AudioTrack Id=\"1\"><Name><EffectiveName Value=\"A\"/></Name></AudioTrack></Tracks>"
+            "<Scenes><Scene Id=\"0\"><Name Value=\"S\"/></Scene></Scenes>"
+            "</LiveSet></Ableton>"
+        )
+
+        server.load_project(project, broadcast=False)
+        old_ast = server.current_ast
+        ASTNavigator.find_track_by_index(old_ast, 0, cache=server.cache)
+        assert server.cache._index_root is old_ast
+        assert ASTNavigator.get_tracks(old_ast, cache=server.cache)
+        assert ASTNavigator.get_scenes(old_ast, cache=server.cache)
+
+        # Reloading the unchanged file gives a new tree with the same root hash
+        server.load_project(project, broadcast=False)
+        new_ast = server.current_ast
+        assert new_ast is not old_ast
+        assert new_ast.hash == old_ast.hash
+        assert server.cache._index_root is None
+
+        tracks = ASTNavigator.get_tracks(new_ast, cache=server.cache)
+        scenes = ASTNavigator.get_scenes(new_ast, cache=server.cache)
+        assert [t.attributes["name"] for t in tracks] == ["A", "Main"]
+        assert len(scenes) == 1
+        assert all(node.parent is new_ast for node in tracks + scenes)
+
+
+class TestParsedASTCache:
+    """Test caching of parsed project trees."""
+
+    MINIMAL_XML = "<Ableton><LiveSet><Tracks/><Scenes/></LiveSet></Ableton>"
+
+    def test_key_changes_when_file_changes(self, tmp_path):
+        """Test that the key tracks mtime and size."""
+        path = tmp_path / "set.xml"
+        path.write_text(self.MINIMAL_XML)
+        key1 = ParsedASTCache.key_for(path)
+
+        path.write_text(self.MINIMAL_XML + " ")
+        os.utime(path, ns=(0, key1[1] + 1))
+        key2 = ParsedASTCache.key_for(path)
+
+        assert key1 != key2
+        assert ParsedASTCache.key_for(tmp_path / "missing.xml") is None
+
+    def test_lru_eviction_and_take(self):
+        """Test capacity-bounded eviction and take-on-hit."""
+        cache = ParsedASTCache(capacity=2)
+        cache.put(("a", 1, 1), "tree_a")
+        cache.put(("b", 1, 1), "tree_b")
+        assert cache.get(("a", 1, 1)) == "tree_a"
+
+        # "b" is now least recently used and gets evicted
+        cache.put(("c", 1, 1), "tree_c")
+        assert cache.get(("b", 1, 1)) is None
+        assert cache.stats.evictions == 1
+
+        assert cache.take(("a", 1, 1)) == "tree_a"
+        assert cache.get(("a", 1, 1)) is None
+
+    def test_diff_with_file_reuses_parse(self, tmp_path):
+        """Test that repeated diffs against an unchanged file parse once."""
+        path = tmp_path / "other.xml"
+        path.write_text(self.MINIMAL_XML)
+
+        server = ASTServer(enable_websocket=False)
+        server.load_project(path, broadcast=False)
+
+        with patch("src.server.services.query_service.load_ableton_xml",
+                   wraps=load_ableton_xml) as loader:
+            assert server.diff_with_file(path) == []
+            assert server.diff_with_file(path) == []
+            assert loader.call_count == 1
+
+        # Touching the file invalidates the entry
+        os.utime(path, ns=(0, ParsedASTCache.key_for(path)[1] + 1))
+        with patch("src.server.services.query_service.load_ableton_xml",
+                   wraps=load_ableton_xml) as loader:
+            server.diff_with_file(path)
+            assert loader.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -12,6 +12,7 @@ Verifies that:
 import pytest
 import time
 import asyncio
+from unittest.mock import AsyncMock
 from src.server.api import ASTServer
 from src.server.utils import MetricsCollector, MetricsExporter
 from src.ast import ProjectNode, TrackNode, SceneNode
@@ -359,6 +360,47 @@ class TestASTServerMetricsIntegration:
         counters = all_metrics['counters']
         assert any('events.unhandled' in key for key in counters.keys())
 
+    @pytest.mark.asyncio
+    async def test_processed_event_type_tags(self):
+        """Test processed events keep their event_type tags under exact-match routing."""
+        server = ASTServer(enable_websocket=False)
+        server.current_ast = ProjectNode(id="project_test")
+        server.device_handler.handle_device_param = AsyncMock(return_value={"type": "device_param"})
+        server.transport_handler.handle_transport_event = AsyncMock(return_value={"type": "transport"})
+        server.track_handler.handle_track_renamed = AsyncMock(return_value={"type": "track_renamed"})
+        server._event_handlers = server._build_event_handler_registry()
+        server.metrics.reset()
+
+        events = [
+            ("/live/device/param", [0, 0, 1, 0.5]),
+            ("/live/transport/play", [True]),
+            ("/live/transport/tempo", [120.0]),
+            ("/live/transport/position", [4.0]),
+            # Not in the registry, still routed by prefix
+            ("/live/transport/loop", [True]),
+            ("/live/track/renamed", [0, "Bass"]),
+        ]
+        for event_path, args in events:
+            await server.process_live_event(event_path, args, 1, time.time())
+
+        def processed(event_type):
+            counter = server.metrics.get_counter(
+                'events.processed.by_type', tags={'event_type': event_type}
+            )
+            return counter['value'] if counter else 0
+
+        assert processed('device_param') == 1
+        assert processed('transport') == 4
+        assert processed('/live/track/renamed') == 1
+        assert processed('/live/device/param') == 0
+        assert processed('/live/transport/play') == 0
+
+        # Received counters are tagged with the full path, as before
+        received = server.metrics.get_counter(
+            'events.received.by_type', tags={'event_type': '/live/transport/play'}
+        )
+        assert received['value'] == 1
+
 
 class TestMetricsPerformance:
     """Test that metrics don't significantly impact performance."""
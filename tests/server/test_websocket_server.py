@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.websocket.server import ASTWebSocketServer
+from src.ast import ProjectNode
+
+
+@pytest.fixture
+def ws_server():
+    server = ASTWebSocketServer(diff_batch_interval=0.01)
+    server.broadcaster.broadcast = AsyncMock()
+    return server
+
+
+def _diff(node_id, seq_num):
+    return {
+        'changes': [{'type': 'modified', 'node_id': node_id, 'seq_num': seq_num}],
+        'added': [],
+        'removed': [],
+        'modified': [node_id],
+    }
+
+
+@pytest.mark.asyncio
+async def test_diffs_in_one_interval_are_merged(ws_server):
+    """
+    Test a burst of diffs goes out as one DIFF_UPDATE with all changes in order.
+    """
+    await ws_server.broadcast_diff(_diff("track_0", 1))
+    await ws_server.broadcast_diff(_diff("track_1", 2))
+    await ws_server.broadcast_diff(_diff("track_0", 3))
+    ws_server.broadcaster.broadcast.assert_not_called()
+
+    await asyncio.sleep(0.05)
+
+    ws_server.broadcaster.broadcast.assert_called_once()
+    diff = ws_server.broadcaster.broadcast.call_args[0][0]['payload']['diff']
+    assert [c['seq_num'] for c in diff['changes']] == [1, 2, 3]
+    assert diff['modified'] == ["track_0", "track_1"]
+
+
+@pytest.mark.asyncio
+async def test_batching_disabled_broadcasts_immediately():
+    """
+    Test a zero batch interval sends every diff as its own message.
+    """
+    server = ASTWebSocketServer(diff_batch_interval=0)
+    server.broadcaster.broadcast = AsyncMock()
+
+    await server.broadcast_diff(_diff("track_0", 1))
+    await server.broadcast_diff(_diff("track_1", 2))
+
+    assert server.broadcaster.broadcast.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pending_diffs_keep_order_with_other_messages(ws_server):
+    """
+    Test errors and live events follow the diffs before them and a full AST supersedes pending diffs.
+    """
+    await ws_server.broadcast_diff(_diff("track_0", 1))
+    await ws_server.broadcast_error("Boom")
+
+    types = [c[0][0]['type'] for c in ws_server.broadcaster.broadcast.call_args_list]
+    assert types == ['DIFF_UPDATE', 'ERROR']
+
+    ws_server.broadcaster.broadcast.reset_mock()
+    await ws_server.broadcast_diff(_diff("track_0", 2))
+    await ws_server.broadcast_event({'type': 'live_event', 'payload': {}})
+
+    types = [c[0][0]['type'] for c in ws_server.broadcaster.broadcast.call_args_list]
+    assert types == ['DIFF_UPDATE', 'live_event']
+
+    ws_server.broadcaster.broadcast.reset_mock()
+    await ws_server.broadcast_diff(_diff("track_0", 2))
+    await ws_server.broadcast_full_ast(ProjectNode(id="project-root"))
+    await asyncio.sleep(0.05)
+
+    types = [c[0][0]['type'] for c in ws_server.broadcaster.broadcast.call_args_list]
+    assert types == ['FULL_AST']
+
+
+@pytest.mark.asyncio
+async def test_compression_disabled_by_default():
+    """
+    Test the server is started without permessage-deflate unless requested.
+    """
+    with patch("src.websocket.server.serve", new=AsyncMock()) as serve:
+        await ASTWebSocketServer().start()
+        await ASTWebSocketServer(compression="deflate").start()
+
+    assert serve.call_args_list[0].kwargs["compression"] is None
+    assert serve.call_args_list[1].kwargs["compression"] == "deflate"
@@ -0,0 +1,54 @@
+"""
+Tests for the lxml backend of the project file loader.
+
+lxml is optional; these tests are skipped when it is not installed.
+"""
+
+import gzip
+
+import pytest
+
+lxml_etree = pytest.importorskip("lxml.etree")
+
+from src.parser.xml_loader import load_ableton_xml
+
+
+def test_lxml_backend_parses_als(tmp_path):
+    """Test that compressed .als files are parsed with lxml."""
+    path = tmp_path / "project.als"
+    with gzip.open(path, "wb") as f:
+        f.write(b'<Ableton><LiveSet><Tracks/><Scenes/></LiveSet></Ableton>')
+
+    tree = load_ableton_xml(path)
+
+    assert isinstance(tree, lxml_etree._ElementTree)
+    assert tree.getroot().find("LiveSet") is not None
+
+
+def test_lxml_backend_does_not_resolve_external_entities(tmp_path):
+    """Test that a crafted file cannot pull in the content of local files."""
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret")
+    path = tmp_path / "project.xml"
+    path.write_text(
+        f'<!DOCTYPE Ableton [<!ENTITY leak SYSTEM "{secret.as_uri()}">]>'
+        '<Ableton><LiveSet>&leak;</LiveSet></Ableton>'
+    )
+
+    tree = load_ableton_xml(path)
+
+    assert "top secret" not in lxml_etree.tostring(tree).decode()
+
+
+
+def test_lxml_backend_does_not_expand_internal_entities(tmp_path):
+    """Test that entities are left unexpanded, so they cannot blow up in size."""
+    path = tmp_path / "project.xml"
+    path.write_text(
+        '<!DOCTYPE Ableton [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;">]>'
+        '<Ableton><LiveSet>&b;</LiveSet></Ableton>'
+    )
+
+    tree = load_ableton_xml(path)
+
+    assert "aaaaaaaaaa" not in lxml_etree.tostring(tree.getroot()).decode()
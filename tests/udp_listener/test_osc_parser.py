@@ -0,0 +1,37 @@
+import struct
+
+import pytest
+
+from src.udp_listener.osc_parser import parse_osc_message, parse_sequenced_message
+
+
+def _osc_string(s):
+    data = s.encode("utf-8") + b"\x00"
+    return data + b"\x00" * (-len(data) % 4)
+
+
+@pytest.mark.parametrize("value", [0, 1 << 40, -(1 << 62), (1 << 63) - 1])
+def test_parse_int64_argument(value):
+    """
+    Test an 'h' argument is read as a big-endian int64.
+    """
+    data = _osc_string("/test") + _osc_string(",hi") + struct.pack(">qi", value, 7)
+
+    msg = parse_osc_message(data)
+    assert msg.type_tags == "hi"
+    assert msg.arguments == [value, 7]
+
+
+def test_parse_sequenced_message_int64_timestamp():
+    """
+    Test the int64 monotonic-nanosecond timestamp of a sequenced message.
+    """
+    timestamp = 1_234_567_890_123_456
+    data = (
+        _osc_string("/live/seq") + _osc_string(",ihsif")
+        + struct.pack(">iq", 42, timestamp)
+        + _osc_string("/live/track/volume") + struct.pack(">if", 3, 0.5)
+    )
+
+    assert parse_sequenced_message(data) == (42, timestamp, "/live/track/volume", [3, 0.5])
+